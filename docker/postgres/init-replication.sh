@@ -0,0 +1,4 @@
+#!/bin/bash
+# primary 최초 초기화 시 복제 접속을 허용합니다 (POSTGRES_USER는 superuser라 REPLICATION 권한 보유).
+set -e
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"
@@ -0,0 +1,12 @@
+#!/bin/bash
+# 데이터 디렉터리가 비어 있으면 primary(db)에서 base backup을 받아 standby로 기동합니다.
+set -e
+if [ ! -s "$PGDATA/PG_VERSION" ]; then
+    until pg_isready -h db -U "$POSTGRES_USER"; do
+        sleep 1
+    done
+    PGPASSWORD="$POSTGRES_PASSWORD" pg_basebackup \
+        -h db -U "$POSTGRES_USER" -D "$PGDATA" -R -X stream -P
+    chmod 700 "$PGDATA"
+fi
+exec postgres
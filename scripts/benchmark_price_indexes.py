@@ -0,0 +1,116 @@
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import text
+
+from src.db.session import engine
+
+
+RANGE_QUERY = """
+SELECT date, open, high, low, close, volume
+FROM price
+WHERE stock_key = :stock_key AND date BETWEEN :start AND :end
+ORDER BY date
+"""
+
+CROSS_SECTION_QUERY = """
+SELECT stock_key, close, volume
+FROM price
+WHERE date = :day
+"""
+
+# "before"는 새 인덱스가 없던 때의 실행 경로를 planner 설정으로 재현합니다.
+#  - 기간 조회: index-only scan 금지 → 인덱스 스캔 후 행마다 힙 조회
+#  - 일자 조회: BRIN은 bitmap scan으로만 쓰이므로 bitmap scan 금지 → 순차 스캔
+CASES = [
+    ("range scan", RANGE_QUERY, "SET LOCAL enable_indexonlyscan = off"),
+    ("cross-section", CROSS_SECTION_QUERY, "SET LOCAL enable_bitmapscan = off"),
+]
+
+
+async def run_case(query: str, params: dict, setup: str, repeat: int):
+    """실행 계획을 출력하고 반복 실행 지연 시간(ms) 목록을 반환합니다."""
+    async with engine.connect() as conn:
+        async with conn.begin():
+            if setup:
+                await conn.execute(text(setup))
+            plan = await conn.execute(
+                text(f"EXPLAIN (ANALYZE, BUFFERS) {query}"), params
+            )
+            print("\n".join(f"    {row[0]}" for row in plan))
+
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                result = await conn.execute(text(query), params)
+                result.fetchall()
+                timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+async def benchmark(ticker: str, start: date, end: date, day: date, repeat: int):
+    async with engine.connect() as conn:
+        stock_key = await conn.scalar(
+            text("SELECT price_key FROM stocks WHERE ticker = :ticker"),
+            {"ticker": ticker},
+        )
+    if stock_key is None:
+        raise SystemExit(f"Unknown ticker: {ticker}")
+
+    # index-only scan은 visibility map에 의존하므로 먼저 VACUUM 합니다.
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM (ANALYZE) price"))
+
+    params = {
+        "range scan": {"stock_key": stock_key, "start": start, "end": end},
+        "cross-section": {"day": day},
+    }
+    for name, query, before_setup in CASES:
+        for label, setup in (("before", before_setup), ("after", "")):
+            print(f"[{name} / {label}]")
+            timings = await run_case(query, params[name], setup, repeat)
+            timings.sort()
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            print(
+                f"    median {statistics.median(timings):.2f} ms, "
+                f"p95 {p95:.2f} ms over {repeat} runs\n"
+            )
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare price query plans and latency with and without "
+        "the covering primary key and the BRIN date index"
+    )
+    parser.add_argument("--ticker", default="069500", help="Ticker for range scans")
+    parser.add_argument(
+        "--start",
+        type=date.fromisoformat,
+        default=date.today() - timedelta(days=365 * 5),
+        help="Range scan start date (YYYY-MM-DD)",
+    )
+    parser.add_argument(
+        "--end",
+        type=date.fromisoformat,
+        default=date.today(),
+        help="Range scan end date (YYYY-MM-DD)",
+    )
+    parser.add_argument(
+        "--day",
+        type=date.fromisoformat,
+        default=date.today() - timedelta(days=30),
+        help="Day for the cross-sectional query (YYYY-MM-DD)",
+    )
+    parser.add_argument("--repeat", type=int, default=50, help="Runs per case")
+
+    args = parser.parse_args()
+    asyncio.run(benchmark(args.ticker, args.start, args.end, args.day, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
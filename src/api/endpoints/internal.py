@@ -0,0 +1,48 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends
+
+from src.api.deps import get_current_active_superuser
+from src.db.price_cache import price_frame_cache
+from src.db.session import engine, read_engine, replica_monitor
+from src.models.user import User
+from src.services.price_sync_worker import price_sync_worker
+
+router = APIRouter()
+
+
+@router.get("/internal/db-pool")
+async def db_pool_stats(
+    current_user: User = Depends(get_current_active_superuser),
+) -> Any:
+    """
+    커넥션 풀 상태(checked-out, overflow)와 커넥션 대기 시간 히스토그램을 반환합니다.
+    """
+    stats = {"primary": engine.pool.status_dict()}
+    if read_engine is not None:
+        stats["replica"] = {
+            **read_engine.pool.status_dict(),
+            "available": replica_monitor.available,
+            "lag_seconds": replica_monitor.lag_seconds,
+        }
+    return stats
+
+
+@router.get("/internal/price-sync")
+async def price_sync_stats(
+    current_user: User = Depends(get_current_active_superuser),
+) -> Any:
+    """
+    가격 동기화 작업의 lock 보유 여부, 마지막 실행 시각과 종목별 상태를 반환합니다.
+    """
+    return price_sync_worker.stats()
+
+
+@router.get("/internal/price-cache")
+async def price_cache_stats(
+    current_user: User = Depends(get_current_active_superuser),
+) -> Any:
+    """
+    가격 DataFrame 프로세스 캐시의 적중/실패 횟수와 메모리 사용량을 반환합니다.
+    """
+    return price_frame_cache.stats()
@@ -36,7 +36,7 @@ def health_check(db: Session = Depends(get_db)):
     app_info = {
         "name": settings.PROJECT_NAME,
         "version": settings.VERSION,
-        "environment": "development",  # TODO: 환경 변수로 설정
+        "environment": settings.ENVIRONMENT,
         "timestamp": datetime.utcnow().isoformat(),
     }
 
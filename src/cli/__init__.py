@@ -1,6 +1,8 @@
 import typer
 
-from src.cli.commands import users_app
+from src.cli.commands import jobs_app, prices_app, users_app
 
 app = typer.Typer()
 app.add_typer(users_app, name="users", help="User management commands")
+app.add_typer(prices_app, name="prices", help="Price data management commands")
+app.add_typer(jobs_app, name="jobs", help="Ingestion job queue commands")
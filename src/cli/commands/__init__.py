@@ -1 +1,3 @@
+from src.cli.commands.jobs import app as jobs_app
+from src.cli.commands.prices import app as prices_app
 from src.cli.commands.users import app as users_app
@@ -0,0 +1,64 @@
+import asyncio
+import json
+from typing import List, Optional
+
+import typer
+
+from src.db.repositories.job import JobRepository
+from src.db.session import AsyncSessionLocal
+from src.services.job_worker import HANDLERS, JobWorker
+
+
+app = typer.Typer()
+
+
+@app.command()
+def enqueue(
+    kind: str = typer.Argument(..., help=f"Job kind ({', '.join(HANDLERS)})"),
+    payload: str = typer.Option("{}", help="Job payload as JSON"),
+    max_attempts: int = typer.Option(5, help="Maximum number of attempts"),
+):
+    """Add an ingestion job to the queue."""
+    if kind not in HANDLERS:
+        typer.echo(f"Error: unknown job kind '{kind}'.")
+        raise typer.Exit(1)
+
+    async def _enqueue():
+        async with AsyncSessionLocal() as db:
+            job = await JobRepository(db).enqueue(
+                kind, json.loads(payload), max_attempts=max_attempts
+            )
+            typer.echo(f"Enqueued job {job.id} ({job.kind})")
+
+    asyncio.run(_enqueue())
+
+
+@app.command()
+def worker(
+    kind: Optional[List[str]] = typer.Option(None, help="Only run these job kinds"),
+    concurrency: int = typer.Option(1, help="Jobs processed in parallel"),
+    poll_interval: float = typer.Option(5.0, help="Seconds between empty polls"),
+):
+    """Run a job worker. Start several processes or hosts to scale out."""
+    job_worker = JobWorker(
+        kinds=kind, concurrency=concurrency, poll_interval=poll_interval
+    )
+    typer.echo(f"Worker {job_worker.worker_id} started")
+    asyncio.run(job_worker.run())
+
+
+@app.command(name="list")
+def list_jobs(limit: int = typer.Option(20, help="Number of jobs to show")):
+    """Show the most recent jobs."""
+
+    async def _list():
+        async with AsyncSessionLocal() as db:
+            for job in await JobRepository(db).get_recent(limit):
+                checkpoint = json.dumps(job.checkpoint) if job.checkpoint else "-"
+                typer.echo(
+                    f"{job.id:>6} {job.kind:<14} {job.status:<8} "
+                    f"attempts={job.attempts}/{job.max_attempts} "
+                    f"checkpoint={checkpoint} {job.last_error or ''}"
+                )
+
+    asyncio.run(_list())
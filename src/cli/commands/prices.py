@@ -0,0 +1,168 @@
+import asyncio
+import time
+from datetime import date, datetime
+from typing import List, Optional
+
+import typer
+from sqlalchemy import or_, select
+
+from src.db.price_archive import get_price_archive
+from src.db.repositories.price import PriceRepository
+from src.db.repositories.stock import StockRepository
+from src.db.session import AsyncSessionLocal, read_session
+from src.db.unit_of_work import UnitOfWork
+from src.models.stock import Stock
+from src.services.market_data import get_market_data_provider
+from src.services.price_validation import validate_ohlcv
+
+
+app = typer.Typer()
+
+
+@app.command()
+def backfill(
+    start: str = typer.Option("2015-01-01", help="Start date (YYYY-MM-DD)"),
+    end: Optional[str] = typer.Option(
+        None, help="End date (YYYY-MM-DD), default today"
+    ),
+    prefix: List[str] = typer.Option(
+        ["KODEX", "TIGER"], help="Only backfill stocks whose name starts with this"
+    ),
+    batch_size: int = typer.Option(20, help="Number of tickers merged per COPY batch"),
+):
+    """Backfill daily price history through the binary COPY loader."""
+    start_date = datetime.strptime(start, "%Y-%m-%d")
+    end_date = datetime.strptime(end, "%Y-%m-%d") if end else datetime.now()
+
+    async def _backfill():
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Stock.id, Stock.price_key, Stock.ticker)
+                .where(
+                    Stock.is_active.is_(True),
+                    or_(*[Stock.name.startswith(p) for p in prefix]),
+                )
+                .order_by(Stock.ticker)
+            )
+            stocks = result.all()
+            if not stocks:
+                typer.echo("No stocks matched the given prefixes.")
+                return
+
+            price_repo = PriceRepository(db)
+            provider = get_market_data_provider()
+
+            async def fetch(ticker: str):
+                try:
+                    return await provider.get_prices(ticker, start_date, end_date)
+                except Exception as e:
+                    typer.echo(f"Skipping {ticker}: {e}")
+                    return None
+
+            total_rows = 0
+            quarantined = 0
+            load_seconds = 0.0
+            started = time.perf_counter()
+
+            for offset in range(0, len(stocks), batch_size):
+                batch = stocks[offset : offset + batch_size]
+                results = await asyncio.gather(
+                    *(fetch(ticker) for _, _, ticker in batch)
+                )
+                # 배치의 격리 행과 가격 병합을 한 트랜잭션으로 커밋합니다.
+                load_started = time.perf_counter()
+                async with UnitOfWork(db):
+                    frames = {}
+                    for (stock_id, stock_key, _), frame in zip(batch, results):
+                        if frame is None:
+                            continue
+                        validation = validate_ohlcv(frame)
+                        quarantined += await price_repo.quarantine(
+                            stock_id, validation.rejected
+                        )
+                        frames[stock_key] = validation.clean
+                    rows = await price_repo.copy_upsert(frames)
+                load_seconds += time.perf_counter() - load_started
+                total_rows += rows
+                typer.echo(
+                    f"[{min(offset + batch_size, len(stocks))}/{len(stocks)}] "
+                    f"merged {rows} rows"
+                )
+
+            elapsed = time.perf_counter() - started
+            typer.echo(
+                f"Loaded {total_rows} rows for {len(stocks)} tickers in {elapsed:.1f}s "
+                f"(DB: {total_rows / max(load_seconds, 1e-9):,.0f} rows/sec, "
+                f"end-to-end: {total_rows / max(elapsed, 1e-9):,.0f} rows/sec)"
+            )
+            if quarantined:
+                typer.echo(f"Quarantined {quarantined} rows that failed validation.")
+
+    asyncio.run(_backfill())
+
+
+@app.command()
+def export(
+    output: str = typer.Argument(..., help="Output CSV path"),
+    ticker: List[str] = typer.Option(..., help="Ticker to export (repeatable)"),
+    start: str = typer.Option("2000-01-01", help="Start date (YYYY-MM-DD)"),
+    end: Optional[str] = typer.Option(
+        None, help="End date (YYYY-MM-DD), default today"
+    ),
+    chunk_size: int = typer.Option(50000, help="Rows fetched per cursor round trip"),
+):
+    """Stream daily prices to CSV chunk by chunk through a server-side cursor."""
+    start_date = datetime.strptime(start, "%Y-%m-%d").date()
+    end_date = datetime.strptime(end, "%Y-%m-%d").date() if end else date.today()
+
+    async def _export():
+        async with read_session() as db:
+            price_keys = await StockRepository(db).get_price_keys(ticker)
+            missing = sorted(set(ticker) - set(price_keys))
+            if missing:
+                typer.echo(f"Unknown tickers skipped: {', '.join(missing)}")
+            tickers_by_key = {key: name for name, key in price_keys.items()}
+
+            rows = 0
+            with open(output, "w", newline="") as f:
+                async for chunk in PriceRepository(db).stream_range(
+                    list(tickers_by_key), start_date, end_date, chunk_size
+                ):
+                    chunk.insert(0, "Ticker", chunk.pop("StockKey").map(tickers_by_key))
+                    chunk.to_csv(f, header=(rows == 0))
+                    rows += len(chunk)
+            typer.echo(f"Exported {rows} rows to {output}")
+
+    asyncio.run(_export())
+
+
+@app.command()
+def archive(
+    before_year: int = typer.Option(
+        ..., help="Archive year partitions older than this year"
+    ),
+    drop: bool = typer.Option(
+        False, help="Drop each partition from Postgres after it is archived"
+    ),
+):
+    """Move old yearly price partitions into memory-mapped Arrow files."""
+    price_archive = get_price_archive()
+    if price_archive is None:
+        typer.echo("PRICE_ARCHIVE_DIR is not set")
+        raise typer.Exit(code=1)
+
+    async def _archive():
+        async with AsyncSessionLocal() as db:
+            repo = PriceRepository(db)
+            years = [
+                year for year in await repo.partition_years() if year < before_year
+            ]
+            if not years:
+                typer.echo(f"No partitions before {before_year}")
+                return
+            for year in years:
+                rows = await repo.archive_year(price_archive, year, drop_partition=drop)
+                action = "archived and dropped" if drop else "archived"
+                typer.echo(f"{year}: {rows} rows {action}")
+
+    asyncio.run(_archive())
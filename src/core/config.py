@@ -6,11 +6,32 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
 
 
+# 환경별 커넥션 풀 기본값 (DB_POOL_* 환경 변수로 개별 지정하면 그 값을 씁니다)
+DB_POOL_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "dev": {
+        "DB_POOL_SIZE": 5,
+        "DB_POOL_MAX_OVERFLOW": 5,
+        "DB_POOL_TIMEOUT": 30.0,
+        "DB_POOL_RECYCLE": 3600,
+        "DB_POOL_PRE_PING": False,
+    },
+    "prod": {
+        "DB_POOL_SIZE": 20,
+        "DB_POOL_MAX_OVERFLOW": 10,
+        "DB_POOL_TIMEOUT": 10.0,
+        "DB_POOL_RECYCLE": 1800,
+        "DB_POOL_PRE_PING": True,
+    },
+}
+
+
 class Settings(BaseSettings):
     # Project Info
     PROJECT_NAME: str
     VERSION: str
     API_V1_STR: str
+    # 실행 환경 (dev, staging, prod). staging은 prod 풀 기본값을 씁니다.
+    ENVIRONMENT: str = "dev"
 
     # Security
     SECRET_KEY: str
@@ -29,6 +50,52 @@ class Settings(BaseSettings):
     SQLALCHEMY_DATABASE_URI: Optional[str] = None
     DB_ECHO: bool = False
 
+    # Connection pool (비워 두면 ENVIRONMENT별 기본값)
+    DB_POOL_SIZE: Optional[int] = None
+    DB_POOL_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_TIMEOUT: Optional[float] = None
+    DB_POOL_RECYCLE: Optional[int] = None
+    DB_POOL_PRE_PING: Optional[bool] = None
+    # asyncpg 문장 캐시 크기 (PgBouncer transaction 모드 뒤에서는 0으로 설정)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+
+    # Read replica (비워 두면 모든 읽기를 primary로 보냄)
+    REPLICA_DATABASE_URI: Optional[str] = None
+    # 복제 지연이 이 값(초)을 넘으면 primary에서 읽습니다.
+    REPLICA_MAX_LAG_SECONDS: float = 30.0
+    # 복제본 상태 확인 결과를 재사용하는 시간(초)
+    REPLICA_HEALTH_CHECK_SECONDS: float = 10.0
+
+    # 오래된 가격 데이터를 옮겨 둔 Arrow 파일 디렉터리 (비워 두면 DB만 읽음)
+    PRICE_ARCHIVE_DIR: Optional[str] = None
+
+    # 종목별 가격 DataFrame 프로세스 캐시 메모리 상한(MB)과 최대 보관 시간(초)
+    PRICE_FRAME_CACHE_MAX_MB: int = 64
+    PRICE_FRAME_CACHE_TTL_SECONDS: float = 300.0
+
+    # Market data provider ("fdr" 또는 오프라인 테스트용 "fake")
+    MARKET_DATA_PROVIDER: str = "fdr"
+    MARKET_DATA_MAX_WORKERS: int = 8
+    MARKET_DATA_TIMEOUT_SECONDS: float = 30.0
+    # 응답 캐시 디렉터리 (비워 두면 캐시를 쓰지 않음)
+    MARKET_DATA_CACHE_DIR: Optional[str] = ".cache/market_data"
+    MARKET_DATA_CACHE_MAX_MB: int = 512
+    # 종목 메타데이터(yfinance info) 동시 수집 설정
+    MARKET_DATA_INFO_WORKERS: int = 8
+    MARKET_DATA_INFO_RATE_PER_SEC: float = 4.0
+    MARKET_DATA_INFO_MAX_RETRIES: int = 4
+
+    # Price data
+    # 수집 당일 봉은 장중 값일 수 있어 이 시간(분)이 지나면 다시 가져옵니다.
+    PRICE_PROVISIONAL_TTL_MINUTES: int = 15
+
+    # Background price sync
+    PRICE_SYNC_ENABLED: bool = True
+    PRICE_SYNC_INTERVAL_MINUTES: int = 60
+    PRICE_SYNC_CONCURRENCY: int = 4
+    PRICE_SYNC_LOOKBACK_DAYS: int = 365
+
     # Application
     APP_HOST: str
     APP_PORT: int
@@ -57,6 +124,10 @@ class Settings(BaseSettings):
         super().__init__(**kwargs)
         if not self.SQLALCHEMY_DATABASE_URI:
             self.SQLALCHEMY_DATABASE_URI = self.get_database_url
+        pool_defaults = DB_POOL_DEFAULTS["dev" if self.ENVIRONMENT == "dev" else "prod"]
+        for name, value in pool_defaults.items():
+            if getattr(self, name) is None:
+                setattr(self, name, value)
 
 
 settings = Settings()
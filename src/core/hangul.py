@@ -0,0 +1,27 @@
+# 한글 음절(가~힣)의 초성 19자 (호환용 자모)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+SYLLABLE_START = ord("가")
+SYLLABLE_END = ord("힣")
+# 초성 하나에 딸린 음절 수 (중성 21 x 종성 28)
+SYLLABLES_PER_CHOSEONG = 21 * 28
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절을 초성으로 바꾼 소문자 문자열을 반환합니다.
+
+    한글이 아닌 글자(영문, 숫자, 공백)는 그대로 두므로 "KODEX 삼성그룹"은
+    "kodex ㅅㅅㄱㄹ"이 되어 영문과 초성을 섞은 검색어로도 찾을 수 있습니다.
+    """
+    chars = []
+    for char in text.lower():
+        code = ord(char)
+        if SYLLABLE_START <= code <= SYLLABLE_END:
+            char = CHOSEONG[(code - SYLLABLE_START) // SYLLABLES_PER_CHOSEONG]
+        chars.append(char)
+    return "".join(chars)
+
+
+def has_choseong(text: str) -> bool:
+    """초성(자음 자모)이 하나라도 들어 있는 검색어인지 확인합니다."""
+    return any(char in CHOSEONG for char in text)
@@ -0,0 +1,55 @@
+"""add price coverage table
+
+Revision ID: add_price_coverage_table
+Revises: cc3aa3555aea
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "add_price_coverage_table"
+down_revision: Union[str, None] = "cc3aa3555aea"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. 종목별 수집 완료 구간 테이블 생성
+    # 기존 price 데이터는 중간에 빈 구간이 있을 수 있으므로 커버리지를 채우지 않습니다.
+    # 첫 조회 시 빠진 구간만 한 번 다시 가져오며, upsert이므로 중복 저장되지 않습니다.
+    op.create_table(
+        "price_coverage",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("stock_id", postgresql.UUID(), nullable=False),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("end_date", sa.Date(), nullable=False),
+        sa.Column("fetched_at", sa.DateTime(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["stock_id"], ["stocks.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # 2. 인덱스 생성
+    op.create_index(
+        op.f("ix_price_coverage_id"), "price_coverage", ["id"], unique=False
+    )
+    op.create_index(
+        "ix_price_coverage_stock_start",
+        "price_coverage",
+        ["stock_id", "start_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_price_coverage_stock_start", table_name="price_coverage")
+    op.drop_index(op.f("ix_price_coverage_id"), table_name="price_coverage")
+    op.drop_table("price_coverage")
@@ -0,0 +1,45 @@
+"""add covering and brin indexes to price
+
+Revision ID: add_price_covering_indexes
+Revises: compact_price_table
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "add_price_covering_indexes"
+down_revision: Union[str, None] = "compact_price_table"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. 기본 키 인덱스를 OHLCV를 포함하는 커버링 인덱스로 교체
+    #    (종목/기간 조회가 힙을 읽지 않는 index-only scan이 됩니다)
+    op.drop_constraint("price_pkey", "price", type_="primary")
+    op.execute(
+        """
+        ALTER TABLE price ADD CONSTRAINT price_pkey
+        PRIMARY KEY (stock_key, date) INCLUDE (open, high, low, close, volume)
+        """
+    )
+
+    # 2. 특정 일자 전 종목 조회용 BRIN 인덱스
+    op.create_index(
+        "ix_price_date_brin",
+        "price",
+        ["date"],
+        unique=False,
+        postgresql_using="brin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_price_date_brin", table_name="price")
+    op.drop_constraint("price_pkey", "price", type_="primary")
+    op.create_primary_key("price_pkey", "price", ["stock_key", "date"])
@@ -0,0 +1,58 @@
+"""add price quarantine table
+
+Revision ID: add_price_quarantine_table
+Revises: add_jobs_table
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "add_price_quarantine_table"
+down_revision: Union[str, None] = "add_jobs_table"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. 검증 실패 가격 데이터 격리 테이블 생성
+    op.create_table(
+        "price_quarantine",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("stock_id", postgresql.UUID(), nullable=False),
+        sa.Column("date", sa.DateTime(), nullable=False),
+        sa.Column("open", sa.Float(), nullable=True),
+        sa.Column("high", sa.Float(), nullable=True),
+        sa.Column("low", sa.Float(), nullable=True),
+        sa.Column("close", sa.Float(), nullable=True),
+        sa.Column("volume", sa.Float(), nullable=True),
+        sa.Column("reasons", sa.Integer(), nullable=False),
+        sa.Column("reason", sa.String(length=200), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["stock_id"], ["stocks.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # 2. 인덱스 생성
+    op.create_index(
+        op.f("ix_price_quarantine_id"), "price_quarantine", ["id"], unique=False
+    )
+    op.create_index(
+        "ix_price_quarantine_stock_date",
+        "price_quarantine",
+        ["stock_id", "date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_price_quarantine_stock_date", table_name="price_quarantine")
+    op.drop_index(op.f("ix_price_quarantine_id"), table_name="price_quarantine")
+    op.drop_table("price_quarantine")
@@ -0,0 +1,74 @@
+"""add trigram and choseong search indexes to stocks
+
+Revision ID: add_stock_search_indexes
+Revises: add_stock_stats_table
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "add_stock_search_indexes"
+down_revision: Union[str, None] = "add_stock_stats_table"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# src.core.hangul.to_choseong과 같은 규칙 (한글 음절은 초성으로, 나머지는 소문자로)
+BACKFILL_CHOSEONG_SQL = """
+UPDATE stocks s SET name_choseong = (
+    SELECT string_agg(
+        CASE WHEN ascii(t.c) BETWEEN 44032 AND 55203
+            THEN substr(
+                'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ', (ascii(t.c) - 44032) / 588 + 1, 1
+            )
+            ELSE t.c
+        END,
+        '' ORDER BY t.i
+    )
+    FROM regexp_split_to_table(lower(s.name), '') WITH ORDINALITY AS t(c, i)
+)
+"""
+
+TRGM_INDEXES = {
+    "ix_stocks_name_trgm": "name",
+    "ix_stocks_ticker_trgm": "ticker",
+    "ix_stocks_name_choseong_trgm": "name_choseong",
+}
+
+
+def upgrade() -> None:
+    # 1. pg_trgm 확장 설치
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # 2. 초성 검색용 컬럼 추가
+    op.add_column(
+        "stocks", sa.Column("name_choseong", sa.String(length=100), nullable=True)
+    )
+
+    # 3. 기존 종목의 초성 채우기
+    op.execute(BACKFILL_CHOSEONG_SQL)
+
+    # 4. trigram GIN 인덱스 생성
+    for index_name, column in TRGM_INDEXES.items():
+        op.create_index(
+            index_name,
+            "stocks",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    # 1. 인덱스 삭제
+    for index_name in TRGM_INDEXES:
+        op.drop_index(index_name, table_name="stocks")
+
+    # 2. 컬럼 삭제 (다른 곳에서 쓸 수 있으므로 pg_trgm 확장은 남겨 둡니다)
+    op.drop_column("stocks", "name_choseong")
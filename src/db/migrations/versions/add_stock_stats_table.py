@@ -0,0 +1,68 @@
+"""add stock stats table
+
+Revision ID: add_stock_stats_table
+Revises: add_price_covering_indexes
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "add_stock_stats_table"
+down_revision: Union[str, None] = "add_price_covering_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. 종목별 가격 요약 테이블 생성
+    op.create_table(
+        "stock_stats",
+        sa.Column("stock_key", sa.Integer(), nullable=False),
+        sa.Column("first_date", sa.Date(), nullable=False),
+        sa.Column("last_date", sa.Date(), nullable=False),
+        sa.Column("bar_count", sa.BigInteger(), nullable=False),
+        sa.Column("last_close", sa.Float(), nullable=False),
+        sa.Column("last_volume", sa.BigInteger(), nullable=False),
+        sa.Column("high_52w", sa.Float(), nullable=True),
+        sa.Column("low_52w", sa.Float(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["stock_key"], ["stocks.price_key"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("stock_key"),
+    )
+
+    # 2. 기존 가격 데이터로 요약 채우기
+    op.execute(
+        """
+        WITH agg AS (
+            SELECT stock_key, min(date) AS first_date, max(date) AS last_date,
+                   count(*) AS bar_count
+            FROM price
+            GROUP BY stock_key
+        )
+        INSERT INTO stock_stats (
+            stock_key, first_date, last_date, bar_count, last_close, last_volume,
+            high_52w, low_52w, updated_at
+        )
+        SELECT a.stock_key, a.first_date, a.last_date, a.bar_count, l.close,
+               l.volume, w.high_52w, w.low_52w, timezone('utc', now())
+        FROM agg a
+        JOIN price l ON l.stock_key = a.stock_key AND l.date = a.last_date
+        CROSS JOIN LATERAL (
+            SELECT max(p.high) AS high_52w, min(p.low) AS low_52w
+            FROM price p
+            WHERE p.stock_key = a.stock_key AND p.date > a.last_date - 364
+        ) w
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("stock_stats")
@@ -0,0 +1,198 @@
+"""compact price row layout
+
+Revision ID: compact_price_table
+Revises: partition_price_table
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "compact_price_table"
+down_revision: Union[str, None] = "partition_price_table"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 마이그레이션 시점에 미리 만들어 둘 미래 연도 파티션 수
+PARTITION_YEARS_AHEAD = 2
+
+# 복사하는 동안 기존 테이블에 들어오는 쓰기(삭제 포함)를 새 테이블에 그대로 반영합니다.
+CREATE_MIRROR_TRIGGER = """
+CREATE OR REPLACE FUNCTION price_mirror_to_compact() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM price_compact c
+        USING stocks s
+        WHERE s.id = OLD.stock_id
+            AND c.stock_key = s.price_key
+            AND c.date = OLD.date::date;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO price_compact
+        SELECT s.price_key, NEW.date::date, NEW.open, NEW.high, NEW.low, NEW.close,
+            NEW.volume
+        FROM stocks s
+        WHERE s.id = NEW.stock_id
+        ON CONFLICT (stock_key, date) DO UPDATE SET
+            open = EXCLUDED.open,
+            high = EXCLUDED.high,
+            low = EXCLUDED.low,
+            close = EXCLUDED.close,
+            volume = EXCLUDED.volume;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER price_mirror_to_compact
+AFTER INSERT OR UPDATE OR DELETE ON price
+FOR EACH ROW EXECUTE FUNCTION price_mirror_to_compact()
+"""
+
+
+def _year_range(bind) -> range:
+    today = date.today()
+    min_date, max_date = bind.execute(
+        sa.text("SELECT min(date), max(date) FROM price")
+    ).one()
+    from_year = min_date.year if min_date else today.year
+    to_year = max(max_date.year if max_date else today.year, today.year)
+    return range(from_year, to_year + PARTITION_YEARS_AHEAD + 1)
+
+
+def _create_partitions(table: str, years: range) -> None:
+    for year in years:
+        op.execute(
+            f"CREATE TABLE {table}_y{year} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+        )
+
+
+def _swap(old_table: str, new_table: str, years: range) -> None:
+    """old_table을 지우고 new_table과 그 파티션을 price 이름으로 바꿉니다."""
+    op.drop_table(old_table)
+    op.rename_table(new_table, "price")
+    op.execute(f"ALTER TABLE price RENAME CONSTRAINT {new_table}_pkey TO price_pkey")
+    for year in years:
+        op.execute(f"ALTER TABLE {new_table}_y{year} RENAME TO price_y{year}")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    years = _year_range(bind)
+
+    # 1. stocks에 price 테이블 전용 정수 대리 키 추가 (기존 행은 자동으로 채워집니다)
+    op.add_column(
+        "stocks",
+        sa.Column("price_key", sa.Integer(), sa.Identity(), nullable=False),
+    )
+    op.create_unique_constraint("stocks_price_key_key", "stocks", ["price_key"])
+
+    # 2. 압축된 레이아웃의 파티션 테이블 생성
+    #    (int4 + date가 8바이트 정렬을 채우므로 패딩 없이 float8, int8이 이어집니다)
+    op.execute(
+        """
+        CREATE TABLE price_compact (
+            stock_key integer NOT NULL
+                CONSTRAINT price_stock_key_fkey
+                REFERENCES stocks (price_key) ON DELETE CASCADE,
+            date date NOT NULL,
+            open double precision NOT NULL,
+            high double precision NOT NULL,
+            low double precision NOT NULL,
+            close double precision NOT NULL,
+            volume bigint NOT NULL,
+            CONSTRAINT price_compact_pkey PRIMARY KEY (stock_key, date)
+        ) PARTITION BY RANGE (date)
+        """
+    )
+    _create_partitions("price_compact", years)
+
+    # 3. 복사 중 쓰기를 새 테이블에도 반영하는 트리거 생성
+    op.execute(CREATE_MIRROR_TRIGGER)
+
+    # 4. 연도별로 나눠 복사 (배치마다 커밋, 트리거가 먼저 반영한 행은 건너뜁니다)
+    with op.get_context().autocommit_block():
+        for year in years:
+            bind.execute(
+                sa.text(
+                    """
+                    INSERT INTO price_compact
+                    SELECT
+                        s.price_key, p.date::date,
+                        p.open, p.high, p.low, p.close, p.volume
+                    FROM price p
+                    JOIN stocks s ON s.id = p.stock_id
+                    WHERE p.date >= :low AND p.date < :high
+                    ON CONFLICT (stock_key, date) DO NOTHING
+                    """
+                ),
+                {"low": date(year, 1, 1), "high": date(year + 1, 1, 1)},
+            )
+
+    # 5. 짧은 배타 잠금 안에서 트리거 삭제 후 테이블 교체
+    #    (create_price_partitions 함수는 이름으로 참조하므로 그대로 씁니다)
+    op.execute("LOCK TABLE price IN ACCESS EXCLUSIVE MODE")
+    op.execute("DROP TRIGGER price_mirror_to_compact ON price")
+    op.execute("DROP FUNCTION price_mirror_to_compact()")
+    _swap("price", "price_compact", years)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    years = _year_range(bind)
+
+    # 1. 기존 레이아웃의 파티션 테이블 생성
+    op.execute(
+        """
+        CREATE TABLE price_wide (
+            id serial NOT NULL,
+            date timestamp without time zone NOT NULL,
+            open double precision NOT NULL,
+            high double precision NOT NULL,
+            low double precision NOT NULL,
+            close double precision NOT NULL,
+            volume integer NOT NULL,
+            created_at timestamp without time zone NOT NULL,
+            updated_at timestamp without time zone NOT NULL,
+            stock_id uuid NOT NULL
+                CONSTRAINT price_stock_id_fkey
+                REFERENCES stocks (id) ON DELETE CASCADE,
+            CONSTRAINT price_wide_pkey PRIMARY KEY (id, date)
+        ) PARTITION BY RANGE (date)
+        """
+    )
+    _create_partitions("price_wide", years)
+
+    # 2. 데이터 복사 (int4 범위를 넘는 거래량은 잘라냅니다)
+    op.execute(
+        """
+        INSERT INTO price_wide (
+            date, open, high, low, close, volume, created_at, updated_at, stock_id
+        )
+        SELECT
+            p.date, p.open, p.high, p.low, p.close,
+            LEAST(p.volume, 2147483647)::integer,
+            timezone('utc', now()), timezone('utc', now()), s.id
+        FROM price p
+        JOIN stocks s ON s.price_key = p.stock_key
+        """
+    )
+
+    # 3. 테이블 교체
+    op.execute("ALTER SEQUENCE price_wide_id_seq RENAME TO price_id_seq")
+    _swap("price", "price_wide", years)
+
+    # 4. 인덱스 재생성
+    op.create_index("ix_price_id", "price", ["id"], unique=False)
+    op.create_index("ix_price_stock_date", "price", ["stock_id", "date"], unique=True)
+
+    # 5. stocks 대리 키 삭제
+    op.drop_constraint("stocks_price_key_key", "stocks", type_="unique")
+    op.drop_column("stocks", "price_key")
@@ -0,0 +1,181 @@
+"""partition price table by year
+
+Revision ID: partition_price_table
+Revises: add_price_quarantine_table
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "partition_price_table"
+down_revision: Union[str, None] = "add_price_quarantine_table"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 한 번에 복사할 행 수 (id 범위 기준)
+COPY_BATCH_SIZE = 50000
+
+# 마이그레이션 시점에 미리 만들어 둘 미래 연도 파티션 수
+PARTITION_YEARS_AHEAD = 2
+
+CREATE_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_price_partitions(from_year integer, to_year integer)
+RETURNS void AS $$
+DECLARE
+    year integer;
+BEGIN
+    FOR year IN from_year..to_year LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF price '
+            'FOR VALUES FROM (%L) TO (%L)',
+            'price_y' || year, make_date(year, 1, 1), make_date(year + 1, 1, 1)
+        );
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# 복사 중에 들어오는 쓰기를 새 테이블에도 반영합니다.
+CREATE_MIRROR_TRIGGER = """
+CREATE OR REPLACE FUNCTION price_mirror_to_partitioned() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM price_partitioned
+        WHERE stock_id = OLD.stock_id AND date = OLD.date;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO price_partitioned SELECT NEW.*
+        ON CONFLICT (stock_id, date) DO UPDATE SET
+            open = EXCLUDED.open,
+            high = EXCLUDED.high,
+            low = EXCLUDED.low,
+            close = EXCLUDED.close,
+            volume = EXCLUDED.volume,
+            updated_at = EXCLUDED.updated_at;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER price_mirror_to_partitioned
+AFTER INSERT OR UPDATE OR DELETE ON price
+FOR EACH ROW EXECUTE FUNCTION price_mirror_to_partitioned()
+"""
+
+
+def _year_range(bind) -> range:
+    today = date.today()
+    min_date, max_date = bind.execute(
+        sa.text("SELECT min(date), max(date) FROM price")
+    ).one()
+    from_year = min_date.year if min_date else today.year
+    to_year = max(max_date.year if max_date else today.year, today.year)
+    return range(from_year, to_year + PARTITION_YEARS_AHEAD + 1)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    # 1. 연도별 범위 파티션 테이블 생성 (PK에는 파티션 키가 포함되어야 합니다)
+    op.execute(
+        """
+        CREATE TABLE price_partitioned (
+            LIKE price INCLUDING DEFAULTS,
+            CONSTRAINT price_partitioned_pkey PRIMARY KEY (id, date)
+        ) PARTITION BY RANGE (date)
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_price_partitioned_stock_date "
+        "ON price_partitioned (stock_id, date)"
+    )
+    op.execute("CREATE INDEX ix_price_partitioned_id ON price_partitioned (id)")
+
+    # 2. 기존 데이터 구간 + 미래 연도 파티션 생성
+    for year in _year_range(bind):
+        op.execute(
+            f"CREATE TABLE price_y{year} PARTITION OF price_partitioned "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+        )
+
+    # 3. 복사 중 발생하는 쓰기를 새 테이블로 전달하는 트리거 생성
+    op.execute(CREATE_MIRROR_TRIGGER)
+
+    # 4. id 범위별로 나눠 복사 (배치마다 커밋해 잠금과 WAL 부담을 나눕니다)
+    min_id, max_id = bind.execute(sa.text("SELECT min(id), max(id) FROM price")).one()
+    if min_id is not None:
+        with op.get_context().autocommit_block():
+            for offset in range(min_id, max_id + 1, COPY_BATCH_SIZE):
+                bind.execute(
+                    sa.text(
+                        """
+                        INSERT INTO price_partitioned
+                        SELECT * FROM price
+                        WHERE id >= :low AND id < :high
+                        ON CONFLICT (stock_id, date) DO NOTHING
+                        """
+                    ),
+                    {"low": offset, "high": offset + COPY_BATCH_SIZE},
+                )
+
+    # 5. 짧은 배타 잠금 안에서 테이블 교체
+    op.execute("LOCK TABLE price IN ACCESS EXCLUSIVE MODE")
+    op.execute("DROP TRIGGER price_mirror_to_partitioned ON price")
+    op.execute("DROP FUNCTION price_mirror_to_partitioned()")
+    op.execute("ALTER SEQUENCE price_id_seq OWNED BY price_partitioned.id")
+    op.drop_table("price")
+    op.rename_table("price_partitioned", "price")
+    op.execute(
+        "ALTER TABLE price RENAME CONSTRAINT price_partitioned_pkey TO price_pkey"
+    )
+    op.execute(
+        "ALTER INDEX ix_price_partitioned_stock_date RENAME TO ix_price_stock_date"
+    )
+    op.execute("ALTER INDEX ix_price_partitioned_id RENAME TO ix_price_id")
+
+    # 6. 외래 키 재생성
+    op.create_foreign_key(
+        "price_stock_id_fkey",
+        "price",
+        "stocks",
+        ["stock_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+    # 7. 미래 파티션 생성 함수 (애플리케이션 시작 시와 쓰기 전에 호출합니다)
+    op.execute(CREATE_PARTITIONS_FUNCTION)
+
+
+def downgrade() -> None:
+    # 1. 일반 테이블 생성
+    op.execute("DROP FUNCTION IF EXISTS create_price_partitions(integer, integer)")
+    op.execute("CREATE TABLE price_heap (LIKE price INCLUDING DEFAULTS)")
+
+    # 2. 데이터 복사
+    op.execute("INSERT INTO price_heap SELECT * FROM price")
+
+    # 3. 테이블 교체
+    op.execute("ALTER SEQUENCE price_id_seq OWNED BY price_heap.id")
+    op.drop_table("price")
+    op.rename_table("price_heap", "price")
+
+    # 4. 제약 조건과 인덱스 재생성
+    op.create_primary_key("price_pkey", "price", ["id"])
+    op.create_index("ix_price_id", "price", ["id"], unique=False)
+    op.create_index("ix_price_stock_date", "price", ["stock_id", "date"], unique=True)
+    op.create_foreign_key(
+        "price_stock_id_fkey",
+        "price",
+        "stocks",
+        ["stock_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
@@ -0,0 +1,86 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List
+
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+# 커넥션 대기 시간 히스토그램 구간 상한 (ms), 마지막 구간은 그 이상
+WAIT_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000]
+
+
+class PoolStats:
+    """커넥션 풀 대기 시간 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.buckets: List[int] = [0] * (len(WAIT_BUCKETS_MS) + 1)
+            self.checkouts = 0
+            self.timeouts = 0
+            self.total_wait_ms = 0.0
+            self.max_wait_ms = 0.0
+
+    def record_wait(self, wait_ms: float) -> None:
+        with self._lock:
+            self.buckets[bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+            self.checkouts += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            labels = [f"<={bound}ms" for bound in WAIT_BUCKETS_MS]
+            labels.append(f">{WAIT_BUCKETS_MS[-1]}ms")
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": (
+                    self.total_wait_ms / self.checkouts if self.checkouts else 0.0
+                ),
+                "max_wait_ms": self.max_wait_ms,
+                "wait_histogram": dict(zip(labels, self.buckets)),
+            }
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """커넥션을 얻기까지 기다린 시간을 PoolStats에 기록하는 풀"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except TimeoutError:
+            self.stats.record_timeout()
+            raise
+        self.stats.record_wait((time.perf_counter() - started) * 1000)
+        return connection
+
+    def recreate(self):
+        # dispose()/재생성 후에도 같은 통계를 이어서 씁니다.
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+    def status_dict(self) -> Dict[str, Any]:
+        """현재 풀 상태와 누적 대기 시간 통계를 반환합니다."""
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": self.overflow(),
+            **self.stats.snapshot(),
+        }
@@ -0,0 +1,163 @@
+import os
+import threading
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from src.core.config import settings
+
+ARCHIVE_COLUMNS = ["stock_key", "date", "open", "high", "low", "close", "volume"]
+
+# 1970-01-01과 2000-01-01(PostgreSQL 기준일) 사이의 일수
+PG_EPOCH_OFFSET_DAYS = 10957
+
+
+class PriceArchive:
+    """오래된 일봉을 연도별 Arrow IPC 파일로 보관하는 콜드 저장소
+
+    파일(`price_YYYY.arrow`)은 (stock_key, date) 순으로 정렬된 단일 배치이며 압축하지
+    않으므로, memory map으로 열면 컬럼을 복사 없이 NumPy 배열로 볼 수 있습니다.
+    종목 구간은 정렬된 stock_key 컬럼에서 이진 탐색으로 찾습니다.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # year -> (파일 mtime, 컬럼 배열)
+        self._years: Dict[int, Tuple[float, Dict[str, np.ndarray]]] = {}
+
+    def _path(self, year: int) -> Path:
+        return self.root / f"price_{year}.arrow"
+
+    def years(self) -> List[int]:
+        """보관된 연도 목록"""
+        return sorted(int(path.stem[len("price_") :]) for path in self._files())
+
+    def _files(self):
+        return self.root.glob("price_*.arrow")
+
+    def overlapping_years(self, start: date, end: date) -> List[int]:
+        return [year for year in self.years() if start.year <= year <= end.year]
+
+    def write_year(self, year: int, columns: Dict[str, np.ndarray]) -> int:
+        """한 해의 가격 데이터를 파일로 씁니다. columns는 (stock_key, date) 순 정렬 상태여야 합니다.
+
+        date는 datetime64[D] 배열입니다. 임시 파일에 쓴 뒤 교체하므로 읽는 쪽은
+        항상 완성된 파일만 봅니다.
+        """
+        table = pa.table(
+            {
+                "stock_key": pa.array(columns["stock_key"], type=pa.int32()),
+                "date": pa.array(columns["date"], type=pa.date32()),
+                "open": pa.array(columns["open"], type=pa.float64()),
+                "high": pa.array(columns["high"], type=pa.float64()),
+                "low": pa.array(columns["low"], type=pa.float64()),
+                "close": pa.array(columns["close"], type=pa.float64()),
+                "volume": pa.array(columns["volume"], type=pa.int64()),
+            }
+        )
+        path = self._path(year)
+        tmp_path = path.with_suffix(".tmp")
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table, max_chunksize=max(table.num_rows, 1))
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._years.pop(year, None)
+        return table.num_rows
+
+    def _arrays(self, year: int) -> Dict[str, np.ndarray]:
+        """연도 파일을 memory map으로 열어 컬럼별 NumPy 뷰를 반환합니다 (복사 없음)."""
+        path = self._path(year)
+        mtime = path.stat().st_mtime
+        with self._lock:
+            cached = self._years.get(year)
+            if cached and cached[0] == mtime:
+                return cached[1]
+
+        table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+        arrays = {}
+        for name in ARCHIVE_COLUMNS:
+            column = table.column(name)
+            chunk = column.chunk(0) if column.num_chunks else pa.array([], column.type)
+            if name == "date":
+                # date32는 1970-01-01 기준 int32 일수와 같은 메모리 표현입니다.
+                chunk = chunk.view(pa.int32())
+            arrays[name] = chunk.to_numpy(zero_copy_only=True)
+        with self._lock:
+            self._years[year] = (mtime, arrays)
+        return arrays
+
+    def read_frame(self, stock_key: int, start: date, end: date) -> pd.DataFrame:
+        """한 종목의 보관 구간을 get_frame과 같은 형식(Date 인덱스, OHLCV)으로 읽습니다."""
+        low, high = _epoch_days(start), _epoch_days(end)
+        parts = []
+        for year in self.overlapping_years(start, end):
+            arrays = self._arrays(year)
+            keys = arrays["stock_key"]
+            first = np.searchsorted(keys, stock_key, side="left")
+            last = np.searchsorted(keys, stock_key, side="right")
+            days = arrays["date"][first:last]
+            lo = first + np.searchsorted(days, low, side="left")
+            hi = first + np.searchsorted(days, high, side="right")
+            parts.append({name: arrays[name][lo:hi] for name in ARCHIVE_COLUMNS})
+        return _frame_from_parts(parts)
+
+    def read_rows(
+        self, stock_keys: Sequence[int], start: date, end: date, field: str
+    ) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """여러 종목의 한 필드를 (stock_key, PostgreSQL 기준 일수, 값) 배열로 읽습니다."""
+        low, high = _epoch_days(start), _epoch_days(end)
+        keys = np.asarray(stock_keys)
+        rows = []
+        for year in self.overlapping_years(start, end):
+            arrays = self._arrays(year)
+            mask = np.isin(arrays["stock_key"], keys)
+            mask &= (arrays["date"] >= low) & (arrays["date"] <= high)
+            rows.append(
+                (
+                    arrays["stock_key"][mask],
+                    arrays["date"][mask] - PG_EPOCH_OFFSET_DAYS,
+                    arrays[field][mask].astype(np.float64),
+                )
+            )
+        return rows
+
+
+def _epoch_days(day: date) -> int:
+    return (date(day.year, day.month, day.day) - date(1970, 1, 1)).days
+
+
+def _frame_from_parts(parts: List[Dict[str, np.ndarray]]) -> pd.DataFrame:
+    def column(name: str) -> np.ndarray:
+        if not parts:
+            return np.empty(0)
+        return np.concatenate([part[name] for part in parts])
+
+    return pd.DataFrame(
+        {
+            "Open": column("open").astype(np.float64),
+            "High": column("high").astype(np.float64),
+            "Low": column("low").astype(np.float64),
+            "Close": column("close").astype(np.float64),
+            "Volume": column("volume").astype(np.int64),
+        },
+        index=pd.DatetimeIndex(
+            column("date").astype("datetime64[D]").astype("datetime64[ns]"),
+            name="Date",
+        ),
+    )
+
+
+@lru_cache
+def get_price_archive() -> Optional[PriceArchive]:
+    """PRICE_ARCHIVE_DIR가 설정되어 있으면 프로세스 공용 보관소를 반환합니다."""
+    if not settings.PRICE_ARCHIVE_DIR:
+        return None
+    return PriceArchive(settings.PRICE_ARCHIVE_DIR)
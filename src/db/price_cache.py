@@ -0,0 +1,117 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+from src.core.config import settings
+
+
+# (stock_key, start, end)
+FrameKey = Tuple[int, date, date]
+# (데이터 버전, 저장 시각, 프레임, 바이트 수)
+FrameEntry = Tuple[int, float, pd.DataFrame, int]
+
+
+class PriceFrameCache:
+    """종목별 가격 DataFrame을 프로세스 메모리에 보관하는 LRU 캐시
+
+    항목은 읽기 시작 시점의 종목 데이터 버전과 함께 저장되며, 가격을 쓰는 경로가
+    커밋 후 bump()로 버전을 올리면 그 종목의 항목은 다음 조회 때 버려집니다.
+    다른 프로세스의 쓰기는 버전으로 알 수 없으므로 ttl_seconds가 지나도 버립니다.
+    """
+
+    def __init__(self, max_bytes: int, ttl_seconds: float):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[FrameKey, FrameEntry]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def version(self, stock_key: int) -> int:
+        """종목의 현재 데이터 버전 (조회 전에 읽어 put에 넘깁니다)"""
+        with self._lock:
+            return self._versions.get(stock_key, 0)
+
+    def bump(self, stock_keys: Iterable[int]) -> None:
+        """종목 데이터가 바뀌었음을 알립니다. 쓰기를 커밋한 뒤 호출합니다."""
+        with self._lock:
+            for stock_key in set(stock_keys):
+                self._versions[stock_key] = self._versions.get(stock_key, 0) + 1
+
+    def get(self, stock_key: int, start: date, end: date) -> Optional[pd.DataFrame]:
+        """유효한 항목이 있으면 복사본을 반환합니다."""
+        key = (stock_key, start, end)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                version, stored_at, frame, _ = entry
+                if (
+                    version == self._versions.get(stock_key, 0)
+                    and time.monotonic() - stored_at < self.ttl_seconds
+                ):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return frame.copy()
+                self._remove(key)
+                self.invalidations += 1
+            self.misses += 1
+        return None
+
+    def put(
+        self, stock_key: int, start: date, end: date, version: int, frame: pd.DataFrame
+    ) -> None:
+        """조회 전에 읽어 둔 version과 함께 프레임을 저장합니다.
+
+        그 사이 버전이 올라갔다면 이미 낡은 데이터일 수 있으므로 저장하지 않습니다.
+        """
+        nbytes = int(frame.memory_usage(index=True).sum())
+        if nbytes > self.max_bytes:
+            return
+        key = (stock_key, start, end)
+        with self._lock:
+            if version != self._versions.get(stock_key, 0):
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (version, time.monotonic(), frame.copy(), nbytes)
+            self.size_bytes += nbytes
+            while self.size_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def _remove(self, key: FrameKey) -> None:
+        self.size_bytes -= self._entries.pop(key)[3]
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/실패 횟수와 메모리 사용량을 반환합니다."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self.size_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+price_frame_cache = PriceFrameCache(
+    settings.PRICE_FRAME_CACHE_MAX_MB * 1024 * 1024,
+    settings.PRICE_FRAME_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,164 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.unit_of_work import commit
+from src.models.job import Job, JobStatus
+
+
+# 작업자 호스트마다 시계가 다를 수 있으므로 잠금/heartbeat 시각은 DB 시계(UTC)로 기록합니다.
+DB_NOW = func.timezone("utc", func.now())
+
+
+class JobRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def enqueue(
+        self,
+        kind: str,
+        payload: Optional[Dict[str, Any]] = None,
+        max_attempts: int = 5,
+        run_after: Optional[datetime] = None,
+    ) -> Job:
+        """새 작업을 큐에 넣습니다."""
+        job = Job(
+            kind=kind,
+            payload=payload or {},
+            status=JobStatus.QUEUED,
+            max_attempts=max_attempts,
+            run_after=run_after or datetime.utcnow(),
+        )
+        self.db.add(job)
+        await commit(self.db)
+        return job
+
+    async def claim(
+        self,
+        worker_id: str,
+        kinds: Optional[Sequence[str]] = None,
+        stale_after: timedelta = timedelta(minutes=5),
+    ) -> Optional[Job]:
+        """실행할 작업 하나를 잠그고 가져옵니다.
+
+        다른 작업자가 잠근 행은 SKIP LOCKED로 건너뛰며, heartbeat가 끊긴
+        실행 중 작업(작업자 프로세스 종료)도 시도 횟수가 남았으면 다시 가져갑니다.
+        시도 횟수를 다 쓴 채 heartbeat가 끊긴 작업은 실패 처리합니다.
+        """
+        stale = and_(
+            Job.status == JobStatus.RUNNING, Job.heartbeat_at < DB_NOW - stale_after
+        )
+        await self.db.execute(
+            update(Job)
+            .where(stale, Job.attempts >= Job.max_attempts)
+            .values(
+                status=JobStatus.FAILED,
+                locked_by=None,
+                last_error="Worker stopped sending heartbeats",
+            )
+        )
+        query = (
+            select(Job.id)
+            .where(
+                or_(
+                    and_(Job.status == JobStatus.QUEUED, Job.run_after <= DB_NOW),
+                    and_(stale, Job.attempts < Job.max_attempts),
+                )
+            )
+            .order_by(Job.run_after)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        if kinds:
+            query = query.where(Job.kind.in_(kinds))
+
+        job_id = (await self.db.execute(query)).scalar_one_or_none()
+        if job_id is None:
+            await self.db.commit()
+            return None
+
+        job = (
+            await self.db.execute(
+                update(Job)
+                .where(Job.id == job_id)
+                .values(
+                    status=JobStatus.RUNNING,
+                    locked_by=worker_id,
+                    locked_at=DB_NOW,
+                    heartbeat_at=DB_NOW,
+                    attempts=Job.attempts + 1,
+                )
+                .returning(Job)
+                .execution_options(populate_existing=True)
+            )
+        ).scalar_one()
+        await self.db.commit()
+        return job
+
+    async def heartbeat(self, job_id: int, worker_id: str) -> bool:
+        """작업 잠금을 연장합니다. 다른 작업자가 가져갔다면 False를 반환합니다."""
+        result = await self.db.execute(
+            update(Job)
+            .where(
+                Job.id == job_id,
+                Job.locked_by == worker_id,
+                Job.status == JobStatus.RUNNING,
+            )
+            .values(heartbeat_at=DB_NOW)
+        )
+        await self.db.commit()
+        return result.rowcount == 1
+
+    async def save_checkpoint(self, job_id: int, checkpoint: Dict[str, Any]) -> None:
+        """재개 지점을 기록합니다."""
+        await self.db.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(checkpoint=checkpoint, heartbeat_at=DB_NOW)
+        )
+        await self.db.commit()
+
+    async def complete(self, job_id: int, worker_id: str) -> bool:
+        """작업을 완료 처리합니다. 다른 작업자가 가져갔다면 False를 반환합니다."""
+        result = await self.db.execute(
+            update(Job)
+            .where(
+                Job.id == job_id,
+                Job.locked_by == worker_id,
+                Job.status == JobStatus.RUNNING,
+            )
+            .values(status=JobStatus.DONE, locked_by=None, last_error=None)
+        )
+        await self.db.commit()
+        return result.rowcount == 1
+
+    async def fail(self, job: Job, worker_id: str, error: str) -> bool:
+        """작업 실패를 기록하고 재시도 횟수가 남았으면 지수 백오프로 다시 큐에 넣습니다.
+
+        다른 작업자가 가져갔다면 기록하지 않고 False를 반환합니다.
+        """
+        if job.attempts >= job.max_attempts:
+            values = {"status": JobStatus.FAILED}
+        else:
+            values = {
+                "status": JobStatus.QUEUED,
+                "run_after": DB_NOW + timedelta(seconds=30 * 2 ** (job.attempts - 1)),
+            }
+        result = await self.db.execute(
+            update(Job)
+            .where(
+                Job.id == job.id,
+                Job.locked_by == worker_id,
+                Job.status == JobStatus.RUNNING,
+            )
+            .values(locked_by=None, last_error=error, **values)
+        )
+        await self.db.commit()
+        return result.rowcount == 1
+
+    async def get_recent(self, limit: int = 50) -> List[Job]:
+        """최근 작업 목록을 가져옵니다."""
+        result = await self.db.execute(select(Job).order_by(Job.id.desc()).limit(limit))
+        return result.scalars().all()
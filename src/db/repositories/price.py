@@ -1,10 +1,351 @@
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+from uuid import UUID
 
-from sqlalchemy import select
+import numpy as np
+import pandas as pd
+from sqlalchemy import literal_column, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
 
+from src.db.price_archive import PriceArchive, get_price_archive
+from src.db.price_cache import price_frame_cache
+from src.db.repositories.stock_stats import StockStatsRepository
+from src.db.session import REPLICA_KEY
+from src.db.unit_of_work import after_commit, commit, in_unit_of_work
 from src.models.price import Price
+from src.models.price_quarantine import PriceQuarantine
+
+# stream_range 기본 청크 크기 (행 수)
+STREAM_CHUNK_SIZE = 50000
+
+# asyncpg는 한 문장에 최대 32767개의 바인드 파라미터만 허용하므로 행을 나눠서 보냅니다.
+UPSERT_BATCH_SIZE = 1000
+
+# 이미 존재가 확인된 price 파티션 연도 (프로세스 단위)
+# 다른 프로세스가 archive --drop으로 지운 연도는 쓰기가 실패할 때 다시 만듭니다.
+_partition_years: Set[int] = set()
+
+# 맞는 파티션이 없는 행을 쓸 때의 SQLSTATE (check_violation)
+NO_PARTITION_SQLSTATE = "23514"
+
+T = TypeVar("T")
+
+COPY_COLUMNS = ["stock_key", "date", "open", "high", "low", "close", "volume"]
+
+CREATE_STAGING_SQL = """
+CREATE TEMP TABLE price_staging (
+    stock_key integer NOT NULL,
+    date date NOT NULL,
+    open double precision NOT NULL,
+    high double precision NOT NULL,
+    low double precision NOT NULL,
+    close double precision NOT NULL,
+    volume bigint NOT NULL
+) ON COMMIT DROP
+"""
+
+# 한 UnitOfWork 안에서 copy_upsert를 여러 번 불러도 다시 만들 수 있도록 병합 후 지웁니다.
+DROP_STAGING_SQL = "DROP TABLE price_staging"
+
+# 병합 후 종목별 요약(stock_stats delta)과 병합 행 수를 돌려줍니다.
+MERGE_STAGING_SQL = """
+WITH merged AS (
+    INSERT INTO price (stock_key, date, open, high, low, close, volume)
+    SELECT DISTINCT ON (stock_key, date)
+        stock_key, date, open, high, low, close, volume
+    FROM price_staging
+    ORDER BY stock_key, date
+    ON CONFLICT (stock_key, date) DO UPDATE SET
+        open = EXCLUDED.open,
+        high = EXCLUDED.high,
+        low = EXCLUDED.low,
+        close = EXCLUDED.close,
+        volume = EXCLUDED.volume
+    RETURNING stock_key, date, close, volume, xmax = 0 AS inserted
+)
+SELECT
+    stock_key,
+    min(date) AS first_date,
+    max(date) AS last_date,
+    count(*) FILTER (WHERE inserted) AS bar_count,
+    (array_agg(close ORDER BY date DESC))[1] AS last_close,
+    (array_agg(volume ORDER BY date DESC))[1] AS last_volume,
+    count(*) AS merged
+FROM merged
+GROUP BY stock_key
+"""
+
+# get_frame용 바이너리 COPY. 모든 컬럼이 NOT NULL 고정 길이라 행 길이가 일정합니다.
+FRAME_COPY_SQL = """
+COPY (
+    SELECT date, open, high, low, close, volume
+    FROM price
+    WHERE stock_key = {stock_key}
+      AND date BETWEEN '{start:%Y-%m-%d}' AND '{end:%Y-%m-%d}'
+    ORDER BY date
+) TO STDOUT WITH (FORMAT binary)
+"""
+
+# 바이너리 COPY 한 행: 필드 수(int16) + 필드마다 길이(int32)와 값 (네트워크 바이트 순서)
+FRAME_ROW_DTYPE = np.dtype(
+    [
+        ("fields", ">i2"),
+        ("date_len", ">i4"),
+        ("date", ">i4"),  # 2000-01-01 기준 일수
+        ("open_len", ">i4"),
+        ("open", ">f8"),
+        ("high_len", ">i4"),
+        ("high", ">f8"),
+        ("low_len", ">i4"),
+        ("low", ">f8"),
+        ("close_len", ">i4"),
+        ("close", ">f8"),
+        ("volume_len", ">i4"),
+        ("volume", ">i8"),
+    ]
+)
+
+PANEL_FIELDS = ("open", "high", "low", "close", "volume")
+
+# get_panel용 바이너리 COPY. 값은 float8로 맞춰 행 길이를 고정합니다.
+PANEL_COPY_SQL = """
+COPY (
+    SELECT stock_key, date, {field}::float8
+    FROM price
+    WHERE stock_key = ANY('{{{stock_keys}}}'::integer[])
+      AND date BETWEEN '{start:%Y-%m-%d}' AND '{end:%Y-%m-%d}'
+) TO STDOUT WITH (FORMAT binary)
+"""
+
+PANEL_ROW_DTYPE = np.dtype(
+    [
+        ("fields", ">i2"),
+        ("stock_key_len", ">i4"),
+        ("stock_key", ">i4"),
+        ("date_len", ">i4"),
+        ("date", ">i4"),
+        ("value_len", ">i4"),
+        ("value", ">f8"),
+    ]
+)
+
+# 보관(archive_year)용 바이너리 COPY. 파일에서 이진 탐색할 수 있도록 정렬해서 읽습니다.
+ARCHIVE_COPY_SQL = """
+COPY (
+    SELECT stock_key, date, open, high, low, close, volume
+    FROM price_y{year}
+    ORDER BY stock_key, date
+) TO STDOUT WITH (FORMAT binary)
+"""
+
+ARCHIVE_ROW_DTYPE = np.dtype(
+    [
+        ("fields", ">i2"),
+        ("stock_key_len", ">i4"),
+        ("stock_key", ">i4"),
+        *FRAME_ROW_DTYPE.descr[1:],
+    ]
+)
+
+PARTITION_YEARS_SQL = """
+SELECT substring(c.relname FROM '^price_y([0-9]{4})$')::integer
+FROM pg_inherits i
+JOIN pg_class c ON c.oid = i.inhrelid
+WHERE i.inhparent = 'price'::regclass
+ORDER BY 1
+"""
+
+# 시그니처(11) + 플래그(4) + 헤더 확장 길이(4)
+COPY_HEADER_SIZE = 19
+COPY_TRAILER_SIZE = 2
+PG_EPOCH = np.datetime64("2000-01-01", "D")
+FRAME_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def _copy_rows(buffer: bytes, dtype: np.dtype) -> np.ndarray:
+    """고정 길이 행으로 이뤄진 바이너리 COPY 결과를 구조화 배열로 해석합니다."""
+    if len(buffer) <= COPY_HEADER_SIZE + COPY_TRAILER_SIZE:
+        return np.empty(0, dtype=dtype)
+    extension = int.from_bytes(buffer[15:COPY_HEADER_SIZE], "big")
+    offset = COPY_HEADER_SIZE + extension
+    return np.frombuffer(
+        buffer,
+        dtype=dtype,
+        offset=offset,
+        count=(len(buffer) - offset - COPY_TRAILER_SIZE) // dtype.itemsize,
+    )
+
+
+def _to_datetime_index(days: np.ndarray) -> pd.DatetimeIndex:
+    """2000-01-01 기준 일수 배열을 DatetimeIndex로 변환합니다."""
+    return pd.DatetimeIndex(
+        (PG_EPOCH + days.astype(np.int64)).astype("datetime64[ns]"), name="Date"
+    )
+
+
+def _parse_binary_copy(buffer: bytes) -> pd.DataFrame:
+    """PostgreSQL 바이너리 COPY 결과를 DataFrame으로 변환합니다."""
+    rows = _copy_rows(buffer, FRAME_ROW_DTYPE)
+    return pd.DataFrame(
+        {
+            "Open": rows["open"].astype(np.float64),
+            "High": rows["high"].astype(np.float64),
+            "Low": rows["low"].astype(np.float64),
+            "Close": rows["close"].astype(np.float64),
+            "Volume": rows["volume"].astype(np.int64),
+        },
+        index=_to_datetime_index(rows["date"]),
+    )
+
+
+def _pivot_panel(
+    sources: Sequence[Tuple[np.ndarray, np.ndarray, np.ndarray]],
+    stock_keys: Sequence[int],
+) -> pd.DataFrame:
+    """(stock_key, date, value) 배열 묶음을 날짜 x 종목 행렬로 펼칩니다. 빈 칸은 NaN입니다.
+
+    같은 칸이 여러 묶음에 있으면 뒤에 오는 묶음의 값이 남습니다.
+    """
+    keys = np.asarray(stock_keys, dtype=np.int64)
+    order = np.argsort(keys)
+    days = np.unique(np.concatenate([source[1] for source in sources]))
+    matrix = np.full((len(days), len(keys)), np.nan)
+    for source_keys, source_days, values in sources:
+        columns = order[np.searchsorted(keys[order], source_keys)]
+        matrix[np.searchsorted(days, source_days), columns] = values
+    return pd.DataFrame(matrix, index=_to_datetime_index(days), columns=keys)
+
+
+def _stitch(archived: pd.DataFrame, hot: pd.DataFrame) -> pd.DataFrame:
+    """보관 데이터와 DB 데이터를 날짜순으로 합칩니다. 같은 날짜는 DB 값을 씁니다."""
+    if archived.empty:
+        return hot
+    combined = pd.concat([archived, hot])
+    return combined[~combined.index.duplicated(keep="last")].sort_index()
+
+
+async def _stitch_stream(
+    chunks: AsyncIterator[pd.DataFrame],
+    stock_keys: Sequence[int],
+    start: date,
+    end: date,
+    archive: PriceArchive,
+    chunk_size: int,
+) -> AsyncIterator[pd.DataFrame]:
+    """stream_range의 DB 청크에 보관 데이터를 (stock_key, date) 순서로 끼워 넣습니다.
+
+    DB 청크는 (stock_key, date) 순으로 정렬되어 있어야 합니다. 종목 하나씩 DB 행을
+    모아 보관 구간과 합치므로(같은 날짜는 DB 값) 메모리에는 한 종목의 데이터와
+    청크 하나만 있습니다. 결과는 다시 chunk_size 행씩 나눠 내보냅니다.
+    """
+    keys = sorted({int(key) for key in stock_keys})
+    pending: List[pd.DataFrame] = []
+    pending_rows = 0
+
+    def stitched(stock_key: int, parts: List[pd.DataFrame]) -> pd.DataFrame:
+        archived = archive.read_frame(stock_key, start, end)
+        if parts:
+            hot = pd.concat(parts).drop(columns="StockKey")
+            frame = _stitch(archived, hot)
+        else:
+            frame = archived
+        frame.insert(0, "StockKey", np.full(len(frame), stock_key, dtype=np.int32))
+        return frame
+
+    async def per_stock() -> AsyncIterator[pd.DataFrame]:
+        position = 0
+        current_key: Optional[int] = None
+        parts: List[pd.DataFrame] = []
+        async for chunk in chunks:
+            for stock_key, group in chunk.groupby("StockKey", sort=False):
+                stock_key = int(stock_key)
+                if stock_key != current_key:
+                    if current_key is not None:
+                        yield stitched(current_key, parts)
+                    # DB 행이 없는 종목은 보관 데이터만 내보냅니다.
+                    while position < len(keys) and keys[position] < stock_key:
+                        yield stitched(keys[position], [])
+                        position += 1
+                    if position < len(keys) and keys[position] == stock_key:
+                        position += 1
+                    current_key, parts = stock_key, []
+                parts.append(group)
+        if current_key is not None:
+            yield stitched(current_key, parts)
+        for stock_key in keys[position:]:
+            yield stitched(stock_key, [])
+
+    async for frame in per_stock():
+        if frame.empty:
+            continue
+        pending.append(frame)
+        pending_rows += len(frame)
+        while pending_rows >= chunk_size:
+            combined = pd.concat(pending)
+            yield combined.iloc[:chunk_size]
+            rest = combined.iloc[chunk_size:]
+            pending = [rest] if len(rest) else []
+            pending_rows = len(rest)
+    if pending_rows:
+        yield pd.concat(pending)
+
+
+def _frame_to_rows(stock_key: int, frame: pd.DataFrame) -> List[dict]:
+    """FinanceDataReader 형식의 DataFrame을 price 테이블 행으로 변환합니다."""
+    return [
+        {
+            "stock_key": stock_key,
+            "date": day,
+            "open": float(open_),
+            "high": float(high),
+            "low": float(low),
+            "close": float(close),
+            "volume": int(volume),
+        }
+        for day, open_, high, low, close, volume in zip(
+            frame.index.date,
+            frame["Open"].to_numpy(dtype=float),
+            frame["High"].to_numpy(dtype=float),
+            frame["Low"].to_numpy(dtype=float),
+            frame["Close"].to_numpy(dtype=float),
+            frame["Volume"].to_numpy(),
+        )
+    ]
+
+
+def _frame_to_records(stock_key: int, frame: pd.DataFrame) -> List[tuple]:
+    """DataFrame을 COPY용 튜플 목록으로 변환합니다."""
+    return list(
+        zip(
+            [stock_key] * len(frame),
+            frame.index.date.tolist(),
+            frame["Open"].to_numpy(dtype=float).tolist(),
+            frame["High"].to_numpy(dtype=float).tolist(),
+            frame["Low"].to_numpy(dtype=float).tolist(),
+            frame["Close"].to_numpy(dtype=float).tolist(),
+            frame["Volume"].to_numpy(dtype="int64").tolist(),
+        )
+    )
+
+
+def _nullable(value: float) -> Optional[float]:
+    return None if np.isnan(value) else value
 
 
 class PriceRepository:
@@ -14,54 +355,432 @@ class PriceRepository:
     async def create(self, price: Price) -> Price:
         """가격 데이터 생성"""
         self.session.add(price)
-        await self.session.commit()
-        await self.session.refresh(price)
+        await self.session.flush()
+        await StockStatsRepository(self.session).rebuild([price.stock_key])
+        await commit(self.session)
+        after_commit(self.session, lambda: price_frame_cache.bump([price.stock_key]))
         return price
 
-    async def get_by_id(self, price_id: int) -> Optional[Price]:
-        """ID로 가격 데이터 조회"""
-        result = await self.session.execute(select(Price).where(Price.id == price_id))
-        return result.scalar_one_or_none()
-
-    async def get_by_stock_and_date(
-        self, stock_id: int, date: datetime
-    ) -> Optional[Price]:
-        """주식 ID와 날짜로 가격 데이터 조회"""
-        result = await self.session.execute(
-            select(Price).where(Price.stock_id == stock_id, Price.date == date)
-        )
-        return result.scalar_one_or_none()
+    async def get_by_stock_and_date(self, stock_key: int, day: date) -> Optional[Price]:
+        """주식 키(price_key)와 날짜로 가격 데이터 조회"""
+        return await self.session.get(Price, (stock_key, day))
 
     async def get_by_stock_and_date_range(
-        self, stock_id: int, start_date: datetime, end_date: datetime
+        self, stock_key: int, start_date: date, end_date: date
     ) -> List[Price]:
-        """주식 ID와 날짜 범위로 가격 데이터 조회"""
+        """주식 키(price_key)와 날짜 범위로 가격 데이터 조회
+
+        price 컬럼만 읽어 커버링 기본 키의 index-only scan을 탈 수 있도록
+        stocks 조인(joined 로딩)은 하지 않습니다. 보관소로 옮겨진 날짜는 세션에
+        추가되지 않은 Price 객체로 채워 넣으며, 같은 날짜는 DB 행을 씁니다.
+        """
         result = await self.session.execute(
             select(Price)
+            .options(noload(Price.stock))
             .where(
-                Price.stock_id == stock_id,
+                Price.stock_key == stock_key,
                 Price.date >= start_date,
                 Price.date <= end_date,
             )
             .order_by(Price.date)
         )
-        return result.scalars().all()
+        prices = result.scalars().all()
+        archive = get_price_archive()
+        if archive is None or not archive.overlapping_years(start_date, end_date):
+            return prices
+
+        archived = archive.read_frame(stock_key, start_date, end_date)
+        stored = {price.date for price in prices}
+        prices.extend(
+            Price(
+                stock_key=stock_key,
+                date=day.date(),
+                open=float(row.Open),
+                high=float(row.High),
+                low=float(row.Low),
+                close=float(row.Close),
+                volume=int(row.Volume),
+            )
+            for day, row in zip(archived.index, archived.itertuples(index=False))
+            if day.date() not in stored
+        )
+        prices.sort(key=lambda price: price.date)
+        return prices
+
+    async def get_frame(self, stock_key: int, start: date, end: date) -> pd.DataFrame:
+        """기간 가격 데이터를 ORM 객체 없이 DataFrame(Date 인덱스, OHLCV)으로 가져옵니다.
+
+        바이너리 COPY 결과를 NumPy 구조화 dtype으로 한 번에 해석하므로
+        행마다 파이썬 객체가 생기지 않습니다. 보관소(PRICE_ARCHIVE_DIR)에 옮겨진
+        연도가 기간에 걸치면 보관 데이터와 이어 붙입니다. 결과는 종목 데이터 버전과
+        함께 프로세스 캐시(price_frame_cache)에 보관되어 새 봉이 저장될 때까지 재사용됩니다.
+        UnitOfWork 안에서는 커밋되지 않은 쓰기가 보일 수 있고, 복제본 세션에서는 아직
+        따라잡지 못한 데이터를 볼 수 있으므로 캐시를 쓰지 않습니다.
+        """
+        stock_key = int(stock_key)
+        use_cache = not (
+            in_unit_of_work(self.session) or self.session.info.get(REPLICA_KEY)
+        )
+        version = price_frame_cache.version(stock_key)
+        if use_cache:
+            cached = price_frame_cache.get(stock_key, start, end)
+            if cached is not None:
+                return cached
+
+        # 값은 int/날짜 서식으로만 들어가므로 SQL에 그대로 넣어도 안전합니다.
+        buffer = await self._copy_out(
+            FRAME_COPY_SQL.format(stock_key=stock_key, start=start, end=end)
+        )
+        frame = _parse_binary_copy(buffer)
+        archive = get_price_archive()
+        if archive is not None and archive.overlapping_years(start, end):
+            frame = _stitch(archive.read_frame(stock_key, start, end), frame)
+        if use_cache:
+            price_frame_cache.put(stock_key, start, end, version, frame)
+        return frame
+
+    async def get_panel(
+        self,
+        stock_keys: Sequence[int],
+        start: date,
+        end: date,
+        field: str = "close",
+    ) -> pd.DataFrame:
+        """여러 종목의 한 필드를 한 번의 쿼리로 읽어 날짜 x 종목 행렬로 반환합니다.
+
+        컬럼은 stock_keys 순서를 따르며, 거래가 없는 칸은 NaN입니다.
+        """
+        if field not in PANEL_FIELDS:
+            raise ValueError(f"Unknown price field: {field}")
+        if not stock_keys:
+            return pd.DataFrame(index=pd.DatetimeIndex([], name="Date"))
+
+        buffer = await self._copy_out(
+            PANEL_COPY_SQL.format(
+                field=field,
+                stock_keys=",".join(str(int(key)) for key in stock_keys),
+                start=start,
+                end=end,
+            )
+        )
+        rows = _copy_rows(buffer, PANEL_ROW_DTYPE)
+        sources = []
+        archive = get_price_archive()
+        if archive is not None:
+            sources.extend(archive.read_rows(stock_keys, start, end, field))
+        # DB 행을 마지막에 두어 보관 데이터와 겹치는 칸은 DB 값이 남도록 합니다.
+        sources.append((rows["stock_key"], rows["date"], rows["value"]))
+        return _pivot_panel(sources, stock_keys)
+
+    async def stream_range(
+        self,
+        stock_keys: Sequence[int],
+        start: date,
+        end: date,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """기간 가격 데이터를 서버 측 커서로 chunk_size 행씩 나눠 DataFrame으로 내보냅니다.
+
+        (stock_key, date) 순서로 정렬되며, 각 청크는 Date 인덱스와 StockKey, OHLCV
+        컬럼을 가집니다. 한 번에 한 청크만 메모리에 있으므로 기간이 길어도
+        메모리 사용량이 일정합니다. 보관소로 옮겨진 연도가 기간에 걸치면 보관 데이터를
+        같은 순서로 끼워 넣습니다 (이때는 종목 하나의 데이터까지 메모리에 둡니다).
+        """
+        chunks = self._stream_rows(stock_keys, start, end, chunk_size)
+        archive = get_price_archive()
+        if archive is not None and archive.overlapping_years(start, end):
+            chunks = _stitch_stream(chunks, stock_keys, start, end, archive, chunk_size)
+        async for chunk in chunks:
+            yield chunk
+
+    async def _stream_rows(
+        self,
+        stock_keys: Sequence[int],
+        start: date,
+        end: date,
+        chunk_size: int,
+    ) -> AsyncIterator[pd.DataFrame]:
+        result = await self.session.stream(
+            select(
+                Price.stock_key,
+                Price.date,
+                Price.open,
+                Price.high,
+                Price.low,
+                Price.close,
+                Price.volume,
+            )
+            .where(
+                Price.stock_key.in_(list(stock_keys)),
+                Price.date >= start,
+                Price.date <= end,
+            )
+            .order_by(Price.stock_key, Price.date)
+            .execution_options(yield_per=chunk_size)
+        )
+        async for partition in result.partitions(chunk_size):
+            keys, days, open_, high, low, close, volume = zip(*partition)
+            yield pd.DataFrame(
+                {
+                    "StockKey": np.array(keys, dtype=np.int32),
+                    "Open": np.array(open_, dtype=np.float64),
+                    "High": np.array(high, dtype=np.float64),
+                    "Low": np.array(low, dtype=np.float64),
+                    "Close": np.array(close, dtype=np.float64),
+                    "Volume": np.array(volume, dtype=np.int64),
+                },
+                index=pd.DatetimeIndex(
+                    np.array(days, dtype="datetime64[D]").astype("datetime64[ns]"),
+                    name="Date",
+                ),
+            )
+
+    async def _copy_out(self, query: str) -> bytes:
+        """COPY ... TO STDOUT 결과를 세션 트랜잭션 안에서 바이트로 모읍니다."""
+        chunks: List[bytes] = []
+
+        async def collect(chunk: bytes) -> None:
+            chunks.append(chunk)
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_from_query(query, output=collect)
+        return b"".join(chunks)
 
     async def update(self, price: Price) -> Price:
         """가격 데이터 업데이트"""
-        await self.session.commit()
-        await self.session.refresh(price)
+        await self.session.flush()
+        await StockStatsRepository(self.session).rebuild([price.stock_key])
+        await commit(self.session)
+        after_commit(self.session, lambda: price_frame_cache.bump([price.stock_key]))
         return price
 
     async def delete(self, price: Price) -> None:
         """가격 데이터 삭제"""
+        stock_key = price.stock_key
         await self.session.delete(price)
-        await self.session.commit()
+        await self.session.flush()
+        await StockStatsRepository(self.session).rebuild([stock_key])
+        await commit(self.session)
+        after_commit(self.session, lambda: price_frame_cache.bump([stock_key]))
 
     async def bulk_create(self, prices: List[Price]) -> List[Price]:
         """여러 주식 가격 데이터를 한 번에 생성합니다."""
         self.session.add_all(prices)
-        await self.session.commit()
-        for price in prices:
-            await self.session.refresh(price)
+        await self.session.flush()
+        stock_keys = {price.stock_key for price in prices}
+        await StockStatsRepository(self.session).rebuild(stock_keys)
+        await commit(self.session)
+        after_commit(self.session, lambda: price_frame_cache.bump(stock_keys))
         return prices
+
+    async def ensure_partitions(self, years: Iterable[int]) -> None:
+        """주어진 연도의 price 파티션이 없으면 만듭니다.
+
+        확인한 연도는 프로세스 안에서 기억하므로 대부분의 호출은 DB를 거치지 않습니다.
+        """
+        missing = sorted(set(years) - _partition_years)
+        if not missing:
+            return
+        await self.session.execute(
+            text("SELECT create_price_partitions(:from_year, :to_year)"),
+            {"from_year": missing[0], "to_year": missing[-1]},
+        )
+        await commit(self.session)
+        after_commit(
+            self.session,
+            lambda: _partition_years.update(range(missing[0], missing[-1] + 1)),
+        )
+
+    async def _with_partitions(
+        self, years: Iterable[int], write: Callable[[], Awaitable[T]]
+    ) -> T:
+        """필요한 파티션을 확인한 뒤 write를 실행합니다.
+
+        _partition_years는 프로세스마다 따로 있으므로 다른 프로세스에서 지운 파티션은
+        알 수 없습니다. 파티션이 없다는 오류가 나면 savepoint까지 되돌리고, 기억한
+        연도를 잊은 뒤 파티션을 다시 만들어(IF NOT EXISTS) 한 번 더 시도합니다.
+        """
+        years = sorted(set(years))
+        await self.ensure_partitions(years)
+        try:
+            async with self.session.begin_nested():
+                return await write()
+        except IntegrityError as e:
+            if getattr(e.orig, "sqlstate", None) != NO_PARTITION_SQLSTATE:
+                raise
+        _partition_years.difference_update(years)
+        await self.ensure_partitions(years)
+        return await write()
+
+    async def partition_years(self) -> List[int]:
+        """현재 price 테이블에 붙어 있는 연도 파티션 목록"""
+        result = await self.session.execute(text(PARTITION_YEARS_SQL))
+        return [year for year in result.scalars() if year is not None]
+
+    async def archive_year(
+        self, archive: PriceArchive, year: int, drop_partition: bool = False
+    ) -> int:
+        """한 해의 파티션을 보관소 파일로 내보내고, 요청하면 파티션을 삭제합니다.
+
+        파티션을 SHARE 모드로 잠근 뒤 읽으므로 내보내는 동안 쓰기는 기다립니다.
+        삭제는 파일을 다 쓴 뒤 같은 트랜잭션에서 하며, stock_stats는 DB에 남은 봉만
+        집계하므로 해당 종목의 요약도 같은 트랜잭션에서 다시 만듭니다.
+        내보낸 행 수를 반환합니다.
+        """
+        year = int(year)
+        await self.session.execute(text(f"LOCK TABLE price_y{year} IN SHARE MODE"))
+        rows = _copy_rows(
+            await self._copy_out(ARCHIVE_COPY_SQL.format(year=year)), ARCHIVE_ROW_DTYPE
+        )
+        count = archive.write_year(
+            year,
+            {
+                "stock_key": rows["stock_key"].astype(np.int32),
+                "date": PG_EPOCH + rows["date"].astype(np.int64),
+                "open": rows["open"].astype(np.float64),
+                "high": rows["high"].astype(np.float64),
+                "low": rows["low"].astype(np.float64),
+                "close": rows["close"].astype(np.float64),
+                "volume": rows["volume"].astype(np.int64),
+            },
+        )
+        stock_keys = np.unique(rows["stock_key"]).tolist()
+        if drop_partition:
+            await self.session.execute(text(f"DROP TABLE price_y{year}"))
+            await StockStatsRepository(self.session).rebuild(stock_keys)
+            _partition_years.discard(year)
+        await commit(self.session)
+        after_commit(self.session, lambda: price_frame_cache.bump(stock_keys))
+        return count
+
+    async def bulk_upsert(self, stock_key: int, frame: pd.DataFrame) -> Dict[str, int]:
+        """DataFrame 전체를 INSERT ... ON CONFLICT DO UPDATE로 저장합니다.
+
+        (stock_key, date) 기본 키를 기준으로 충돌을 판단하며,
+        모든 배치와 stock_stats 갱신을 하나의 트랜잭션으로 반영한 뒤
+        삽입/갱신 건수를 반환합니다.
+        """
+        if frame.empty:
+            return {"inserted": 0, "updated": 0}
+
+        rows = _frame_to_rows(stock_key, frame)
+        counts = await self._with_partitions(
+            frame.index.year.unique(), lambda: self._upsert_rows(rows)
+        )
+
+        last = frame.sort_index().iloc[-1]
+        await StockStatsRepository(self.session).apply_deltas(
+            [
+                {
+                    "stock_key": stock_key,
+                    "first_date": frame.index.min().date(),
+                    "last_date": frame.index.max().date(),
+                    "bar_count": counts["inserted"],
+                    "last_close": float(last["Close"]),
+                    "last_volume": int(last["Volume"]),
+                }
+            ]
+        )
+        await commit(self.session)
+        after_commit(self.session, lambda: price_frame_cache.bump([stock_key]))
+        return counts
+
+    async def _upsert_rows(self, rows: List[dict]) -> Dict[str, int]:
+        counts = {"inserted": 0, "updated": 0}
+        for offset in range(0, len(rows), UPSERT_BATCH_SIZE):
+            stmt = insert(Price).values(rows[offset : offset + UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Price.stock_key, Price.date],
+                set_={
+                    "open": stmt.excluded.open,
+                    "high": stmt.excluded.high,
+                    "low": stmt.excluded.low,
+                    "close": stmt.excluded.close,
+                    "volume": stmt.excluded.volume,
+                },
+            ).returning(literal_column("xmax = 0").label("inserted"))
+            result = await self.session.execute(stmt)
+            for inserted in result.scalars():
+                counts["inserted" if inserted else "updated"] += 1
+        return counts
+
+    async def copy_upsert(self, frames: Mapping[int, pd.DataFrame]) -> int:
+        """여러 종목의 가격 데이터를 바이너리 COPY로 적재합니다.
+
+        임시 스테이징 테이블에 asyncpg `copy_records_to_table`로 행을 흘려보낸 뒤
+        한 번의 INSERT ... SELECT ... ON CONFLICT 문으로 price 테이블에 병합합니다.
+        같은 트랜잭션에서 stock_stats 요약을 갱신하고, 병합된 행 수를 반환합니다.
+        """
+        records = [
+            record
+            for stock_key, frame in frames.items()
+            if not frame.empty
+            for record in _frame_to_records(stock_key, frame)
+        ]
+        if not records:
+            return 0
+        deltas = await self._with_partitions(
+            (
+                year
+                for frame in frames.values()
+                if not frame.empty
+                for year in frame.index.year.unique()
+            ),
+            lambda: self._copy_merge(records),
+        )
+        merged = sum(delta.pop("merged") for delta in deltas)
+        await StockStatsRepository(self.session).apply_deltas(deltas)
+        await commit(self.session)
+        stock_keys = [delta["stock_key"] for delta in deltas]
+        after_commit(self.session, lambda: price_frame_cache.bump(stock_keys))
+        return merged
+
+    async def _copy_merge(self, records: List[tuple]) -> List[dict]:
+        # 스테이징 테이블은 SQLAlchemy 트랜잭션 안에서 만들어야 COPY와 병합이
+        # 같은 트랜잭션을 공유합니다 (ON COMMIT DROP).
+        await self.session.execute(text(CREATE_STAGING_SQL))
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            "price_staging", records=records, columns=COPY_COLUMNS
+        )
+        result = await self.session.execute(text(MERGE_STAGING_SQL))
+        deltas = [dict(row) for row in result.mappings()]
+        await self.session.execute(text(DROP_STAGING_SQL))
+        return deltas
+
+    async def quarantine(self, stock_id: UUID, rejected: pd.DataFrame) -> int:
+        """검증에 실패한 행을 사유(reasons, reason 컬럼)와 함께 격리 테이블에 저장합니다."""
+        if rejected.empty:
+            return 0
+
+        now = datetime.utcnow()
+        rows = [
+            {
+                "stock_id": stock_id,
+                "date": date,
+                "open": _nullable(open_),
+                "high": _nullable(high),
+                "low": _nullable(low),
+                "close": _nullable(close),
+                "volume": _nullable(volume),
+                "reasons": int(reasons),
+                "reason": reason,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for date, open_, high, low, close, volume, reasons, reason in zip(
+                rejected.index.to_pydatetime(),
+                rejected["Open"].to_numpy(dtype=float),
+                rejected["High"].to_numpy(dtype=float),
+                rejected["Low"].to_numpy(dtype=float),
+                rejected["Close"].to_numpy(dtype=float),
+                rejected["Volume"].to_numpy(dtype=float),
+                rejected["reasons"].to_numpy(),
+                rejected["reason"].to_numpy(),
+            )
+        ]
+        await self.session.execute(insert(PriceQuarantine), rows)
+        await commit(self.session)
+        return len(rows)
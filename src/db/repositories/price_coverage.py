@@ -0,0 +1,119 @@
+from datetime import date, datetime, timedelta
+from typing import Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.db.unit_of_work import commit
+from src.models.price_coverage import PriceCoverage
+
+DateRange = Tuple[date, date]
+
+ONE_DAY = timedelta(days=1)
+
+
+def _covered_until(coverage: PriceCoverage, now: datetime) -> date:
+    """구간이 실제로 확정된 마지막 날짜를 반환합니다.
+
+    구간의 마지막 날이 수집 당일(또는 그 이후)이고 TTL이 지났다면
+    그 날의 봉은 장중 값이었을 수 있으므로 커버리지에서 제외합니다.
+    """
+    ttl = timedelta(minutes=settings.PRICE_PROVISIONAL_TTL_MINUTES)
+    provisional = coverage.end_date >= coverage.fetched_at.date()
+    if provisional and now - coverage.fetched_at > ttl:
+        return coverage.end_date - ONE_DAY
+    return coverage.end_date
+
+
+def missing_ranges(
+    coverages: Sequence[PriceCoverage],
+    start: date,
+    end: date,
+    now: Optional[datetime] = None,
+) -> List[DateRange]:
+    """start_date 순으로 정렬된 커버리지 구간에서 [start, end]의 빈 구간을 계산합니다."""
+    now = now or datetime.now()
+    gaps: List[DateRange] = []
+    cursor = start
+    for coverage in coverages:
+        if cursor > end:
+            break
+        if coverage.start_date > cursor:
+            gaps.append((cursor, min(coverage.start_date - ONE_DAY, end)))
+        cursor = max(cursor, _covered_until(coverage, now) + ONE_DAY)
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def split_range(start: date, end: date, excluded: Iterable[date]) -> List[DateRange]:
+    """[start, end]에서 excluded 날짜를 뺀 연속 구간 목록을 반환합니다."""
+    ranges: List[DateRange] = []
+    cursor = start
+    for day in sorted(day for day in set(excluded) if start <= day <= end):
+        if day > cursor:
+            ranges.append((cursor, day - ONE_DAY))
+        cursor = day + ONE_DAY
+    if cursor <= end:
+        ranges.append((cursor, end))
+    return ranges
+
+
+class PriceCoverageRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_overlapping(
+        self, stock_id: UUID, start: date, end: date
+    ) -> List[PriceCoverage]:
+        """[start, end]와 겹치는 커버리지 구간을 시작일 순으로 조회합니다."""
+        result = await self.session.execute(
+            select(PriceCoverage)
+            .where(
+                PriceCoverage.stock_id == stock_id,
+                PriceCoverage.start_date <= end,
+                PriceCoverage.end_date >= start,
+            )
+            .order_by(PriceCoverage.start_date)
+        )
+        return result.scalars().all()
+
+    async def get_missing_ranges(
+        self, stock_id: UUID, start: date, end: date
+    ) -> List[DateRange]:
+        """요청 구간 중 아직 가져오지 않은 날짜 구간 목록을 반환합니다."""
+        coverages = await self.get_overlapping(stock_id, start, end)
+        return missing_ranges(coverages, start, end)
+
+    async def add_range(self, stock_id: UUID, start: date, end: date) -> PriceCoverage:
+        """가져온 구간을 기록하고 겹치거나 인접한 구간과 병합합니다."""
+        now = datetime.now()
+        neighbours = await self.get_overlapping(
+            stock_id, start - ONE_DAY, end + ONE_DAY
+        )
+
+        merged_start, merged_end, fetched_at = start, end, now
+        for coverage in neighbours:
+            merged_start = min(merged_start, coverage.start_date)
+            if coverage.end_date > merged_end:
+                # 더 뒤까지 덮는 기존 구간의 수집 시각을 유지해야 장중 봉이 갱신됩니다.
+                merged_end, fetched_at = coverage.end_date, coverage.fetched_at
+
+        if neighbours:
+            await self.session.execute(
+                delete(PriceCoverage).where(
+                    PriceCoverage.id.in_([coverage.id for coverage in neighbours])
+                )
+            )
+
+        coverage = PriceCoverage(
+            stock_id=stock_id,
+            start_date=merged_start,
+            end_date=merged_end,
+            fetched_at=fetched_at,
+        )
+        self.session.add(coverage)
+        await commit(self.session)
+        return coverage
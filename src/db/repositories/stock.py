@@ -1,12 +1,33 @@
-from typing import List, Optional
-from uuid import UUID
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+import pandas as pd
+from sqlalchemy import Row, and_, case, func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.hangul import has_choseong, to_choseong
+from src.db.unit_of_work import commit
 from src.models.stock import Stock
 
 
+# 종목 목록 화면에 필요한 컬럼만 조회합니다.
+LISTING_COLUMNS = {
+    "ticker": Stock.ticker,
+    "name": Stock.name,
+    "market": Stock.market,
+    "country": Stock.country,
+    "last_updated": Stock.last_updated,
+}
+
+# search 기본 결과 수
+SEARCH_LIMIT = 50
+# 이보다 짧은 검색어는 조회하지 않습니다.
+SEARCH_MIN_LENGTH = 2
+# pg_trgm 인덱스로 부분 일치를 찾을 수 있는 최소 글자 수 (더 짧으면 접두사만 찾습니다)
+TRGM_MIN_LENGTH = 3
+
+
 class StockRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -16,6 +37,101 @@ class StockRepository:
         result = await self.db.execute(select(Stock))
         return result.scalars().all()
 
+    async def get_active(self) -> List[Stock]:
+        """활성화된 주식 목록을 가져옵니다."""
+        result = await self.db.execute(
+            select(Stock).where(Stock.is_active.is_(True)).order_by(Stock.ticker)
+        )
+        return result.scalars().all()
+
+    async def get_listing(
+        self,
+        keyword: Optional[str] = None,
+        ticker: Optional[str] = None,
+        sort_column: str = "ticker",
+        descending: bool = False,
+    ) -> List[Row]:
+        """목록 화면용 컬럼만 DB에서 필터링/정렬해 가져옵니다.
+
+        종목명과 티커는 대소문자 구분 없이 부분 일치로 검색하며(trigram 인덱스 사용),
+        keyword에 초성이 있으면 name_choseong 컬럼에서 찾습니다.
+        """
+        order_column = LISTING_COLUMNS.get(sort_column, Stock.ticker)
+        query = select(*LISTING_COLUMNS.values()).order_by(
+            order_column.desc() if descending else order_column
+        )
+        if keyword:
+            if has_choseong(keyword):
+                match = Stock.name_choseong.icontains(
+                    to_choseong(keyword), autoescape=True
+                )
+            else:
+                match = Stock.name.icontains(keyword, autoescape=True)
+            query = query.where(match)
+        if ticker:
+            query = query.where(Stock.ticker.icontains(ticker, autoescape=True))
+        result = await self.db.execute(query)
+        return result.all()
+
+    async def search(
+        self, query: str, ticker: Optional[str] = None, limit: int = SEARCH_LIMIT
+    ) -> List[Row]:
+        """종목명/티커를 pg_trgm 인덱스로 검색해 관련도 순으로 limit개 반환합니다.
+
+        티커 완전 일치, 티커 접두사, 종목명 접두사, 부분 일치 순으로 먼저 보여주고
+        같은 순위 안에서는 trigram 유사도로 정렬합니다. 부분 일치가 없어도 유사도
+        임계값(pg_trgm.similarity_threshold)을 넘으면 오타로 보고 포함합니다.
+        검색어에 초성(ㄱ, ㅅ 등)이 있으면 name_choseong 컬럼에서 찾습니다.
+        trigram 인덱스는 세 글자부터 부분 일치에 쓰이므로 두 글자 검색어는 접두사 일치만
+        찾고, SEARCH_MIN_LENGTH보다 짧으면 빈 목록을 반환합니다. ticker를 주면 티커
+        부분 일치로 결과를 더 좁힙니다.
+        """
+        query = query.strip()
+        if len(query) < SEARCH_MIN_LENGTH:
+            return []
+        short = len(query) < TRGM_MIN_LENGTH
+
+        if has_choseong(query):
+            pattern = to_choseong(query)
+            prefix = Stock.name_choseong.istartswith(pattern, autoescape=True)
+            match = (
+                prefix
+                if short
+                else Stock.name_choseong.icontains(pattern, autoescape=True)
+            )
+            rank = case((prefix, 0), else_=1)
+            similarity = func.similarity(Stock.name_choseong, pattern)
+        else:
+            ticker_prefix = Stock.ticker.istartswith(query, autoescape=True)
+            name_prefix = Stock.name.istartswith(query, autoescape=True)
+            if short:
+                match = or_(ticker_prefix, name_prefix)
+            else:
+                match = or_(
+                    Stock.name.icontains(query, autoescape=True),
+                    Stock.ticker.icontains(query, autoescape=True),
+                    Stock.name.op("%")(query),
+                )
+            rank = case(
+                (func.lower(Stock.ticker) == query.lower(), 0),
+                (ticker_prefix, 1),
+                (name_prefix, 2),
+                (Stock.name.icontains(query, autoescape=True), 3),
+                else_=4,
+            )
+            similarity = func.greatest(
+                func.similarity(Stock.name, query),
+                func.similarity(Stock.ticker, query),
+            )
+
+        stmt = select(*LISTING_COLUMNS.values()).where(match)
+        if ticker and ticker.strip():
+            stmt = stmt.where(Stock.ticker.icontains(ticker.strip(), autoescape=True))
+        result = await self.db.execute(
+            stmt.order_by(rank, similarity.desc(), Stock.ticker).limit(limit)
+        )
+        return result.all()
+
     async def get_by_id(self, stock_id: UUID) -> Optional[Stock]:
         """ID로 주식을 조회합니다."""
         result = await self.db.execute(select(Stock).where(Stock.id == stock_id))
@@ -26,24 +142,132 @@ class StockRepository:
         result = await self.db.execute(select(Stock).where(Stock.ticker == ticker))
         return result.scalar_one_or_none()
 
+    async def get_price_keys(self, tickers: List[str]) -> Dict[str, int]:
+        """티커별 price_key를 조회합니다. 없는 티커는 결과에서 빠집니다."""
+        result = await self.db.execute(
+            select(Stock.ticker, Stock.price_key).where(Stock.ticker.in_(tickers))
+        )
+        return dict(result.all())
+
     async def create(self, stock: Stock) -> Stock:
         """새로운 주식을 생성합니다."""
         self.db.add(stock)
-        await self.db.commit()
-        await self.db.refresh(stock)
+        await commit(self.db)
         return stock
 
     async def update(self, stock: Stock) -> Stock:
         """주식 정보를 업데이트합니다."""
-        await self.db.commit()
-        await self.db.refresh(stock)
+        await commit(self.db)
         return stock
 
+    async def mark_synced(self, stock_id: UUID, synced_at: datetime) -> None:
+        """가격 동기화 시각을 last_updated에 기록합니다."""
+        await self.db.execute(
+            update(Stock).where(Stock.id == stock_id).values(last_updated=synced_at)
+        )
+        await commit(self.db)
+
+    async def sync_listing(
+        self,
+        df: pd.DataFrame,
+        country: str,
+        market: str,
+        deactivate_missing: bool = True,
+    ) -> Dict[str, int]:
+        """종목 목록(Symbol, Name 컬럼)을 기존 종목과 비교해 한 트랜잭션으로 반영합니다.
+
+        새 종목은 추가, 이름/시장/국가가 바뀌었거나 비활성화된 종목은 갱신하고,
+        같은 국가/시장에서 목록에 없는 종목은 비활성화합니다.
+        변경 종류별로 한 번의 bulk 문장만 실행하며 변경 건수를 반환합니다.
+        """
+        listing = dict(
+            df.drop_duplicates("Symbol")[["Symbol", "Name"]].itertuples(index=False)
+        )
+        result = await self.db.execute(
+            select(
+                Stock.id,
+                Stock.ticker,
+                Stock.name,
+                Stock.market,
+                Stock.country,
+                Stock.is_active,
+            ).where(
+                or_(
+                    Stock.ticker.in_(list(listing)),
+                    and_(Stock.country == country, Stock.market == market),
+                )
+            )
+        )
+        existing = {row.ticker: row for row in result.all()}
+
+        now = datetime.utcnow()
+        inserts, updates, deactivations = [], [], []
+        for ticker, name in listing.items():
+            row = existing.get(ticker)
+            if row is None:
+                inserts.append(
+                    {
+                        "id": uuid4(),
+                        "ticker": ticker,
+                        "name": name,
+                        "name_choseong": to_choseong(name),
+                        "country": country,
+                        "market": market,
+                        "is_active": True,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                )
+            elif (row.name, row.market, row.country, row.is_active) != (
+                name,
+                market,
+                country,
+                True,
+            ):
+                updates.append(
+                    {
+                        "id": row.id,
+                        "name": name,
+                        "name_choseong": to_choseong(name),
+                        "market": market,
+                        "country": country,
+                        "is_active": True,
+                        "updated_at": now,
+                    }
+                )
+        if deactivate_missing:
+            deactivations = [
+                row.id
+                for ticker, row in existing.items()
+                if ticker not in listing
+                and row.is_active is not False
+                and (row.country, row.market) == (country, market)
+            ]
+
+        if inserts:
+            await self.db.execute(insert(Stock), inserts)
+        if updates:
+            await self.db.execute(update(Stock), updates)
+        if deactivations:
+            await self.db.execute(
+                update(Stock)
+                .where(Stock.id.in_(deactivations))
+                .values(is_active=False, updated_at=now)
+            )
+        await commit(self.db)
+
+        return {
+            "inserted": len(inserts),
+            "updated": len(updates),
+            "deactivated": len(deactivations),
+            "unchanged": len(listing) - len(inserts) - len(updates),
+        }
+
     async def delete(self, stock_id: UUID) -> bool:
         """주식을 삭제합니다."""
         stock = await self.get_by_id(stock_id)
         if stock:
             await self.db.delete(stock)
-            await self.db.commit()
+            await commit(self.db)
             return True
         return False
@@ -0,0 +1,117 @@
+from datetime import datetime
+from typing import List, Sequence
+
+from sqlalchemy import Row, case, delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.stock import Stock
+from src.models.stock_stats import StockStats
+
+
+# 마지막 봉 날짜 기준 최근 52주 고가/저가를 다시 계산합니다.
+REFRESH_52W_SQL = """
+UPDATE stock_stats s
+SET high_52w = w.high_52w, low_52w = w.low_52w
+FROM (
+    SELECT st.stock_key, max(p.high) AS high_52w, min(p.low) AS low_52w
+    FROM stock_stats st
+    JOIN price p
+      ON p.stock_key = st.stock_key AND p.date > st.last_date - 364
+    WHERE st.stock_key = ANY(:stock_keys)
+    GROUP BY st.stock_key
+) w
+WHERE s.stock_key = w.stock_key
+"""
+
+# price 전체를 스캔해 요약을 새로 만듭니다 (삭제처럼 증분 갱신이 안 되는 경우).
+REBUILD_SQL = """
+WITH agg AS (
+    SELECT stock_key, min(date) AS first_date, max(date) AS last_date,
+           count(*) AS bar_count
+    FROM price
+    WHERE stock_key = ANY(:stock_keys)
+    GROUP BY stock_key
+)
+INSERT INTO stock_stats (
+    stock_key, first_date, last_date, bar_count, last_close, last_volume,
+    high_52w, low_52w, updated_at
+)
+SELECT a.stock_key, a.first_date, a.last_date, a.bar_count, l.close, l.volume,
+       w.high_52w, w.low_52w, timezone('utc', now())
+FROM agg a
+JOIN price l ON l.stock_key = a.stock_key AND l.date = a.last_date
+CROSS JOIN LATERAL (
+    SELECT max(p.high) AS high_52w, min(p.low) AS low_52w
+    FROM price p
+    WHERE p.stock_key = a.stock_key AND p.date > a.last_date - 364
+) w
+"""
+
+
+class StockStatsRepository:
+    """종목별 가격 요약 저장소
+
+    쓰기 메서드는 커밋하지 않으므로 가격 저장과 같은 트랜잭션 안에서 호출합니다.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_universe(self) -> List[Row]:
+        """전체 종목의 티커와 가격 요약을 한 번의 쿼리로 가져옵니다."""
+        result = await self.session.execute(
+            select(Stock.id, Stock.ticker, Stock.name, StockStats)
+            .join(StockStats, StockStats.stock_key == Stock.price_key)
+            .order_by(Stock.ticker)
+        )
+        return result.all()
+
+    async def apply_deltas(self, deltas: Sequence[dict]) -> None:
+        """새로 저장된 봉의 요약(delta)을 기존 요약에 합칩니다.
+
+        delta는 stock_key, first_date, last_date, bar_count(새로 삽입된 봉 수),
+        last_close, last_volume(delta 구간 마지막 봉)을 가집니다.
+        """
+        if not deltas:
+            return
+        now = datetime.utcnow()
+        stmt = insert(StockStats).values(
+            [{**delta, "updated_at": now} for delta in deltas]
+        )
+        newer = stmt.excluded.last_date >= StockStats.last_date
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[StockStats.stock_key],
+            set_={
+                "first_date": func.least(
+                    StockStats.first_date, stmt.excluded.first_date
+                ),
+                "last_date": func.greatest(
+                    StockStats.last_date, stmt.excluded.last_date
+                ),
+                "bar_count": StockStats.bar_count + stmt.excluded.bar_count,
+                "last_close": case(
+                    (newer, stmt.excluded.last_close), else_=StockStats.last_close
+                ),
+                "last_volume": case(
+                    (newer, stmt.excluded.last_volume), else_=StockStats.last_volume
+                ),
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await self.session.execute(stmt)
+        await self.refresh_52w([delta["stock_key"] for delta in deltas])
+
+    async def refresh_52w(self, stock_keys: Sequence[int]) -> None:
+        """52주 고가/저가를 다시 계산합니다 (종목당 1년치 인덱스 범위만 읽음)."""
+        await self.session.execute(
+            text(REFRESH_52W_SQL), {"stock_keys": list(stock_keys)}
+        )
+
+    async def rebuild(self, stock_keys: Sequence[int]) -> None:
+        """price를 다시 집계해 요약을 만들고, 봉이 없는 종목의 요약은 지웁니다."""
+        stock_keys = list(stock_keys)
+        await self.session.execute(
+            delete(StockStats).where(StockStats.stock_key.in_(stock_keys))
+        )
+        await self.session.execute(text(REBUILD_SQL), {"stock_keys": stock_keys})
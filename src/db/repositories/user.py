@@ -4,6 +4,7 @@ import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from src.db.unit_of_work import commit
 from src.models.user import User
 from src.schemas.user import UserCreate, UserUpdate
 from src.core.security import get_password_hash
@@ -44,8 +45,7 @@ class UserRepository:
             is_superuser=False,
         )
         self.db.add(db_user)
-        await self.db.commit()
-        await self.db.refresh(db_user)
+        await commit(self.db)
         return db_user
 
     async def update(self, user: User, user_in: UserUpdate) -> User:
@@ -57,11 +57,10 @@ class UserRepository:
             )
         for field, value in update_data.items():
             setattr(user, field, value)
-        await self.db.commit()
-        await self.db.refresh(user)
+        await commit(self.db)
         return user
 
     async def delete(self, user: User) -> None:
         """사용자를 삭제합니다."""
         await self.db.delete(user)
-        await self.db.commit()
+        await commit(self.db)
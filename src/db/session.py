@@ -1,27 +1,139 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from src.core.config import settings
+from src.db.pool import InstrumentedPool
+
+
+logger = logging.getLogger(__name__)
+
+# 복제본 세션임을 표시하는 session.info 키 (복제본에서 읽은 결과는 캐시하지 않습니다)
+REPLICA_KEY = "replica"
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    """풀 설정은 ENVIRONMENT별 기본값 또는 DB_POOL_* 환경 변수를 따릅니다."""
+    return create_async_engine(
+        url,
+        echo=settings.DB_ECHO,
+        future=True,
+        poolclass=InstrumentedPool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args={
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        },
+    )
+
+
+def _create_session_factory(
+    bind: AsyncEngine, info: Optional[dict] = None
+) -> sessionmaker:
+    return sessionmaker(
+        bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+        info=info,
+    )
 
 
 # Async engine 생성
-engine = create_async_engine(
-    settings.SQLALCHEMY_DATABASE_URI,
-    echo=settings.DB_ECHO,
-    future=True,
-)
+engine = _create_engine(settings.SQLALCHEMY_DATABASE_URI)
 
 # Async session factory 생성
-AsyncSessionLocal = sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
+AsyncSessionLocal = _create_session_factory(engine)
+
+# 읽기 전용 복제본 engine (설정된 경우에만)
+read_engine: Optional[AsyncEngine] = (
+    _create_engine(settings.REPLICA_DATABASE_URI)
+    if settings.REPLICA_DATABASE_URI
+    else None
+)
+ReadSessionLocal = (
+    _create_session_factory(read_engine, info={REPLICA_KEY: True})
+    if read_engine
+    else None
+)
+
+# 복제본이 primary를 따라잡았으면 0, 아니면 마지막 재생 트랜잭션 이후 경과 시간(초)
+REPLICA_LAG_SQL = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+END
+"""
+
+
+class ReplicaMonitor:
+    """복제본 접속 가능 여부와 복제 지연을 주기적으로 확인합니다."""
+
+    def __init__(self, max_lag_seconds: float, check_interval_seconds: float):
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.available = False
+        self.lag_seconds: Optional[float] = None
+        self._checked_at = float("-inf")
+
+    async def is_available(self) -> bool:
+        """확인 주기 안에서는 직전 결과를 재사용합니다."""
+        if read_engine is None:
+            return False
+        if time.monotonic() - self._checked_at < self.check_interval_seconds:
+            return self.available
+
+        self._checked_at = time.monotonic()
+        try:
+            async with read_engine.connect() as conn:
+                lag = await conn.scalar(text(REPLICA_LAG_SQL))
+            self.lag_seconds = float(lag) if lag is not None else None
+            self.available = (
+                self.lag_seconds is not None
+                and self.lag_seconds <= self.max_lag_seconds
+            )
+            if not self.available:
+                logger.warning(
+                    f"Replica lagging ({self.lag_seconds}s), reading from primary"
+                )
+        except Exception as e:
+            self.available = False
+            self.lag_seconds = None
+            logger.warning(f"Replica unavailable, reading from primary: {str(e)}")
+        return self.available
+
+
+replica_monitor = ReplicaMonitor(
+    settings.REPLICA_MAX_LAG_SECONDS, settings.REPLICA_HEALTH_CHECK_SECONDS
 )
 
 
+@asynccontextmanager
+async def read_session(use_replica: bool = True) -> AsyncIterator[AsyncSession]:
+    """읽기 전용 세션을 제공합니다.
+
+    복제본이 설정되어 있고 지연이 허용 범위 안이면 복제본으로, 아니면 primary로
+    연결합니다. 방금 쓴 데이터를 읽어야 하면 use_replica=False로 호출합니다.
+    """
+    factory = AsyncSessionLocal
+    if use_replica and ReadSessionLocal is not None:
+        if await replica_monitor.is_available():
+            factory = ReadSessionLocal
+    async with factory() as session:
+        yield session
+
+
 async def get_db():
     """데이터베이스 세션을 제공하는 의존성 함수"""
     async with AsyncSessionLocal() as session:
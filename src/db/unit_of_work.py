@@ -0,0 +1,93 @@
+from typing import Callable, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+# session.info에 진행 중인 UnitOfWork의 커밋 후 콜백 목록을 보관하는 키
+UOW_KEY = "unit_of_work"
+
+
+class UnitOfWork:
+    """여러 저장소의 쓰기를 하나의 트랜잭션으로 묶습니다.
+
+    블록 안에서는 저장소 쓰기 메서드가 커밋하지 않고 flush만 하며, 블록이 정상
+    종료되면 한 번 커밋하고 예외가 나면 롤백합니다. 이미 UnitOfWork가 열린 세션에서
+    다시 열면 바깥 트랜잭션에 합류합니다.
+
+        async with UnitOfWork(db) as uow:
+            for frame in frames:
+                await PriceRepository(db).bulk_upsert(stock.price_key, frame)
+            await StockRepository(db).mark_synced(stock.id, synced_at)
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._owner = False
+
+    async def __aenter__(self) -> "UnitOfWork":
+        if UOW_KEY not in self.session.info:
+            self.session.info[UOW_KEY] = []
+            self._owner = True
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if not self._owner:
+            return
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            self.session.info.pop(UOW_KEY, None)
+            self._owner = False
+
+    async def commit(self) -> None:
+        """지금까지의 쓰기를 커밋하고 등록된 커밋 후 작업을 실행합니다.
+
+        긴 작업은 블록 안에서 중간중간 호출해 배치 단위로 커밋할 수 있습니다.
+        """
+        try:
+            await self.session.commit()
+        except Exception:
+            await self.rollback()
+            raise
+        callbacks = self.session.info.get(UOW_KEY, [])
+        self.session.info[UOW_KEY] = []
+        for callback in callbacks:
+            callback()
+
+    async def rollback(self) -> None:
+        """쓰기를 취소하고 등록된 커밋 후 작업도 버립니다."""
+        await self.session.rollback()
+        if UOW_KEY in self.session.info:
+            self.session.info[UOW_KEY] = []
+
+
+def _callbacks(session: AsyncSession) -> Optional[List[Callable[[], None]]]:
+    return session.info.get(UOW_KEY)
+
+
+def in_unit_of_work(session: AsyncSession) -> bool:
+    """세션이 UnitOfWork 안에 있는지 여부"""
+    return _callbacks(session) is not None
+
+
+async def commit(session: AsyncSession) -> None:
+    """UnitOfWork 안이면 flush만 하고, 밖이면 바로 커밋합니다."""
+    if _callbacks(session) is None:
+        await session.commit()
+    else:
+        await session.flush()
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """트랜잭션이 커밋된 뒤에 실행할 작업(캐시 무효화 등)을 등록합니다.
+
+    UnitOfWork 밖에서는 commit()이 이미 커밋했으므로 바로 실행합니다.
+    """
+    callbacks = _callbacks(session)
+    if callbacks is None:
+        callback()
+    else:
+        callbacks.append(callback)
@@ -1,13 +1,17 @@
 import logging
+from datetime import date
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from nicegui import ui
 from starlette.middleware.sessions import SessionMiddleware
 
-from src.api.endpoints import auth
+from src.api.endpoints import auth, internal
 from src.core.config import settings
 from src.core.middleware import AuthenticationMiddleware
+from src.db.repositories.price import PriceRepository
+from src.db.session import AsyncSessionLocal
+from src.services.price_sync_worker import price_sync_worker
 from src.ui.login import create_login_page
 from src.ui.register import create_register_page
 from src.ui.stock import stock_detail_page
@@ -38,6 +42,28 @@ app.add_middleware(SessionMiddleware, secret_key=settings.SECRET_KEY)
 
 # API 라우터 등록
 app.include_router(auth.router, prefix=settings.API_V1_STR)
+app.include_router(internal.router, prefix=settings.API_V1_STR)
+
+
+# 올해와 내년 price 파티션 준비
+@app.on_event("startup")
+async def ensure_price_partitions():
+    year = date.today().year
+    async with AsyncSessionLocal() as db:
+        await PriceRepository(db).ensure_partitions([year, year + 1])
+
+
+# 백그라운드 가격 동기화 작업 (advisory lock을 잡은 프로세스 하나만 실제로 동기화)
+@app.on_event("startup")
+async def start_price_sync_worker():
+    if settings.PRICE_SYNC_ENABLED:
+        price_sync_worker.start()
+
+
+@app.on_event("shutdown")
+async def stop_price_sync_worker():
+    await price_sync_worker.stop()
+
 
 # 다크 모드 설정
 ui.dark_mode(True)
@@ -139,8 +165,8 @@ def stocks_page():
 
 # 테스트 페이지 등록
 @ui.page("/test")
-def test_page():
-    create_test_page()
+async def test_page():
+    await create_test_page()
 
 
 # 3. NiceGUI를 FastAPI 앱과 함께 실행
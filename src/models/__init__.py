@@ -1,5 +1,17 @@
 from src.models.base import BaseModel
 from src.models.stock import Stock
 from src.models.price import Price
+from src.models.price_coverage import PriceCoverage
+from src.models.price_quarantine import PriceQuarantine
+from src.models.stock_stats import StockStats
+from src.models.job import Job
 
-__all__ = ["BaseModel", "Stock", "Price"]
+__all__ = [
+    "BaseModel",
+    "Stock",
+    "Price",
+    "PriceCoverage",
+    "PriceQuarantine",
+    "StockStats",
+    "Job",
+]
@@ -9,6 +9,9 @@ Base = declarative_base()
 
 class BaseModel(Base):
     __abstract__ = True
+    # INSERT/UPDATE의 RETURNING으로 서버 생성 값(Identity, server_default)을 받아
+    # 쓰기 후 session.refresh가 필요 없도록 합니다.
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,43 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from src.models.base import BaseModel
+
+
+class JobStatus:
+    """작업 상태 값"""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class Job(BaseModel):
+    """수집 작업 큐 모델
+
+    작업자는 SELECT ... FOR UPDATE SKIP LOCKED로 작업을 가져가고,
+    실행 중에는 heartbeat_at을 갱신하며 진행 상황을 checkpoint에 기록합니다.
+    """
+
+    __tablename__ = "jobs"
+
+    kind = Column(String(50), nullable=False)
+    payload = Column(JSONB, nullable=False, default=dict)
+    status = Column(String(20), nullable=False, default=JobStatus.QUEUED)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    run_after = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_by = Column(String(100), nullable=True)
+    locked_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    checkpoint = Column(JSONB, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    # 인덱스 설정
+    __table_args__ = (Index("ix_jobs_status_run_after", "status", "run_after"),)
+
+    def __repr__(self):
+        return f"<Job(id={self.id}, kind={self.kind}, status={self.status})>"
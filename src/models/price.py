@@ -1,39 +1,55 @@
-from datetime import datetime
-
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Date,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+)
 from sqlalchemy.orm import relationship
 
-from src.models.base import BaseModel
+from src.models.base import Base
+
 
+class Price(Base):
+    """주식 가격 데이터 모델
 
-class Price(BaseModel):
-    """주식 가격 데이터 모델"""
+    일봉 한 행이 작도록 UUID 대신 `stocks.price_key`(int4)를 쓰고, 감사용 타임스탬프는
+    두지 않습니다. 컬럼 순서는 정렬 패딩이 생기지 않도록 4바이트 컬럼을 앞에 둡니다.
+    """
 
     __tablename__ = "price"
 
-    id = Column(Integer, primary_key=True, index=True)
-    stock_id = Column(
-        UUID(as_uuid=True), ForeignKey("stocks.id", ondelete="CASCADE"), nullable=False
+    stock_key = Column(
+        Integer, ForeignKey("stocks.price_key", ondelete="CASCADE"), nullable=False
     )
-    date = Column(DateTime, nullable=False)
+    date = Column(Date, nullable=False)
     open = Column(Float, nullable=False)
     high = Column(Float, nullable=False)
     low = Column(Float, nullable=False)
     close = Column(Float, nullable=False)
-    volume = Column(Integer, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
-    )
+    volume = Column(BigInteger, nullable=False)
 
     # 관계 설정
     stock = relationship("Stock", back_populates="prices", lazy="joined")
 
-    # 인덱스 설정
-    __table_args__ = (Index("ix_price_stock_date", "stock_id", "date", unique=True),)
+    # 인덱스 설정 (date 기준 연도별 범위 파티션)
+    # 기본 키는 OHLCV를 INCLUDE한 커버링 인덱스라 종목/기간 조회가 index-only scan이 되고,
+    # BRIN 인덱스는 특정 일자 전 종목 조회에 씁니다.
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "stock_key",
+            "date",
+            name="price_pkey",
+            postgresql_include=["open", "high", "low", "close", "volume"],
+        ),
+        Index("ix_price_date_brin", "date", postgresql_using="brin"),
+        {"postgresql_partition_by": "RANGE (date)"},
+    )
 
     def __repr__(self):
         return (
-            f"<Price(stock_id={self.stock_id}, date={self.date}, close={self.close})>"
+            f"<Price(stock_key={self.stock_key}, date={self.date}, close={self.close})>"
         )
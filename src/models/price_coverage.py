@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.models.base import BaseModel
+
+
+class PriceCoverage(BaseModel):
+    """종목별로 이미 가져온 가격 데이터 구간 (시작일, 종료일 포함)"""
+
+    __tablename__ = "price_coverage"
+
+    stock_id = Column(
+        UUID(as_uuid=True), ForeignKey("stocks.id", ondelete="CASCADE"), nullable=False
+    )
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=False)
+    # 구간의 마지막 날이 수집 당일이면 장중 데이터일 수 있으므로 수집 시각을 기록합니다.
+    fetched_at = Column(DateTime, default=datetime.now, nullable=False)
+
+    # 인덱스 설정
+    __table_args__ = (Index("ix_price_coverage_stock_start", "stock_id", "start_date"),)
+
+    def __repr__(self):
+        return (
+            f"<PriceCoverage(stock_id={self.stock_id}, "
+            f"start_date={self.start_date}, end_date={self.end_date})>"
+        )
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.models.base import BaseModel
+
+
+class PriceQuarantine(BaseModel):
+    """검증을 통과하지 못해 price 테이블에 저장하지 않은 원본 가격 데이터"""
+
+    __tablename__ = "price_quarantine"
+
+    stock_id = Column(
+        UUID(as_uuid=True), ForeignKey("stocks.id", ondelete="CASCADE"), nullable=False
+    )
+    date = Column(DateTime, nullable=False)
+    # 원본 값을 그대로 보관하기 위해 NaN/음수도 허용합니다.
+    open = Column(Float, nullable=True)
+    high = Column(Float, nullable=True)
+    low = Column(Float, nullable=True)
+    close = Column(Float, nullable=True)
+    volume = Column(Float, nullable=True)
+    reasons = Column(Integer, nullable=False)
+    reason = Column(String(200), nullable=False)
+
+    # 인덱스 설정
+    __table_args__ = (Index("ix_price_quarantine_stock_date", "stock_id", "date"),)
+
+    def __repr__(self):
+        return (
+            f"<PriceQuarantine(stock_id={self.stock_id}, date={self.date}, "
+            f"reason={self.reason})>"
+        )
@@ -1,10 +1,11 @@
 from datetime import datetime
 import uuid
 
-from sqlalchemy import Boolean, Column, DateTime, Index, String
+from sqlalchemy import Boolean, Column, DateTime, Identity, Index, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 
+from src.core.hangul import to_choseong
 from src.models.base import BaseModel
 
 
@@ -14,8 +15,12 @@ class Stock(BaseModel):
     __tablename__ = "stocks"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    # price 테이블 전용 4바이트 대리 키
+    price_key = Column(Integer, Identity(), unique=True, nullable=False)
     ticker = Column(String(20), unique=True, index=True, nullable=False)
     name = Column(String(100), nullable=False)
+    # 초성 검색용 종목명 (name을 바꾸면 자동으로 다시 계산됩니다)
+    name_choseong = Column(String(100), nullable=True)
     industry = Column(String(100), nullable=True)
     market = Column(String(50), nullable=False)
     country = Column(String(50), nullable=False)
@@ -26,14 +31,38 @@ class Stock(BaseModel):
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
     )
 
-    # 관계 설정
-    prices = relationship("Price", back_populates="stock", lazy="selectin")
+    # 관계 설정 (가격 데이터는 selectinload(Stock.prices)로 명시적으로 불러옵니다)
+    prices = relationship("Price", back_populates="stock", lazy="raise")
 
     # 인덱스 설정
     __table_args__ = (
         Index("ix_stocks_ticker", "ticker", unique=True),
         Index("ix_stocks_name", "name"),
+        # pg_trgm 부분 일치/유사도 검색용 GIN 인덱스
+        Index(
+            "ix_stocks_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_stocks_ticker_trgm",
+            "ticker",
+            postgresql_using="gin",
+            postgresql_ops={"ticker": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_stocks_name_choseong_trgm",
+            "name_choseong",
+            postgresql_using="gin",
+            postgresql_ops={"name_choseong": "gin_trgm_ops"},
+        ),
     )
 
+    @validates("name")
+    def _set_name_choseong(self, key, name):
+        self.name_choseong = to_choseong(name) if name is not None else None
+        return name
+
     def __repr__(self):
         return f"<Stock(ticker={self.ticker}, name={self.name})>"
@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, Date, DateTime, Float, ForeignKey, Integer
+
+from src.models.base import Base
+
+
+class StockStats(Base):
+    """종목별 가격 요약 (가격 저장 트랜잭션 안에서 증분 갱신)
+
+    DB의 price 테이블에 있는 봉만 집계하며 보관소(PRICE_ARCHIVE_DIR)로 옮겨
+    삭제된 봉은 포함하지 않습니다. 52주 고가/저가는 마지막 봉 날짜 기준 최근 52주
+    구간의 값입니다.
+    """
+
+    __tablename__ = "stock_stats"
+
+    stock_key = Column(
+        Integer, ForeignKey("stocks.price_key", ondelete="CASCADE"), primary_key=True
+    )
+    first_date = Column(Date, nullable=False)
+    last_date = Column(Date, nullable=False)
+    bar_count = Column(BigInteger, nullable=False)
+    last_close = Column(Float, nullable=False)
+    last_volume = Column(BigInteger, nullable=False)
+    high_52w = Column(Float, nullable=True)
+    low_52w = Column(Float, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<StockStats(stock_key={self.stock_key}, last_date={self.last_date}, "
+            f"bar_count={self.bar_count})>"
+        )
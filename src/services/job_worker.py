@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import os
+import socket
+from datetime import date, datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence
+
+from src.db.repositories.job import JobRepository
+from src.db.repositories.stock import StockRepository
+from src.db.session import AsyncSessionLocal
+from src.db.unit_of_work import UnitOfWork
+from src.models.job import Job
+from src.services.listing_service import ListingService
+from src.services.price_service import PriceService
+
+
+logger = logging.getLogger(__name__)
+
+
+class JobContext:
+    """작업 핸들러에 전달되는 실행 정보"""
+
+    def __init__(self, job: Job, worker_id: str):
+        self.job = job
+        self.worker_id = worker_id
+        self.payload: Dict[str, Any] = job.payload or {}
+        self.checkpoint: Dict[str, Any] = dict(job.checkpoint or {})
+
+    async def save_checkpoint(self, **values: Any) -> None:
+        """재개 지점을 갱신합니다. 작업이 다시 실행되면 이 값부터 이어갑니다."""
+        self.checkpoint.update(values)
+        async with AsyncSessionLocal() as db:
+            await JobRepository(db).save_checkpoint(self.job.id, self.checkpoint)
+
+
+JobHandler = Callable[[JobContext], Awaitable[None]]
+
+HANDLERS: Dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """작업 종류별 핸들러를 등록하는 데코레이터"""
+
+    def register(func: JobHandler) -> JobHandler:
+        HANDLERS[kind] = func
+        return func
+
+    return register
+
+
+@job_handler("listing_sync")
+async def run_listing_sync(ctx: JobContext) -> None:
+    """payload: {"country": "KR", "market": "ETF"}"""
+    country = ctx.payload.get("country", "KR")
+    market = ctx.payload.get("market", "ETF")
+    async with AsyncSessionLocal() as db:
+        service = ListingService(db)
+        if (country, market) == ("KR", "ETF"):
+            summary = await service.sync_kr_etfs()
+        else:
+            summary = await service.sync_tracked(country, market)
+    logger.info(f"Listing sync {country}/{market}: {summary}")
+
+
+@job_handler("backfill")
+async def run_backfill(ctx: JobContext) -> None:
+    """payload: {"ticker": "069500", "start": "2015-01-01", "end": "2024-12-31"}
+
+    1년 단위로 가져오며 구간마다 checkpoint의 last_date를 갱신합니다.
+    """
+    ticker = ctx.payload["ticker"]
+    start = date.fromisoformat(ctx.payload.get("start", "2015-01-01"))
+    end = (
+        date.fromisoformat(ctx.payload["end"])
+        if ctx.payload.get("end")
+        else date.today()
+    )
+    if ctx.checkpoint.get("last_date"):
+        start = date.fromisoformat(ctx.checkpoint["last_date"]) + timedelta(days=1)
+
+    async with AsyncSessionLocal() as db:
+        stock = await StockRepository(db).get_by_ticker(ticker)
+        if stock is None:
+            raise ValueError(f"Unknown ticker: {ticker}")
+
+        service = PriceService(db)
+        chunk_start = start
+        while chunk_start <= end:
+            chunk_end = min(end, chunk_start.replace(month=12, day=31))
+            await service.sync_range(stock, chunk_start, chunk_end)
+            await ctx.save_checkpoint(last_date=chunk_end.isoformat())
+            chunk_start = chunk_end + timedelta(days=1)
+
+
+@job_handler("daily_update")
+async def run_daily_update(ctx: JobContext) -> None:
+    """payload: {"lookback_days": 10}
+
+    활성 종목마다 최근 구간 backfill 작업을 만들어 여러 작업자에 분산시킵니다.
+    """
+    lookback = timedelta(days=ctx.payload.get("lookback_days", 10))
+    start = (date.today() - lookback).isoformat()
+    async with AsyncSessionLocal() as db:
+        stocks = await StockRepository(db).get_active()
+        job_repo = JobRepository(db)
+        # 모든 작업을 한 번에 커밋해 일부만 등록되는 일이 없도록 합니다.
+        async with UnitOfWork(db):
+            for stock in stocks:
+                await job_repo.enqueue(
+                    "backfill", {"ticker": stock.ticker, "start": start}
+                )
+    logger.info(f"Daily update fanned out to {len(stocks)} backfill jobs")
+
+
+class JobWorker:
+    """jobs 테이블에서 작업을 가져와 실행하는 작업자
+
+    여러 프로세스(또는 여러 호스트)에서 동시에 실행해도 SKIP LOCKED 덕분에
+    같은 작업을 두 번 가져가지 않습니다.
+    """
+
+    def __init__(
+        self,
+        kinds: Optional[Sequence[str]] = None,
+        concurrency: int = 1,
+        poll_interval: float = 5.0,
+        heartbeat_interval: float = 30.0,
+    ):
+        self.kinds = list(kinds) if kinds else None
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+    async def run(self, stop_event: Optional[asyncio.Event] = None) -> None:
+        """stop_event가 설정될 때까지 작업을 처리합니다."""
+        stop_event = stop_event or asyncio.Event()
+        await asyncio.gather(
+            *(
+                self._loop(f"{self.worker_id}:{slot}", stop_event)
+                for slot in range(self.concurrency)
+            )
+        )
+
+    async def _loop(self, worker_id: str, stop_event: asyncio.Event) -> None:
+        while not stop_event.is_set():
+            async with AsyncSessionLocal() as db:
+                job = await JobRepository(db).claim(worker_id, self.kinds)
+            if job is None:
+                try:
+                    await asyncio.wait_for(stop_event.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self.run_job(job, worker_id)
+
+    async def run_job(self, job: Job, worker_id: str) -> None:
+        """작업 하나를 heartbeat와 함께 실행하고 결과를 기록합니다."""
+        handler = HANDLERS.get(job.kind)
+        started = datetime.now()
+        task = asyncio.create_task(
+            handler(JobContext(job, worker_id))
+            if handler
+            else self._unknown_kind(job.kind)
+        )
+        heartbeat = asyncio.create_task(self._heartbeat(job.id, worker_id, task))
+        try:
+            await task
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                # 작업자 자체가 종료되는 경우: heartbeat가 끊기면 다른 작업자가 재개합니다.
+                raise
+            logger.warning(f"Job {job.id} lost its lease and was cancelled")
+            return
+        except Exception as e:
+            logger.error(f"Job {job.id} ({job.kind}) failed: {str(e)}")
+            async with AsyncSessionLocal() as db:
+                if not await JobRepository(db).fail(job, worker_id, str(e)):
+                    logger.warning(f"Job {job.id} was taken over, failure not recorded")
+            return
+        finally:
+            heartbeat.cancel()
+
+        async with AsyncSessionLocal() as db:
+            if not await JobRepository(db).complete(job.id, worker_id):
+                logger.warning(f"Job {job.id} was taken over, result not recorded")
+                return
+        logger.info(
+            f"Job {job.id} ({job.kind}) done in "
+            f"{(datetime.now() - started).total_seconds():.1f}s"
+        )
+
+    async def _heartbeat(self, job_id: int, worker_id: str, task: asyncio.Task) -> None:
+        while not task.done():
+            await asyncio.sleep(self.heartbeat_interval)
+            async with AsyncSessionLocal() as db:
+                if not await JobRepository(db).heartbeat(job_id, worker_id):
+                    task.cancel()
+                    return
+
+    @staticmethod
+    async def _unknown_kind(kind: str) -> None:
+        raise ValueError(f"No handler registered for job kind: {kind}")
@@ -0,0 +1,64 @@
+import logging
+from typing import Dict, Optional, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.repositories.stock import StockRepository
+from src.services.market_data import MarketDataProvider, get_market_data_provider
+from src.services.market_data.metadata import fetch_infos, infos_to_listing
+
+
+logger = logging.getLogger(__name__)
+
+# 국가/시장별로 추적할 종목 목록. 새 시장은 티커 목록만 추가하면 됩니다.
+TRACKED_TICKERS: Dict[Tuple[str, str], Sequence[str]] = {
+    ("CA", "TSX"): [
+        # 레버리지 ETF
+        "HXU.TO",  # Horizons S&P/TSX 60 Bull Plus ETF (2x)
+        "HXD.TO",  # Horizons S&P/TSX 60 Bear Plus ETF (-2x)
+    ],
+}
+
+
+class ListingService:
+    """종목 목록 동기화 서비스"""
+
+    def __init__(self, db: AsyncSession, provider: Optional[MarketDataProvider] = None):
+        self.db = db
+        self.provider = provider or get_market_data_provider()
+        self.stock_repo = StockRepository(db)
+
+    async def sync_kr_etfs(
+        self, prefixes: Tuple[str, ...] = ("KODEX", "TIGER")
+    ) -> Dict[str, int]:
+        """KRX ETF 목록 중 지정한 브랜드만 동기화합니다."""
+        listing = await self.provider.get_listing("ETF/KR")
+        listing = listing[listing["Name"].str.startswith(prefixes, na=False)]
+        return await self.stock_repo.sync_listing(listing, country="KR", market="ETF")
+
+    async def sync_tickers(
+        self, tickers: Sequence[str], country: str, market: str
+    ) -> Dict[str, int]:
+        """티커 목록의 메타데이터를 동시에 가져와 동기화합니다.
+
+        일부 티커를 가져오지 못하면 그 티커가 비활성화되지 않도록
+        이번 동기화에서는 비활성화를 건너뜁니다.
+        """
+        infos, failures = await fetch_infos(self.provider, tickers)
+        for ticker, error in failures.items():
+            logger.error(f"Failed to fetch info for {ticker}: {error}")
+
+        summary = await self.stock_repo.sync_listing(
+            infos_to_listing(infos),
+            country=country,
+            market=market,
+            deactivate_missing=not failures,
+        )
+        summary["failed"] = len(failures)
+        return summary
+
+    async def sync_tracked(self, country: str, market: str) -> Dict[str, int]:
+        """TRACKED_TICKERS에 등록된 국가/시장을 동기화합니다."""
+        return await self.sync_tickers(
+            TRACKED_TICKERS[(country, market)], country=country, market=market
+        )
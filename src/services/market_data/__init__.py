@@ -0,0 +1,44 @@
+from functools import lru_cache
+
+from src.core.config import settings
+from src.services.market_data.base import (
+    MarketDataProvider,
+    ThreadPoolMarketDataProvider,
+)
+from src.services.market_data.cache import (
+    CachedMarketDataProvider,
+    ParquetResponseCache,
+)
+from src.services.market_data.fake import FakeMarketDataProvider
+
+
+@lru_cache
+def get_market_data_provider() -> MarketDataProvider:
+    """설정(MARKET_DATA_PROVIDER)에 맞는 프로세스 공용 제공자를 반환합니다."""
+    if settings.MARKET_DATA_PROVIDER == "fake":
+        return FakeMarketDataProvider()
+
+    from src.services.market_data.fdr import FinanceDataReaderProvider
+
+    provider = FinanceDataReaderProvider(
+        max_workers=settings.MARKET_DATA_MAX_WORKERS,
+        timeout=settings.MARKET_DATA_TIMEOUT_SECONDS,
+    )
+    if not settings.MARKET_DATA_CACHE_DIR:
+        return provider
+
+    cache = ParquetResponseCache(
+        settings.MARKET_DATA_CACHE_DIR,
+        max_bytes=settings.MARKET_DATA_CACHE_MAX_MB * 1024 * 1024,
+    )
+    return CachedMarketDataProvider(provider, cache, source="fdr")
+
+
+__all__ = [
+    "MarketDataProvider",
+    "ThreadPoolMarketDataProvider",
+    "CachedMarketDataProvider",
+    "ParquetResponseCache",
+    "FakeMarketDataProvider",
+    "get_market_data_provider",
+]
@@ -0,0 +1,57 @@
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import partial
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import pandas as pd
+
+
+T = TypeVar("T")
+
+
+class MarketDataProvider(ABC):
+    """시세/종목 정보 제공자 인터페이스
+
+    가격 DataFrame은 FinanceDataReader와 같은 형식(DatetimeIndex, Open/High/Low/
+    Close/Volume 컬럼)을 따릅니다.
+    """
+
+    @abstractmethod
+    async def get_prices(
+        self, symbol: str, start: date, end: Optional[date] = None
+    ) -> pd.DataFrame:
+        """기간 내 일봉 데이터를 가져옵니다."""
+
+    @abstractmethod
+    async def get_listing(self, market: str) -> pd.DataFrame:
+        """시장별 종목 목록을 가져옵니다 (예: "ETF/KR")."""
+
+    @abstractmethod
+    async def get_info(self, symbol: str) -> Dict[str, Any]:
+        """개별 종목의 메타데이터를 가져옵니다."""
+
+
+class ThreadPoolMarketDataProvider(MarketDataProvider):
+    """동기 라이브러리 호출을 제한된 스레드 풀에서 실행하는 제공자 기반 클래스
+
+    각 호출은 `timeout`초 안에 끝나지 않으면 asyncio.TimeoutError를 발생시킵니다.
+    호출하는 쪽 태스크가 취소되면 아직 시작하지 않은 작업은 실행되지 않고,
+    이미 실행 중인 스레드의 결과는 버려집니다.
+    """
+
+    def __init__(self, max_workers: int, timeout: float):
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="market-data"
+        )
+
+    async def _call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+        return await asyncio.wait_for(future, timeout=self.timeout)
+
+    def shutdown(self) -> None:
+        """대기 중인 작업을 취소하고 스레드 풀을 종료합니다."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,206 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.services.market_data.base import MarketDataProvider
+
+
+logger = logging.getLogger(__name__)
+
+# 데이터 종류별 캐시 유효 기간
+DEFAULT_TTLS: Dict[str, timedelta] = {
+    # 과거 구간의 일봉은 바뀌지 않으므로 길게 보관합니다.
+    "prices": timedelta(days=30),
+    # 오늘을 포함하는 구간은 장중 값이 바뀌므로 짧게 보관합니다.
+    "prices_recent": timedelta(minutes=15),
+    "listing": timedelta(days=1),
+    "info": timedelta(days=7),
+}
+
+# 저장 시점에 정한 TTL 종류를 기록하는 Parquet 스키마 메타데이터 키
+TTL_KIND_METADATA_KEY = b"ttl_kind"
+
+
+class ParquetResponseCache:
+    """제공자 원본 응답을 Parquet 파일로 저장하는 디스크 캐시
+
+    키는 (source, kind, symbol, range)이며 파일 mtime은 저장 시각(TTL 판단),
+    atime은 마지막 사용 시각(LRU 판단)으로 씁니다. 적용할 TTL 종류는 저장할 때
+    정해 파일 메타데이터에 기록합니다. 전체 크기가 `max_bytes`를 넘으면 가장 오래
+    사용되지 않은 파일부터 지웁니다.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        max_bytes: int,
+        ttls: Optional[Dict[str, timedelta]] = None,
+    ):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.root.mkdir(parents=True, exist_ok=True)
+        # _evict가 잠금을 쥔 채 _remove를 부르므로 재진입 가능한 잠금을 씁니다.
+        self._lock = threading.RLock()
+        self._total_bytes = sum(path.stat().st_size for path in self._files())
+
+    def _files(self):
+        return self.root.glob("*/*.parquet")
+
+    def _path(self, kind: str, *key_parts: Any) -> Path:
+        digest = hashlib.sha1(
+            "|".join(str(part) for part in key_parts).encode()
+        ).hexdigest()
+        return self.root / kind / f"{digest}.parquet"
+
+    def get(self, kind: str, *key_parts: Any) -> Optional[pd.DataFrame]:
+        """유효한 캐시가 있으면 DataFrame을, 없거나 만료되었으면 None을 반환합니다.
+
+        만료 여부는 저장할 때 기록한 TTL 종류로 판단합니다 (기록이 없으면 kind).
+        """
+        path = self._path(kind, *key_parts)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+
+        now = time.time()
+        try:
+            metadata = pq.read_schema(path).metadata or {}
+            ttl_kind = metadata.get(TTL_KIND_METADATA_KEY, kind.encode()).decode()
+            if now - stat.st_mtime > self.ttls[ttl_kind].total_seconds():
+                self._remove(path, stat.st_size)
+                return None
+            frame = pq.read_table(path).to_pandas()
+        except Exception as e:
+            logger.warning(f"Dropping unreadable cache file {path}: {str(e)}")
+            self._remove(path, stat.st_size)
+            return None
+        # 저장 시각(mtime)은 유지하고 사용 시각(atime)만 갱신합니다.
+        os.utime(path, (now, stat.st_mtime))
+        return frame
+
+    def put(
+        self, kind: str, ttl_kind: str, frame: pd.DataFrame, *key_parts: Any
+    ) -> None:
+        """응답을 ttl_kind와 함께 저장하고 크기 제한을 넘으면 LRU로 정리합니다."""
+        path = self._path(kind, *key_parts)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(frame)
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), TTL_KIND_METADATA_KEY: ttl_kind.encode()}
+        )
+        # 같은 키를 동시에 쓰는 경우를 위해 임시 파일 이름은 호출마다 다르게 합니다.
+        tmp_path = path.with_name(f"{path.stem}.{uuid.uuid4().hex}.tmp")
+        try:
+            pq.write_table(table, tmp_path)
+            with self._lock:
+                previous = path.stat().st_size if path.exists() else 0
+                os.replace(tmp_path, path)
+                self._total_bytes += path.stat().st_size - previous
+                if self._total_bytes > self.max_bytes:
+                    self._evict()
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _remove(self, path: Path, size: int) -> None:
+        with self._lock:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                return
+            self._total_bytes -= size
+
+    def _evict(self) -> None:
+        entries = sorted(
+            ((path, path.stat()) for path in self._files()),
+            key=lambda entry: entry[1].st_atime,
+        )
+        self._total_bytes = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._remove(path, stat.st_size)
+
+
+class CachedMarketDataProvider(MarketDataProvider):
+    """다른 제공자 앞에 Parquet 디스크 캐시를 두는 제공자"""
+
+    def __init__(
+        self, provider: MarketDataProvider, cache: ParquetResponseCache, source: str
+    ):
+        self.provider = provider
+        self.cache = cache
+        self.source = source
+
+    async def _cached(
+        self,
+        kind: str,
+        key_parts: Tuple[Any, ...],
+        fetch: Callable[[], Awaitable[pd.DataFrame]],
+        ttl_kind: Optional[Callable[[], str]] = None,
+    ) -> pd.DataFrame:
+        """캐시에 없으면 fetch로 가져와 저장합니다.
+
+        ttl_kind는 저장 직전에 호출해 적용할 TTL 종류를 정합니다 (기본값은 kind).
+        """
+        frame = await asyncio.to_thread(self.cache.get, kind, *key_parts)
+        if frame is not None:
+            return frame
+        frame = await fetch()
+        try:
+            await asyncio.to_thread(
+                self.cache.put,
+                kind,
+                ttl_kind() if ttl_kind else kind,
+                frame,
+                *key_parts,
+            )
+        except Exception as e:
+            # 캐시 저장 실패는 응답 자체에 영향을 주지 않습니다.
+            logger.warning(f"Failed to cache {kind} response: {str(e)}")
+        return frame
+
+    async def get_prices(
+        self, symbol: str, start: date, end: Optional[date] = None
+    ) -> pd.DataFrame:
+        end_day = pd.Timestamp(end).date() if end else None
+
+        def ttl_kind() -> str:
+            # 가져온 시점에 장중 값이 섞였을 수 있는 구간은 짧은 TTL로 저장합니다.
+            recent = end_day is None or end_day >= date.today() - timedelta(days=1)
+            return "prices_recent" if recent else "prices"
+
+        return await self._cached(
+            "prices",
+            (self.source, symbol, pd.Timestamp(start).date(), end_day),
+            lambda: self.provider.get_prices(symbol, start, end),
+            ttl_kind,
+        )
+
+    async def get_listing(self, market: str) -> pd.DataFrame:
+        return await self._cached(
+            "listing",
+            (self.source, market),
+            lambda: self.provider.get_listing(market),
+        )
+
+    async def get_info(self, symbol: str) -> Dict[str, Any]:
+        async def fetch() -> pd.DataFrame:
+            info = await self.provider.get_info(symbol)
+            return pd.DataFrame({"json": [json.dumps(info, default=str)]})
+
+        frame = await self._cached("info", (self.source, symbol), fetch)
+        return json.loads(frame["json"].iloc[0])
@@ -0,0 +1,85 @@
+import asyncio
+import zlib
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.services.market_data.base import MarketDataProvider
+
+# 같은 날짜는 요청 구간과 상관없이 항상 같은 값을 갖도록 고정된 기준일부터 생성합니다.
+EPOCH = pd.Timestamp("2000-01-03")
+
+
+class FakeMarketDataProvider(MarketDataProvider):
+    """네트워크 없이 결정적인 데이터를 돌려주는 테스트/벤치마크용 제공자
+
+    가격은 종목 코드로 시드를 정한 기하 랜덤워크이며 평일만 생성합니다.
+    `latency`를 주면 호출마다 그만큼 대기해 네트워크 지연을 흉내 냅니다.
+    """
+
+    def __init__(self, num_listings: int = 200, latency: float = 0.0):
+        self.num_listings = num_listings
+        self.latency = latency
+        self.calls: Dict[str, int] = {"prices": 0, "listing": 0, "info": 0}
+
+    async def _simulate(self, kind: str) -> None:
+        self.calls[kind] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    def _symbols(self) -> List[str]:
+        return [f"{100000 + i * 10:06d}" for i in range(self.num_listings)]
+
+    async def get_prices(
+        self, symbol: str, start: date, end: Optional[date] = None
+    ) -> pd.DataFrame:
+        await self._simulate("prices")
+        end_ts = pd.Timestamp(end) if end else pd.Timestamp.today().normalize()
+        start_ts = max(pd.Timestamp(start), EPOCH)
+        if start_ts > end_ts:
+            return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"])
+
+        dates = pd.bdate_range(EPOCH, end_ts)
+        n = len(dates)
+        seed = zlib.crc32(symbol.encode())
+        # 컬럼마다 독립된 난수 스트림을 써야 생성 길이가 달라도 앞부분 값이 같습니다.
+        rngs = [np.random.default_rng([seed, stream]) for stream in range(4)]
+        close = 10000.0 * np.exp(np.cumsum(rngs[0].normal(0.0002, 0.015, n)))
+        open_ = close * (1 + rngs[1].normal(0, 0.005, n))
+        spread = np.abs(rngs[2].normal(0, 0.01, n))
+        high = np.maximum(open_, close) * (1 + spread)
+        low = np.minimum(open_, close) * (1 - spread)
+        volume = rngs[3].integers(10_000, 1_000_000, n)
+
+        frame = pd.DataFrame(
+            {
+                "Open": open_.round(0),
+                "High": high.round(0),
+                "Low": low.round(0),
+                "Close": close.round(0),
+                "Volume": volume,
+            },
+            index=pd.DatetimeIndex(dates, name="Date"),
+        )
+        return frame.loc[start_ts:end_ts]
+
+    async def get_listing(self, market: str) -> pd.DataFrame:
+        await self._simulate("listing")
+        brands = ["KODEX", "TIGER", "ACE", "KBSTAR"]
+        symbols = self._symbols()
+        return pd.DataFrame(
+            {
+                "Symbol": symbols,
+                "Name": [
+                    f"{brands[i % len(brands)]} 테스트 {i:03d}"
+                    for i in range(len(symbols))
+                ],
+                "Category": [i % 7 + 1 for i in range(len(symbols))],
+            }
+        )
+
+    async def get_info(self, symbol: str) -> Dict[str, Any]:
+        await self._simulate("info")
+        return {"symbol": symbol, "longName": f"Fake ETF {symbol}"}
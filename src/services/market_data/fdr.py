@@ -0,0 +1,23 @@
+from datetime import date
+from typing import Any, Dict, Optional
+
+import FinanceDataReader as fdr
+import pandas as pd
+import yfinance as yf
+
+from src.services.market_data.base import ThreadPoolMarketDataProvider
+
+
+class FinanceDataReaderProvider(ThreadPoolMarketDataProvider):
+    """FinanceDataReader(가격, 목록)와 yfinance(메타데이터) 기반 제공자"""
+
+    async def get_prices(
+        self, symbol: str, start: date, end: Optional[date] = None
+    ) -> pd.DataFrame:
+        return await self._call(fdr.DataReader, symbol, start, end)
+
+    async def get_listing(self, market: str) -> pd.DataFrame:
+        return await self._call(fdr.StockListing, market)
+
+    async def get_info(self, symbol: str) -> Dict[str, Any]:
+        return await self._call(lambda: yf.Ticker(symbol).info)
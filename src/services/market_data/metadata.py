@@ -0,0 +1,98 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from src.core.config import settings
+from src.services.market_data.base import MarketDataProvider
+
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """여러 작업자가 공유하는 토큰 버킷 방식의 호출 속도 제한기"""
+
+    def __init__(self, rate_per_second: float, burst: Optional[int] = None):
+        self.rate = rate_per_second
+        self.capacity = burst or max(1, int(rate_per_second))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """토큰이 생길 때까지 기다린 뒤 하나를 사용합니다."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+# 같은 외부 API(Yahoo Finance)를 호출하는 모든 작업이 하나의 제한을 공유합니다.
+info_rate_limiter = RateLimiter(settings.MARKET_DATA_INFO_RATE_PER_SEC)
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """지수 백오프에 full jitter를 적용한 대기 시간(초)을 반환합니다."""
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+async def fetch_infos(
+    provider: MarketDataProvider,
+    tickers: Sequence[str],
+    workers: int = settings.MARKET_DATA_INFO_WORKERS,
+    max_retries: int = settings.MARKET_DATA_INFO_MAX_RETRIES,
+    rate_limiter: RateLimiter = info_rate_limiter,
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+    """여러 종목의 메타데이터를 동시에 가져옵니다.
+
+    (성공한 종목별 info, 실패한 종목별 마지막 오류 메시지)를 반환합니다.
+    """
+    semaphore = asyncio.Semaphore(workers)
+    infos: Dict[str, Dict[str, Any]] = {}
+    failures: Dict[str, str] = {}
+
+    async def fetch_one(ticker: str) -> None:
+        async with semaphore:
+            for attempt in range(max_retries + 1):
+                await rate_limiter.acquire()
+                try:
+                    info = await provider.get_info(ticker)
+                    if not info:
+                        raise ValueError("No info available")
+                    infos[ticker] = info
+                    return
+                except Exception as e:
+                    if attempt == max_retries:
+                        failures[ticker] = str(e)
+                        return
+                    delay = backoff_delay(attempt)
+                    logger.warning(
+                        f"Retry {attempt + 1} for {ticker} in {delay:.1f}s: {str(e)}"
+                    )
+                    await asyncio.sleep(delay)
+
+    await asyncio.gather(*(fetch_one(ticker) for ticker in tickers))
+    return infos, failures
+
+
+def infos_to_listing(infos: Dict[str, Dict[str, Any]]) -> pd.DataFrame:
+    """메타데이터를 StockRepository.sync_listing이 받는 Symbol/Name 형식으로 바꿉니다."""
+    rows: List[Dict[str, str]] = [
+        {
+            "Symbol": ticker,
+            "Name": info.get("longName") or info.get("shortName") or ticker,
+        }
+        for ticker, info in infos.items()
+    ]
+    return pd.DataFrame(rows, columns=["Symbol", "Name"])
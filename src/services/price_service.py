@@ -0,0 +1,135 @@
+import logging
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.db.repositories.price import PriceRepository
+from src.db.repositories.price_coverage import (
+    PriceCoverageRepository,
+    split_range,
+)
+from src.db.repositories.stock import StockRepository
+from src.db.unit_of_work import UnitOfWork, commit
+from src.models.stock import Stock
+from src.services.market_data import MarketDataProvider, get_market_data_provider
+from src.services.price_validation import validate_ohlcv
+from src.services.trading_calendar import calendar_for
+
+
+logger = logging.getLogger(__name__)
+
+# 패널 캐시에 보관할 최대 항목 수
+PANEL_CACHE_SIZE = 16
+
+# (tickers, start, end, field) -> (캐시 시각, 패널)
+_panel_cache: "OrderedDict[tuple, Tuple[datetime, pd.DataFrame]]" = OrderedDict()
+
+
+class PriceService:
+    """가격 데이터 수집 서비스"""
+
+    def __init__(self, db: AsyncSession, provider: Optional[MarketDataProvider] = None):
+        self.db = db
+        self.provider = provider or get_market_data_provider()
+        self.price_repo = PriceRepository(db)
+        self.coverage_repo = PriceCoverageRepository(db)
+
+    async def sync_range(self, stock: Stock, start: date, end: date) -> int:
+        """요청 구간 중 커버리지에 없는 구간만 가져와 저장하고, 저장한 봉 수를 반환합니다.
+
+        공급자 호출은 트랜잭션 밖에서 하고, 구간마다 가격, 격리 행, 커버리지를 한
+        트랜잭션으로 커밋합니다. 중간 구간이 실패해도 앞 구간의 결과는 남으며, 커넥션이
+        네트워크 대기 중에 트랜잭션을 잡고 있지 않도록 UnitOfWork 밖에서 호출합니다.
+        """
+        # 미래 날짜는 아직 존재하지 않으므로 커버리지로 기록하지 않습니다.
+        end = min(end, date.today())
+        if start > end:
+            return 0
+
+        missing = await self.coverage_repo.get_missing_ranges(stock.id, start, end)
+        # 조회 트랜잭션을 닫은 뒤 공급자를 호출합니다.
+        await commit(self.db)
+        calendar = calendar_for(stock.country, stock.market)
+        saved = 0
+        for range_start, range_end in missing:
+            # 거래일이 없는 구간(주말, 휴장일)은 조회하지 않고 커버리지로만 기록합니다.
+            if calendar.sessions_in_range(range_start, range_end) == 0:
+                await self.coverage_repo.add_range(stock.id, range_start, range_end)
+                continue
+            logger.info(f"Fetching {stock.ticker} prices: {range_start} ~ {range_end}")
+            df = await self.provider.get_prices(stock.ticker, range_start, range_end)
+            if df.empty:
+                # 거래일이 있는데 빈 응답은 일시 장애(요청 제한 등)일 수 있으므로
+                # 커버리지로 기록하지 않고 다음 동기화 때 다시 묻습니다.
+                logger.warning(
+                    f"No {stock.ticker} prices for {range_start} ~ {range_end}"
+                )
+                continue
+            result = validate_ohlcv(df)
+
+            async with UnitOfWork(self.db):
+                quarantined = set()
+                if not result.rejected.empty:
+                    logger.warning(
+                        f"Quarantined {len(result.rejected)} {stock.ticker} bars"
+                    )
+                    await self.price_repo.quarantine(stock.id, result.rejected)
+                    # 정상 행 없이 격리만 된 날짜는 다음 동기화 때 다시 가져옵니다.
+                    quarantined = set(result.rejected.index.date) - set(
+                        result.clean.index.date
+                    )
+                counts = await self.price_repo.bulk_upsert(
+                    stock.price_key, result.clean
+                )
+                saved += counts["inserted"] + counts["updated"]
+                # 응답 구간 안에서 봉이 없는 날(거래 정지)은 다시 묻지 않도록 기록합니다.
+                for covered_start, covered_end in split_range(
+                    range_start, range_end, quarantined
+                ):
+                    await self.coverage_repo.add_range(
+                        stock.id, covered_start, covered_end
+                    )
+        return saved
+
+    async def get_panel(
+        self,
+        tickers: List[str],
+        start: date,
+        end: date,
+        field: str = "close",
+        use_cache: bool = False,
+    ) -> pd.DataFrame:
+        """여러 종목의 가격을 날짜 x 티커 행렬로 반환합니다.
+
+        한 번의 쿼리로 읽어 벡터 연산으로 펼치며, 거래가 없는 칸은 NaN입니다.
+        use_cache를 켜면 잠정 데이터 TTL 동안 같은 요청의 결과를 재사용합니다.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        cache_key = (tuple(tickers), start, end, field)
+        ttl = timedelta(minutes=settings.PRICE_PROVISIONAL_TTL_MINUTES)
+        if use_cache and cache_key in _panel_cache:
+            cached_at, panel = _panel_cache[cache_key]
+            if datetime.now() - cached_at < ttl:
+                _panel_cache.move_to_end(cache_key)
+                return panel.copy()
+            del _panel_cache[cache_key]
+
+        price_keys = await StockRepository(self.db).get_price_keys(tickers)
+        found = [ticker for ticker in tickers if ticker in price_keys]
+        panel = await self.price_repo.get_panel(
+            [price_keys[ticker] for ticker in found], start, end, field
+        )
+        panel.columns = pd.Index(found, name="Ticker")
+        # 찾지 못한 티커도 요청한 순서대로 NaN 컬럼으로 채웁니다.
+        panel = panel.reindex(columns=pd.Index(tickers, name="Ticker"))
+
+        if use_cache:
+            _panel_cache[cache_key] = (datetime.now(), panel)
+            while len(_panel_cache) > PANEL_CACHE_SIZE:
+                _panel_cache.popitem(last=False)
+            return panel.copy()
+        return panel
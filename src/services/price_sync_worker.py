@@ -0,0 +1,165 @@
+import asyncio
+import logging
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.core.config import settings
+from src.db.repositories.stock import StockRepository
+from src.db.session import AsyncSessionLocal, engine
+from src.models.stock import Stock
+from src.services.price_service import PriceService
+
+
+logger = logging.getLogger(__name__)
+
+# 앱 프로세스가 여러 개여도 이 advisory lock을 잡은 프로세스 하나만 동기화합니다.
+PRICE_SYNC_LOCK_KEY = 7_301_001
+TRY_LOCK_SQL = text("SELECT pg_try_advisory_lock(:key)")
+
+
+@dataclass
+class TickerSyncStatus:
+    """종목별 동기화 상태"""
+
+    state: str = "pending"  # pending, running, ok, error
+    last_synced_at: Optional[datetime] = None
+    bars_saved: int = 0
+    error: Optional[str] = None
+
+
+class PriceSyncWorker:
+    """활성 종목의 일봉을 주기적으로 갱신하는 백그라운드 작업"""
+
+    def __init__(
+        self,
+        interval_minutes: int = settings.PRICE_SYNC_INTERVAL_MINUTES,
+        concurrency: int = settings.PRICE_SYNC_CONCURRENCY,
+        lookback_days: int = settings.PRICE_SYNC_LOOKBACK_DAYS,
+    ):
+        self.interval = timedelta(minutes=interval_minutes)
+        self.lookback = timedelta(days=lookback_days)
+        self.concurrency = concurrency
+        self.status: Dict[str, TickerSyncStatus] = {}
+        self.last_run_at: Optional[datetime] = None
+        self.is_leader = False
+        self._task: Optional[asyncio.Task] = None
+        self._lock_conn: Optional[AsyncConnection] = None
+
+    def start(self) -> None:
+        """주기 실행 태스크를 시작합니다."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        """실행 중인 태스크를 취소합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._release_lock()
+
+    def stats(self) -> Dict[str, Any]:
+        """lock 보유 여부, 마지막 실행 시각과 종목별 동기화 상태를 반환합니다."""
+        states: Dict[str, int] = {}
+        for status in self.status.values():
+            states[status.state] = states.get(status.state, 0) + 1
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "leader": self.is_leader,
+            "last_run_at": self.last_run_at,
+            "states": states,
+            "tickers": {
+                ticker: asdict(status) for ticker, status in self.status.items()
+            },
+        }
+
+    async def _run_forever(self) -> None:
+        while True:
+            try:
+                if await self._acquire_lock():
+                    await self.run_once()
+            except Exception as e:
+                logger.error(f"Price sync run failed: {str(e)}")
+            await asyncio.sleep(self.interval.total_seconds())
+
+    async def _acquire_lock(self) -> bool:
+        """세션 수준 advisory lock을 잡거나, 이미 잡은 커넥션이 살아 있는지 확인합니다.
+
+        lock은 전용 커넥션이 닫힐 때 풀리므로 프로세스가 죽으면 다른 프로세스가
+        다음 주기에 이어받습니다.
+        """
+        try:
+            if self._lock_conn is not None:
+                await self._lock_conn.scalar(text("SELECT 1"))
+                return True
+
+            conn = await engine.connect()
+            # 유휴 트랜잭션으로 커넥션을 붙잡지 않도록 autocommit으로 둡니다.
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            if await conn.scalar(TRY_LOCK_SQL, {"key": PRICE_SYNC_LOCK_KEY}):
+                self._lock_conn = conn
+                self.is_leader = True
+                logger.info("Acquired price sync lock")
+                return True
+            await conn.close()
+        except Exception as e:
+            logger.warning(f"Price sync lock unavailable: {str(e)}")
+            await self._release_lock()
+        return False
+
+    async def _release_lock(self) -> None:
+        conn, self._lock_conn = self._lock_conn, None
+        self.is_leader = False
+        if conn is not None:
+            try:
+                await conn.close()
+            except Exception as e:
+                logger.warning(f"Error closing price sync lock connection: {str(e)}")
+
+    async def run_once(self) -> None:
+        """모든 활성 종목을 제한된 동시성으로 한 번 동기화합니다."""
+        async with AsyncSessionLocal() as db:
+            stocks = await StockRepository(db).get_active()
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        end = date.today()
+        start = end - self.lookback
+
+        async def sync_one(stock: Stock) -> None:
+            async with semaphore:
+                await self._sync_stock(stock, start, end)
+
+        started = datetime.now()
+        await asyncio.gather(*(sync_one(stock) for stock in stocks))
+        self.last_run_at = datetime.now()
+        logger.info(
+            f"Price sync finished for {len(stocks)} stocks in "
+            f"{(self.last_run_at - started).total_seconds():.1f}s"
+        )
+
+    async def _sync_stock(self, stock: Stock, start: date, end: date) -> None:
+        status = self.status.setdefault(stock.ticker, TickerSyncStatus())
+        status.state = "running"
+        try:
+            async with AsyncSessionLocal() as db:
+                saved = await PriceService(db).sync_range(stock, start, end)
+                synced_at = datetime.utcnow()
+                await StockRepository(db).mark_synced(stock.id, synced_at)
+            status.state = "ok"
+            status.last_synced_at = synced_at
+            status.bars_saved = saved
+            status.error = None
+        except Exception as e:
+            logger.error(f"Error syncing prices for {stock.ticker}: {str(e)}")
+            status.state = "error"
+            status.error = str(e)
+
+
+price_sync_worker = PriceSyncWorker()
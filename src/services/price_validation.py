@@ -0,0 +1,144 @@
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# 검증 실패 사유 (비트 플래그이므로 한 행이 여러 사유를 가질 수 있습니다)
+NON_FINITE = 1
+NON_POSITIVE_PRICE = 2
+OHLC_INCONSISTENT = 4
+NEGATIVE_VOLUME = 8
+ZERO_VOLUME = 16
+DUPLICATE_DATE = 32
+NON_MONOTONIC_DATE = 64
+RETURN_SPIKE = 128
+
+REASON_NAMES: Dict[int, str] = {
+    NON_FINITE: "non_finite",
+    NON_POSITIVE_PRICE: "non_positive_price",
+    OHLC_INCONSISTENT: "ohlc_inconsistent",
+    NEGATIVE_VOLUME: "negative_volume",
+    ZERO_VOLUME: "zero_volume",
+    DUPLICATE_DATE: "duplicate_date",
+    NON_MONOTONIC_DATE: "non_monotonic_date",
+    RETURN_SPIKE: "return_spike",
+}
+
+# 로그 수익률 기준 약 +65% / -39%
+DEFAULT_SPIKE_THRESHOLD = 0.5
+
+
+@dataclass
+class ValidationResult:
+    """검증 결과: 저장할 행과 격리할 행(reasons 비트마스크, reason 설명 컬럼 포함)"""
+
+    clean: pd.DataFrame
+    rejected: pd.DataFrame
+
+
+def describe_reasons(reasons: int) -> str:
+    """비트마스크를 사람이 읽을 수 있는 사유 목록으로 바꿉니다."""
+    return ",".join(name for flag, name in REASON_NAMES.items() if reasons & flag)
+
+
+def compute_reasons(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    dates: np.ndarray,
+    keys: Optional[np.ndarray] = None,
+    spike_threshold: float = DEFAULT_SPIKE_THRESHOLD,
+) -> np.ndarray:
+    """행별 검증 실패 사유 비트마스크를 계산합니다.
+
+    여러 종목을 이어 붙인 패널은 `keys`(종목 식별자, 종목별로 연속 배치)를 넘기면
+    날짜/수익률 비교가 종목 경계를 넘지 않습니다. 모든 연산은 벡터화되어 있습니다.
+    """
+    n = len(close)
+    reasons = np.zeros(n, dtype=np.int32)
+    if n == 0:
+        return reasons
+
+    prices = np.stack([open_, high, low, close]).astype(np.float64)
+    volume = volume.astype(np.float64)
+
+    reasons[~(np.isfinite(prices).all(axis=0) & np.isfinite(volume))] |= NON_FINITE
+    with np.errstate(invalid="ignore"):
+        reasons[(prices <= 0).any(axis=0)] |= NON_POSITIVE_PRICE
+        inconsistent = (high < np.maximum(open_, close)) | (
+            low > np.minimum(open_, close)
+        )
+        reasons[inconsistent | (high < low)] |= OHLC_INCONSISTENT
+        reasons[volume < 0] |= NEGATIVE_VOLUME
+        reasons[volume == 0] |= ZERO_VOLUME
+
+    # 같은 종목 안에서 직전 행과 비교합니다.
+    same = np.ones(n - 1, dtype=bool) if keys is None else keys[1:] == keys[:-1]
+    dates = dates.astype("datetime64[ns]")
+    reasons[1:][same & (dates[1:] == dates[:-1])] |= DUPLICATE_DATE
+    reasons[1:][same & (dates[1:] < dates[:-1])] |= NON_MONOTONIC_DATE
+
+    # 한 봉만 튀었다가 다음 봉에서 되돌아오는 값을 이상치로 봅니다.
+    # 직전/직후 행이 이미 불량이면 수익률 비교에서 제외합니다.
+    basic_ok = reasons == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_close = np.log(close.astype(np.float64))
+    ret = np.full(n, np.nan)
+    valid_pair = same & basic_ok[1:] & basic_ok[:-1]
+    ret[1:][valid_pair] = (log_close[1:] - log_close[:-1])[valid_pair]
+    jump = np.abs(ret) > spike_threshold
+    reverts = np.zeros(n, dtype=bool)
+    reverts[:-1] = jump[:-1] & jump[1:] & (np.sign(ret[:-1]) != np.sign(ret[1:]))
+    reasons[reverts] |= RETURN_SPIKE
+
+    return reasons
+
+
+def validate_ohlcv(
+    frame: pd.DataFrame,
+    keys: Optional[np.ndarray] = None,
+    spike_threshold: float = DEFAULT_SPIKE_THRESHOLD,
+) -> ValidationResult:
+    """FinanceDataReader 형식 DataFrame을 검증해 정상 행과 격리 행으로 나눕니다.
+
+    제공자가 내림차순이나 뒤섞인 순서로 돌려줘도 정상 행이 격리되지 않도록
+    검증 전에 (종목,) 날짜 순으로 안정 정렬합니다. 따라서 같은 날짜가 여러 번
+    나올 때 처음 행은 남고 나머지만 duplicate_date로 격리됩니다.
+    """
+    if frame.empty:
+        return ValidationResult(
+            clean=frame, rejected=frame.assign(reasons=[], reason=[])
+        )
+
+    dates = frame.index.to_numpy()
+    if keys is None:
+        order = np.argsort(dates, kind="stable")
+    else:
+        keys = np.asarray(keys)
+        order = np.lexsort((dates, keys))
+    if (order != np.arange(len(order))).any():
+        frame = frame.iloc[order]
+        if keys is not None:
+            keys = keys[order]
+
+    reasons = compute_reasons(
+        frame["Open"].to_numpy(dtype=float),
+        frame["High"].to_numpy(dtype=float),
+        frame["Low"].to_numpy(dtype=float),
+        frame["Close"].to_numpy(dtype=float),
+        frame["Volume"].to_numpy(dtype=float),
+        frame.index.to_numpy(),
+        keys=keys,
+        spike_threshold=spike_threshold,
+    )
+    bad = reasons != 0
+    clean = frame[~bad]
+    rejected = frame[bad].assign(
+        reasons=reasons[bad],
+        reason=[describe_reasons(int(value)) for value in reasons[bad]],
+    )
+    return ValidationResult(clean=clean, rejected=rejected)
@@ -0,0 +1,294 @@
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Iterable, List, Optional, Set
+
+import numpy as np
+
+
+# fmt: off
+# 음력 공휴일(설날, 부처님오신날, 추석)의 양력 날짜 (한국 표준시 기준).
+# get_calendar 인덱스 구간(1995년~)을 모두 덮어야 하며, 표에 없는 연도는 평일로
+# 취급되어 휴장일에도 공급자를 조회하게 됩니다.
+KR_SEOLLAL = {
+    1995: date(1995, 1, 31), 1996: date(1996, 2, 19), 1997: date(1997, 2, 8),
+    1998: date(1998, 1, 28), 1999: date(1999, 2, 16), 2000: date(2000, 2, 5),
+    2001: date(2001, 1, 24), 2002: date(2002, 2, 12), 2003: date(2003, 2, 1),
+    2004: date(2004, 1, 22), 2005: date(2005, 2, 9), 2006: date(2006, 1, 29),
+    2007: date(2007, 2, 18), 2008: date(2008, 2, 7), 2009: date(2009, 1, 26),
+    2010: date(2010, 2, 14), 2011: date(2011, 2, 3), 2012: date(2012, 1, 23),
+    2013: date(2013, 2, 10), 2014: date(2014, 1, 31),
+    2015: date(2015, 2, 19), 2016: date(2016, 2, 8), 2017: date(2017, 1, 28),
+    2018: date(2018, 2, 16), 2019: date(2019, 2, 5), 2020: date(2020, 1, 25),
+    2021: date(2021, 2, 12), 2022: date(2022, 2, 1), 2023: date(2023, 1, 22),
+    2024: date(2024, 2, 10), 2025: date(2025, 1, 29), 2026: date(2026, 2, 17),
+    2027: date(2027, 2, 7), 2028: date(2028, 1, 27), 2029: date(2029, 2, 13),
+    2030: date(2030, 2, 3), 2031: date(2031, 1, 23),
+}
+KR_BUDDHA = {
+    1995: date(1995, 5, 7), 1996: date(1996, 5, 24), 1997: date(1997, 5, 14),
+    1998: date(1998, 5, 3), 1999: date(1999, 5, 22), 2000: date(2000, 5, 11),
+    2001: date(2001, 5, 1), 2002: date(2002, 5, 19), 2003: date(2003, 5, 8),
+    2004: date(2004, 5, 26), 2005: date(2005, 5, 15), 2006: date(2006, 5, 5),
+    2007: date(2007, 5, 24), 2008: date(2008, 5, 12), 2009: date(2009, 5, 2),
+    2010: date(2010, 5, 21), 2011: date(2011, 5, 10), 2012: date(2012, 5, 28),
+    2013: date(2013, 5, 17), 2014: date(2014, 5, 6),
+    2015: date(2015, 5, 25), 2016: date(2016, 5, 14), 2017: date(2017, 5, 3),
+    2018: date(2018, 5, 22), 2019: date(2019, 5, 12), 2020: date(2020, 4, 30),
+    2021: date(2021, 5, 19), 2022: date(2022, 5, 8), 2023: date(2023, 5, 27),
+    2024: date(2024, 5, 15), 2025: date(2025, 5, 5), 2026: date(2026, 5, 24),
+    2027: date(2027, 5, 13), 2028: date(2028, 5, 2), 2029: date(2029, 5, 20),
+    2030: date(2030, 5, 9), 2031: date(2031, 5, 28),
+}
+KR_CHUSEOK = {
+    1995: date(1995, 9, 9), 1996: date(1996, 9, 27), 1997: date(1997, 9, 16),
+    1998: date(1998, 10, 5), 1999: date(1999, 9, 24), 2000: date(2000, 9, 12),
+    2001: date(2001, 10, 1), 2002: date(2002, 9, 21), 2003: date(2003, 9, 11),
+    2004: date(2004, 9, 28), 2005: date(2005, 9, 18), 2006: date(2006, 10, 6),
+    2007: date(2007, 9, 25), 2008: date(2008, 9, 14), 2009: date(2009, 10, 3),
+    2010: date(2010, 9, 22), 2011: date(2011, 9, 12), 2012: date(2012, 9, 30),
+    2013: date(2013, 9, 19), 2014: date(2014, 9, 8),
+    2015: date(2015, 9, 27), 2016: date(2016, 9, 15), 2017: date(2017, 10, 4),
+    2018: date(2018, 9, 24), 2019: date(2019, 9, 13), 2020: date(2020, 10, 1),
+    2021: date(2021, 9, 21), 2022: date(2022, 9, 10), 2023: date(2023, 9, 29),
+    2024: date(2024, 9, 17), 2025: date(2025, 10, 6), 2026: date(2026, 9, 25),
+    2027: date(2027, 9, 15), 2028: date(2028, 10, 3), 2029: date(2029, 9, 22),
+    2030: date(2030, 9, 12), 2031: date(2031, 10, 1),
+}
+# fmt: on
+
+ONE_DAY = timedelta(days=1)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """해당 월의 n번째 요일 (n < 0이면 뒤에서부터)"""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - ONE_DAY
+    return last - timedelta(days=(last.weekday() - weekday) % 7 + 7 * (-n - 1))
+
+
+def _easter(year: int) -> date:
+    """그레고리력 부활절 (Anonymous Gregorian algorithm)"""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = b // 4, b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741
+    m = (a + 11 * h + 22 * l) // 451
+    month = (h + l - 7 * m + 114) // 31
+    day = (h + l - 7 * m + 114) % 31 + 1
+    return date(year, month, day)
+
+
+def _observed(day: date, saturday_to_friday: bool = True) -> Optional[date]:
+    """주말 공휴일의 대체 휴장일 (토요일 → 금요일, 일요일 → 월요일)"""
+    if day.weekday() == 5:
+        return day - ONE_DAY if saturday_to_friday else day + 2 * ONE_DAY
+    if day.weekday() == 6:
+        return day + ONE_DAY
+    return day
+
+
+def _next_free_weekday(day: date, taken: Set[date]) -> date:
+    while day.weekday() >= 5 or day in taken:
+        day += ONE_DAY
+    return day
+
+
+def nyse_holidays(year: int) -> List[date]:
+    """NYSE 정규 휴장일"""
+    days = [
+        _nth_weekday(year, 1, 0, 3),  # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),  # Presidents' Day
+        _easter(year) - 2 * ONE_DAY,  # Good Friday
+        _nth_weekday(year, 5, 0, -1),  # Memorial Day
+        _observed(date(year, 7, 4)),  # Independence Day
+        _nth_weekday(year, 9, 0, 1),  # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving
+        _observed(date(year, 12, 25)),  # Christmas
+    ]
+    # 새해 첫날이 토요일이면 전년도 12월 31일을 쉬지 않습니다.
+    if date(year, 1, 1).weekday() != 5:
+        days.append(_observed(date(year, 1, 1)))
+    if year >= 2022:
+        days.append(_observed(date(year, 6, 19)))  # Juneteenth
+    return days
+
+
+def tsx_holidays(year: int) -> List[date]:
+    """TSX 정규 휴장일"""
+    christmas = date(year, 12, 25)
+    if christmas.weekday() == 5:
+        christmas_days = [christmas + 2 * ONE_DAY, christmas + 3 * ONE_DAY]
+    elif christmas.weekday() == 6:
+        christmas_days = [christmas + ONE_DAY, christmas + 2 * ONE_DAY]
+    elif christmas.weekday() == 4:
+        christmas_days = [christmas, christmas + 3 * ONE_DAY]
+    else:
+        christmas_days = [christmas, christmas + ONE_DAY]
+    # 5월 25일 직전 월요일
+    victoria_day = date(year, 5, 24) - timedelta(days=date(year, 5, 24).weekday())
+    days = [
+        _observed(date(year, 1, 1), saturday_to_friday=False),  # New Year's Day
+        _easter(year) - 2 * ONE_DAY,  # Good Friday
+        victoria_day,  # Victoria Day
+        _observed(date(year, 7, 1), saturday_to_friday=False),  # Canada Day
+        _nth_weekday(year, 8, 0, 1),  # Civic Holiday
+        _nth_weekday(year, 9, 0, 1),  # Labour Day
+        _nth_weekday(year, 10, 0, 2),  # Thanksgiving
+        *christmas_days,  # Christmas, Boxing Day
+    ]
+    if year >= 2008:
+        days.append(_nth_weekday(year, 2, 0, 3))  # Family Day
+    return days
+
+
+def krx_holidays(year: int) -> List[date]:
+    """KRX 휴장일 (법정 공휴일, 근로자의 날, 연말 휴장일, 대체공휴일)
+
+    선거일, 임시공휴일은 포함하지 않습니다. 음력 공휴일은 KR_SEOLLAL 등의 표가 덮는
+    연도(1995~2031년)만 계산합니다.
+    """
+    fixed = {
+        date(year, 1, 1): False,  # 신정
+        date(year, 3, 1): year >= 2021,  # 삼일절 (값: 대체공휴일 적용 여부)
+        date(year, 5, 1): False,  # 근로자의 날
+        date(year, 5, 5): year >= 2014,  # 어린이날
+        date(year, 6, 6): False,  # 현충일
+        date(year, 8, 15): year >= 2021,  # 광복절
+        date(year, 10, 3): year >= 2021,  # 개천절
+        date(year, 12, 25): year >= 2023,  # 성탄절
+    }
+    if year >= 2013:
+        fixed[date(year, 10, 9)] = year >= 2021  # 한글날 (2013년 공휴일 재지정)
+    # 공휴일에서 빠진 날 (신정 연휴, 식목일, 제헌절)
+    if year <= 1998:
+        fixed[date(year, 1, 2)] = False
+    if year <= 2005:
+        fixed[date(year, 4, 5)] = False
+    if year <= 2007:
+        fixed[date(year, 7, 17)] = False
+    # 연말 휴장일: 그해 마지막 평일
+    year_end = date(year, 12, 31)
+    while year_end.weekday() >= 5:
+        year_end -= ONE_DAY
+    fixed[year_end] = False
+    days: Set[date] = set(fixed)
+    substitutable = [day for day, enabled in fixed.items() if enabled]
+
+    if year in KR_BUDDHA:
+        days.add(KR_BUDDHA[year])
+        if year >= 2023:
+            substitutable.append(KR_BUDDHA[year])
+
+    blocks = []
+    for table in (KR_SEOLLAL, KR_CHUSEOK):
+        if year in table:
+            center = table[year]
+            block = [center - ONE_DAY, center, center + ONE_DAY]
+            blocks.append(block)
+            days.update(block)
+
+    for day in substitutable:
+        if day.weekday() >= 5:
+            days.add(_next_free_weekday(day + ONE_DAY, days))
+    # 설날/추석 연휴가 일요일이나 다른 공휴일과 겹치면 연휴 다음 평일을 쉽니다.
+    for block in blocks:
+        if year >= 2014 and any(day.weekday() == 6 or (day in fixed) for day in block):
+            days.add(_next_free_weekday(block[-1] + ONE_DAY, days))
+    return sorted(days)
+
+
+HOLIDAY_RULES = {
+    "KRX": krx_holidays,
+    "TSX": tsx_holidays,
+    "NYSE": nyse_holidays,
+}
+
+# Stock.country 기준 기본 거래소
+COUNTRY_EXCHANGES = {"KR": "KRX", "CA": "TSX", "US": "NYSE"}
+
+
+class TradingCalendar:
+    """미리 계산한 거래일 인덱스
+
+    날짜를 기준일로부터의 일수로 바꿔 배열을 바로 조회하므로 모든 조회가 O(1)입니다.
+    범위를 벗어난 날짜는 평일을 거래일로 취급합니다.
+    """
+
+    def __init__(self, name: str, holidays: Iterable[date], start: date, end: date):
+        self.name = name
+        self.start = start
+        self.end = end
+        days = np.arange(
+            np.datetime64(start, "D"),
+            np.datetime64(end, "D") + 1,
+            dtype="datetime64[D]",
+        )
+        weekday = (days.astype(np.int64) + 3) % 7  # 1970-01-01은 목요일
+        holiday_days = np.array(sorted(holidays), dtype="datetime64[D]")
+        self._sessions = (weekday < 5) & ~np.isin(days, holiday_days)
+        # _count[i]: 기준일부터 i-1번째 날까지의 거래일 수
+        self._count = np.concatenate([[0], np.cumsum(self._sessions)])
+        # _previous[i]: i번째 날 이전(당일 제외) 마지막 거래일의 오프셋 (-1이면 없음)
+        positions = np.where(self._sessions, np.arange(len(days)), -1)
+        self._previous = np.concatenate([[-1], np.maximum.accumulate(positions)[:-1]])
+
+    def _offset(self, day: date) -> Optional[int]:
+        if self.start <= day <= self.end:
+            return (day - self.start).days
+        return None
+
+    def is_session(self, day: date) -> bool:
+        """거래일 여부"""
+        offset = self._offset(day)
+        if offset is None:
+            return day.weekday() < 5
+        return bool(self._sessions[offset])
+
+    def previous_session(self, day: date) -> Optional[date]:
+        """해당 날짜 이전(당일 제외)의 마지막 거래일"""
+        offset = self._offset(day)
+        if offset is None:
+            day -= ONE_DAY
+            while day.weekday() >= 5:
+                day -= ONE_DAY
+            return day
+        previous = int(self._previous[offset])
+        return self.start + timedelta(days=previous) if previous >= 0 else None
+
+    def sessions_in_range(self, start: date, end: date) -> int:
+        """[start, end] 구간의 예상 거래일 수"""
+        if start > end:
+            return 0
+        first = self._offset(start)
+        last = self._offset(end)
+        if first is None or last is None:
+            return int(np.busday_count(start, end + ONE_DAY))
+        return int(self._count[last + 1] - self._count[first])
+
+
+@lru_cache
+def get_calendar(exchange: str) -> TradingCalendar:
+    """거래소 코드(KRX, TSX, NYSE)의 거래일 달력을 반환합니다."""
+    today = date.today()
+    start, end = date(1995, 1, 1), date(today.year + 5, 12, 31)
+    if exchange == "KRX":
+        # 음력 공휴일 표가 끝나는 해까지만 인덱스를 만듭니다 (이후는 평일 기준).
+        end = min(end, date(max(KR_SEOLLAL), 12, 31))
+    rule = HOLIDAY_RULES.get(exchange)
+    holidays: List[date] = []
+    if rule is not None:
+        for year in range(start.year, end.year + 1):
+            holidays.extend(rule(year))
+    return TradingCalendar(exchange, holidays, start, end)
+
+
+def calendar_for(country: str, market: Optional[str] = None) -> TradingCalendar:
+    """Stock.country/Stock.market에 맞는 달력을 반환합니다."""
+    if market in HOLIDAY_RULES:
+        return get_calendar(market)
+    return get_calendar(COUNTRY_EXCHANGES.get(country, "WEEKDAYS"))
@@ -2,17 +2,16 @@ import asyncio
 from datetime import datetime, timedelta
 import logging
 
-import FinanceDataReader as fdr
 from nicegui import ui, app
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-from src.db.session import AsyncSessionLocal
+from src.db.session import AsyncSessionLocal, read_session
 from src.db.repositories.stock import StockRepository
 from src.db.repositories.price import PriceRepository
 from src.models.stock import Stock
-from src.models.price import Price
+from src.services.price_service import PriceService
 from src.services.stock_service import StockService
 
 
@@ -154,7 +153,6 @@ async def stock_detail_page(ticker: str):
                 try:
                     async with AsyncSessionLocal() as db:
                         stock_repo = StockRepository(db)
-                        price_repo = PriceRepository(db)
 
                         # 주식 정보 조회
                         stock = await stock_repo.get_by_ticker(ticker)
@@ -162,160 +160,27 @@ async def stock_detail_page(ticker: str):
                             ui.notify("주식 정보를 찾을 수 없습니다.", type="negative")
                             return
 
-                        # DB에서 데이터 확인
-                        db_data = await price_repo.get_by_stock_and_date_range(
-                            stock.id, start, end
+                        # 커버리지 인덱스 기준으로 빠진 구간만 가져오기
+                        saved = await PriceService(db).sync_range(
+                            stock, start.date(), end.date()
                         )
 
-                        if not db_data:
-                            # DB에 데이터가 없으면 FinanceDataReader로 가져오기
-                            df = fdr.DataReader(ticker, start, end)
-
-                            if df.empty:
-                                with chart_container:
-                                    ui.notify(
-                                        "해당 기간의 데이터를 찾을 수 없습니다.",
-                                        type="negative",
-                                    )
-                                return
-
-                            # DB에 데이터 저장
-                            prices = []
-                            for index, row in df.iterrows():
-                                price = Price(
-                                    stock_id=stock.id,
-                                    date=index,
-                                    open=float(row["Open"]),
-                                    high=float(row["High"]),
-                                    low=float(row["Low"]),
-                                    close=float(row["Close"]),
-                                    volume=int(row["Volume"]),
+                    # 방금 저장한 봉이 없으면 복제본에서 읽기
+                    async with read_session(use_replica=(saved == 0)) as read_db:
+                        frame = await PriceRepository(read_db).get_frame(
+                            stock.price_key, start.date(), end.date()
+                        )
+                        if frame.empty:
+                            with chart_container:
+                                ui.notify(
+                                    "해당 기간의 데이터를 찾을 수 없습니다.",
+                                    type="negative",
                                 )
-                                prices.append(price)
+                            return
 
-                            # 중복 키 처리를 위한 upsert 로직
-                            for price in prices:
-                                existing_price = await price_repo.get_by_stock_and_date(
-                                    stock.id, price.date
-                                )
-                                if existing_price:
-                                    # 기존 데이터 업데이트
-                                    existing_price.open = price.open
-                                    existing_price.high = price.high
-                                    existing_price.low = price.low
-                                    existing_price.close = price.close
-                                    existing_price.volume = price.volume
-                                    await price_repo.update(existing_price)
-                                else:
-                                    # 새로운 데이터 추가
-                                    await price_repo.create(price)
-
-                            # 전체 데이터 다시 조회
-                            db_data = await price_repo.get_by_stock_and_date_range(
-                                stock.id, start, end
-                            )
-                        else:
-                            # DB에 있는 가장 오래된 데이터의 날짜 확인
-                            oldest_date = min(price.date for price in db_data)
-
-                            # 시작일과 가장 오래된 데이터 사이의 간격이 30일 이상인 경우
-                            if (oldest_date - start).days > 30:
-                                # 시작일 - 30일부터 가장 오래된 데이터까지의 데이터 가져오기
-                                fetch_start = start
-                                fetch_end = oldest_date
-
-                                df = fdr.DataReader(ticker, fetch_start, fetch_end)
-
-                                if not df.empty:
-                                    # DB에 데이터 저장
-                                    prices = []
-                                    for index, row in df.iterrows():
-                                        price = Price(
-                                            stock_id=stock.id,
-                                            date=index,
-                                            open=float(row["Open"]),
-                                            high=float(row["High"]),
-                                            low=float(row["Low"]),
-                                            close=float(row["Close"]),
-                                            volume=int(row["Volume"]),
-                                        )
-                                        prices.append(price)
-
-                                    # 중복 키 처리를 위한 upsert 로직
-                                    for price in prices:
-                                        existing_price = (
-                                            await price_repo.get_by_stock_and_date(
-                                                stock.id, price.date
-                                            )
-                                        )
-                                        if existing_price:
-                                            # 기존 데이터 업데이트
-                                            existing_price.open = price.open
-                                            existing_price.high = price.high
-                                            existing_price.low = price.low
-                                            existing_price.close = price.close
-                                            existing_price.volume = price.volume
-                                            await price_repo.update(existing_price)
-                                        else:
-                                            # 새로운 데이터 추가
-                                            await price_repo.create(price)
-
-                                    # 전체 데이터 다시 조회
-                                    db_data = (
-                                        await price_repo.get_by_stock_and_date_range(
-                                            stock.id, start, end
-                                        )
-                                    )
-
-                            latest_date = max(price.date for price in db_data)
-                            if latest_date < end:
-                                df = fdr.DataReader(ticker, latest_date)
-                                if not df.empty:
-                                    # DB에 데이터 저장
-                                    prices = []
-                                    for index, row in df.iterrows():
-                                        price = Price(
-                                            stock_id=stock.id,
-                                            date=index,
-                                            open=float(row["Open"]),
-                                            high=float(row["High"]),
-                                            low=float(row["Low"]),
-                                            close=float(row["Close"]),
-                                            volume=int(row["Volume"]),
-                                        )
-                                        prices.append(price)
-
-                                    # 중복 키 처리를 위한 upsert 로직
-                                    for price in prices:
-                                        existing_price = (
-                                            await price_repo.get_by_stock_and_date(
-                                                stock.id, price.date
-                                            )
-                                        )
-                                        if existing_price:
-                                            # 기존 데이터 업데이트
-                                            existing_price.open = price.open
-                                            existing_price.high = price.high
-                                            existing_price.low = price.low
-                                            existing_price.close = price.close
-                                            existing_price.volume = price.volume
-                                            await price_repo.update(existing_price)
-                                        else:
-                                            # 새로운 데이터 추가
-                                            await price_repo.create(price)
-
-                                    # 전체 데이터 다시 조회
-                                    db_data = (
-                                        await price_repo.get_by_stock_and_date_range(
-                                            stock.id, start, end
-                                        )
-                                    )
-
-                        # 차트 데이터 준비
+                        # 차트 데이터 준비 (NumPy 배열을 그대로 전달)
                         # 날짜 형식 수정 (시간 정보 제거)
-                        dates = [price.date.strftime("%Y-%m-%d") for price in db_data]
-                        closes = [price.close for price in db_data]
-                        volumes = [price.volume for price in db_data]
+                        dates = frame.index.strftime("%Y-%m-%d")
 
                         # Plotly 차트 생성
                         fig = make_subplots(
@@ -330,10 +195,10 @@ async def stock_detail_page(ticker: str):
                         fig.add_trace(
                             go.Candlestick(
                                 x=dates,
-                                open=[price.open for price in db_data],
-                                high=[price.high for price in db_data],
-                                low=[price.low for price in db_data],
-                                close=closes,
+                                open=frame["Open"].to_numpy(),
+                                high=frame["High"].to_numpy(),
+                                low=frame["Low"].to_numpy(),
+                                close=frame["Close"].to_numpy(),
                                 name="주가",
                                 hoverinfo="x+y",
                             ),
@@ -345,7 +210,7 @@ async def stock_detail_page(ticker: str):
                         fig.add_trace(
                             go.Bar(
                                 x=dates,
-                                y=volumes,
+                                y=frame["Volume"].to_numpy(),
                                 name="거래량",
                                 hovertemplate="날짜: %{x}<br>거래량: %{y:,}<extra></extra>",
                             ),
@@ -5,16 +5,15 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-import FinanceDataReader as fdr
-import yfinance as yf
 from nicegui import app, ui
 from nicegui.events import ValueChangeEventArguments
 from sqlalchemy import asc, desc, select
 
-from src.db.repositories.stock import StockRepository
-from src.db.session import AsyncSessionLocal
+from src.db.repositories.stock import SEARCH_MIN_LENGTH, StockRepository
+from src.db.session import AsyncSessionLocal, read_session
 from src.models.stock import Stock
 from src.schemas.stock import StockCreate, StockUpdate
+from src.services.listing_service import ListingService
 from src.services.stock_service import StockService
 
 # 로깅 설정
@@ -22,6 +21,12 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _sort_key(stock, column: str):
+    """정렬 값이 없는(None) 행은 뒤로 보냅니다."""
+    value = getattr(stock, column, None)
+    return (value is None, value if value is not None else "")
+
+
 def create_stocks_page():
     # 국가 선택을 위한 상수
     COUNTRIES = {"KR": "한국", "US": "미국", "CA": "캐나다"}
@@ -31,6 +36,8 @@ def create_stocks_page():
     search_ticker = ""
     sort_column = "ticker"
     sort_direction = "asc"
+    # 사용자가 컬럼 정렬을 고른 적이 있는지 (없으면 검색 결과는 관련도 순)
+    sort_selected = False
 
     # 중앙 정렬을 위한 컨테이너
     with ui.column().classes("w-full items-center gap-4"):
@@ -43,71 +50,15 @@ def create_stocks_page():
             async def update_kr_stocks():
                 try:
                     ui.notify("한국 ETF 목록 업데이트를 시작합니다.", type="info")
-                    # FinanceDataReader로 주식 정보 조회
-                    stock_info = fdr.StockListing("ETF/KR")
-
-                    # KODEX와 TIGER ETF만 필터링
-                    etf_info = stock_info[
-                        stock_info["Name"].str.startswith(("KODEX", "TIGER"), na=False)
-                    ]
-
                     async with AsyncSessionLocal() as db:
-                        stock_repo = StockRepository(db)
-                        # 기존 주식 목록 가져오기
-                        existing_stocks = {
-                            stock.ticker: stock for stock in await stock_repo.get_all()
-                        }
-
-                        # 진행 상황 표시
-                        progress = ui.linear_progress().classes("w-full")
-                        progress.value = 0
-                        total_etfs = len(etf_info)
-
-                        for i, (_, row) in enumerate(etf_info.iterrows()):
-                            try:
-                                ticker = row["Symbol"]
-                                name = row["Name"]
-                                category = (
-                                    row["Category"] if "Category" in row else "N/A"
-                                )
-                                price = row["Price"] if "Price" in row else "N/A"
-                                change_rate = (
-                                    row["ChangeRate"] if "ChangeRate" in row else "N/A"
-                                )
-
-                                if ticker in existing_stocks:
-                                    # 기존 ETF 업데이트
-                                    stock = existing_stocks[ticker]
-                                    stock.name = name
-                                    stock.market = "ETF"  # ETF로 고정
-                                    await stock_repo.update(stock)
-                                    logger.info(f"Updated ETF: {ticker} - {name}")
-                                else:
-                                    # 새로운 ETF 추가
-                                    new_stock = Stock(
-                                        ticker=ticker,
-                                        name=name,
-                                        country="KR",
-                                        market="ETF",  # ETF로 고정
-                                    )
-                                    await stock_repo.create(new_stock)
-                                    logger.info(f"Added new ETF: {ticker} - {name}")
-
-                                # 진행률 업데이트
-                                progress.value = (i + 1) / total_etfs
-
-                            except Exception as e:
-                                logger.error(f"Error processing ETF {ticker}: {str(e)}")
-                                ui.notify(
-                                    f"ETF {ticker} 처리 중 오류 발생: {str(e)}",
-                                    type="negative",
-                                )
-
-                        # 진행 표시줄 제거
-                        progress.delete()
+                        # KODEX와 TIGER ETF만 기존 목록과 비교해 한 트랜잭션으로 반영
+                        summary = await ListingService(db).sync_kr_etfs()
+                        logger.info(f"KR ETF listing synced: {summary}")
 
                         ui.notify(
-                            "한국 ETF 목록이 성공적으로 업데이트되었습니다.",
+                            "한국 ETF 목록이 성공적으로 업데이트되었습니다. "
+                            f"(추가 {summary['inserted']}, 변경 {summary['updated']}, "
+                            f"비활성화 {summary['deactivated']})",
                             type="positive",
                         )
                         await refresh_stocks()
@@ -122,86 +73,15 @@ def create_stocks_page():
             async def update_ca_stocks():
                 try:
                     ui.notify("캐나다 ETF 목록 업데이트를 시작합니다.", type="info")
-
-                    # 캐나다 주요 ETF 목록
-                    ca_etf_tickers = [
-                        # 레버리지 ETF
-                        "HXU.TO",  # Horizons S&P/TSX 60 Bull Plus ETF (2x)
-                        "HXD.TO",  # Horizons S&P/TSX 60 Bear Plus ETF (-2x)
-                    ]
-
                     async with AsyncSessionLocal() as db:
-                        stock_repo = StockRepository(db)
-                        # 기존 주식 목록 가져오기
-                        existing_stocks = {
-                            stock.ticker: stock for stock in await stock_repo.get_all()
-                        }
-
-                        # 진행 상황 표시
-                        progress = ui.linear_progress().classes("w-full")
-                        progress.value = 0
-                        total_etfs = len(ca_etf_tickers)
-
-                        for i, ticker in enumerate(ca_etf_tickers):
-                            try:
-                                # 개별 ETF 정보 가져오기
-                                stock_info = yf.Ticker(ticker)
-
-                                # 타임아웃 처리를 위한 재시도 로직
-                                max_retries = 3
-                                retry_count = 0
-                                info = None
-
-                                while retry_count < max_retries and info is None:
-                                    try:
-                                        info = stock_info.info
-                                        if not info:
-                                            raise ValueError("No info available")
-                                    except Exception as e:
-                                        retry_count += 1
-                                        if retry_count == max_retries:
-                                            raise e
-                                        logger.warning(
-                                            f"Retry {retry_count} for {ticker}: {str(e)}"
-                                        )
-                                        continue
-
-                                name = info.get("longName", ticker)
-                                market = "TSX"
-
-                                if ticker in existing_stocks:
-                                    # 기존 ETF 업데이트
-                                    stock = existing_stocks[ticker]
-                                    stock.name = name
-                                    stock.market = market
-                                    await stock_repo.update(stock)
-                                    logger.info(f"Updated ETF: {ticker} - {name}")
-                                else:
-                                    # 새로운 ETF 추가
-                                    new_stock = Stock(
-                                        ticker=ticker,
-                                        name=name,
-                                        country="CA",
-                                        market=market,
-                                    )
-                                    await stock_repo.create(new_stock)
-                                    logger.info(f"Added new ETF: {ticker} - {name}")
-
-                                # 진행률 업데이트
-                                progress.value = (i + 1) / total_etfs
-
-                            except Exception as e:
-                                logger.error(f"Error processing ETF {ticker}: {str(e)}")
-                                ui.notify(
-                                    f"ETF {ticker} 처리 중 오류 발생: {str(e)}",
-                                    type="negative",
-                                )
-
-                        # 진행 표시줄 제거
-                        progress.delete()
+                        # 메타데이터를 동시에 가져와 한 트랜잭션으로 반영
+                        summary = await ListingService(db).sync_tracked("CA", "TSX")
+                        logger.info(f"CA ETF listing synced: {summary}")
 
                         ui.notify(
-                            "캐나다 ETF 목록이 성공적으로 업데이트되었습니다.",
+                            "캐나다 ETF 목록이 성공적으로 업데이트되었습니다. "
+                            f"(추가 {summary['inserted']}, 변경 {summary['updated']}, "
+                            f"실패 {summary['failed']})",
                             type="positive",
                         )
                         await refresh_stocks()
@@ -319,41 +199,32 @@ def create_stocks_page():
                 logger.info(f"Current search keyword: {search_keyword}")
                 print("--- refresh_stocks CALLED ---", flush=True)
 
-                async with AsyncSessionLocal() as db:
+                # 검색어가 있으면 trigram/초성 인덱스로 관련도 순 상위 결과만 가져오고,
+                # 없으면 전체 목록을 DB에서 정렬합니다 (가격 데이터는 읽지 않음)
+                query = search_keyword or search_ticker
+                if query and len(query.strip()) < SEARCH_MIN_LENGTH:
+                    # 한 글자 입력은 조회하지 않고 다음 입력을 기다립니다.
+                    return
+
+                async with read_session() as db:
                     stock_repo = StockRepository(db)
-                    # 모든 주식 가져오기
-                    stocks = await stock_repo.get_all()
-                    logger.info(f"Total stocks before filtering: {len(stocks)}")
-
-                    # 검색어로 필터링 (대소문자 구분 없이)
-                    if search_keyword:
-                        filtered_stocks = []
-                        for stock in stocks:
-                            if search_keyword in stock.name.lower():
-                                filtered_stocks.append(stock)
-                        stocks = filtered_stocks
-                        logger.info(f"Stocks after keyword filtering: {len(stocks)}")
-                        # 필터링 결과가 없을 경우 알림
-                        if len(stocks) == 0:
-                            ui.notify("검색 결과가 없습니다.", type="warning")
-
-                    if search_ticker:
-                        filtered_stocks = []
-                        for stock in stocks:
-                            if search_ticker in stock.ticker.lower():
-                                filtered_stocks.append(stock)
-                        stocks = filtered_stocks
-                        logger.info(f"Stocks after ticker filtering: {len(stocks)}")
-                        # 필터링 결과가 없을 경우 알림
-                        if len(stocks) == 0:
-                            ui.notify("검색 결과가 없습니다.", type="warning")
-
-                    # 정렬 적용
-                    stocks = sorted(
-                        stocks,
-                        key=lambda x: getattr(x, sort_column),
-                        reverse=(sort_direction == "desc"),
-                    )
+                    descending = sort_direction == "desc"
+                    if query:
+                        stocks = await stock_repo.search(query, ticker=search_ticker)
+                        if sort_selected:
+                            # 사용자가 고른 정렬은 상위 결과 안에서만 적용합니다.
+                            stocks.sort(
+                                key=lambda stock: _sort_key(stock, sort_column),
+                                reverse=descending,
+                            )
+                    else:
+                        stocks = await stock_repo.get_listing(
+                            sort_column=sort_column, descending=descending
+                        )
+                    logger.info(f"Stocks after filtering: {len(stocks)}")
+                    # 필터링 결과가 없을 경우 알림
+                    if (search_keyword or search_ticker) and len(stocks) == 0:
+                        ui.notify("검색 결과가 없습니다.", type="warning")
 
                     # 테이블 데이터 업데이트
                     with table:
@@ -383,9 +254,10 @@ def create_stocks_page():
 
         # 테이블 정렬 이벤트 핸들러
         def on_sort(e):
-            nonlocal sort_column, sort_direction
+            nonlocal sort_column, sort_direction, sort_selected
             sort_column = e.args["column"]
             sort_direction = e.args["direction"]
+            sort_selected = True
             asyncio.create_task(refresh_stocks())
 
         # 종목 상세 정보 팝업 표시 함수
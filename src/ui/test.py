@@ -1,15 +1,16 @@
 import logging
 
-import FinanceDataReader as fdr
 from nicegui import ui
 
+from src.services.market_data import get_market_data_provider
+
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def create_test_page():
+async def create_test_page():
     logger.info("Creating test page...")
 
     with ui.column().classes("w-full items-center gap-4"):
@@ -22,7 +23,7 @@ def create_test_page():
 
             try:
                 # FinanceDataReader로 주식 정보 조회
-                stock_info = fdr.StockListing("ETF/KR")
+                stock_info = await get_market_data_provider().get_listing("ETF/KR")
 
                 # 데이터 구조 확인을 위한 로깅
                 logger.info(f"Available columns: {stock_info.columns.tolist()}")
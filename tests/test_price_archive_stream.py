@@ -0,0 +1,119 @@
+import asyncio
+from datetime import date
+from typing import AsyncIterator, List
+
+import numpy as np
+import pandas as pd
+
+from src.db.price_archive import PriceArchive
+from src.db.repositories.price import _stitch_stream
+
+
+def _bars(stock_key: int, days: List[str], close: float) -> pd.DataFrame:
+    """stream_range 청크 형식(Date 인덱스, StockKey + OHLCV)의 봉을 만듭니다."""
+    return pd.DataFrame(
+        {
+            "StockKey": np.full(len(days), stock_key, dtype=np.int32),
+            "Open": close,
+            "High": close,
+            "Low": close,
+            "Close": close,
+            "Volume": np.full(len(days), 100, dtype=np.int64),
+        },
+        index=pd.DatetimeIndex(pd.to_datetime(days), name="Date"),
+    )
+
+
+def _archive_year(archive: PriceArchive, year: int, frames: List[pd.DataFrame]):
+    rows = pd.concat(frames)
+    archive.write_year(
+        year,
+        {
+            "stock_key": rows["StockKey"].to_numpy(np.int32),
+            "date": rows.index.to_numpy().astype("datetime64[D]"),
+            "open": rows["Open"].to_numpy(np.float64),
+            "high": rows["High"].to_numpy(np.float64),
+            "low": rows["Low"].to_numpy(np.float64),
+            "close": rows["Close"].to_numpy(np.float64),
+            "volume": rows["Volume"].to_numpy(np.int64),
+        },
+    )
+
+
+async def _chunks(frames: List[pd.DataFrame]) -> AsyncIterator[pd.DataFrame]:
+    for frame in frames:
+        yield frame
+
+
+def _export(archive, db_rows, stock_keys, chunk_size) -> List[pd.DataFrame]:
+    """DB 행을 chunk_size씩 흘려보내 stream_range처럼 보관 데이터와 합칩니다."""
+    db_chunks = [
+        db_rows.iloc[offset : offset + chunk_size]
+        for offset in range(0, len(db_rows), chunk_size)
+    ]
+
+    async def collect():
+        return [
+            chunk
+            async for chunk in _stitch_stream(
+                _chunks(db_chunks),
+                stock_keys,
+                date(2019, 1, 1),
+                date(2020, 12, 31),
+                archive,
+                chunk_size,
+            )
+        ]
+
+    return asyncio.run(collect())
+
+
+def test_export_includes_dropped_year(tmp_path):
+    archive = PriceArchive(tmp_path)
+    # 2019년 파티션은 보관 후 삭제되어 DB에는 2020년 봉만 남은 상태
+    _archive_year(
+        archive,
+        2019,
+        [
+            _bars(1, ["2019-12-27", "2019-12-30"], 10.0),
+            _bars(2, ["2019-12-30"], 20.0),
+            _bars(4, ["2019-12-30"], 40.0),
+        ],
+    )
+    db_rows = pd.concat(
+        [
+            _bars(1, ["2020-01-02", "2020-01-03"], 11.0),
+            _bars(3, ["2020-01-02"], 30.0),
+        ]
+    )
+
+    chunks = _export(archive, db_rows, [4, 3, 2, 1], chunk_size=2)
+    exported = pd.concat(chunks)
+
+    assert all(len(chunk) <= 2 for chunk in chunks)
+    assert list(zip(exported["StockKey"], exported.index.strftime("%Y-%m-%d"))) == [
+        (1, "2019-12-27"),
+        (1, "2019-12-30"),
+        (1, "2020-01-02"),
+        (1, "2020-01-03"),
+        (2, "2019-12-30"),
+        (3, "2020-01-02"),
+        (4, "2019-12-30"),
+    ]
+    assert exported["Close"].tolist() == [10.0, 10.0, 11.0, 11.0, 20.0, 30.0, 40.0]
+
+
+def test_export_prefers_db_row_over_archive(tmp_path):
+    archive = PriceArchive(tmp_path)
+    _archive_year(archive, 2019, [_bars(1, ["2019-12-27", "2019-12-30"], 10.0)])
+    # 보관 뒤 DB에 다시 저장된 봉이 있으면 DB 값이 남아야 합니다.
+    db_rows = _bars(1, ["2019-12-30", "2020-01-02"], 12.0)
+
+    exported = pd.concat(_export(archive, db_rows, [1], chunk_size=50000))
+
+    assert exported.index.strftime("%Y-%m-%d").tolist() == [
+        "2019-12-27",
+        "2019-12-30",
+        "2020-01-02",
+    ]
+    assert exported["Close"].tolist() == [10.0, 12.0, 12.0]
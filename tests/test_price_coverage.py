@@ -0,0 +1,75 @@
+from datetime import date, datetime, timedelta
+
+from src.core.config import settings
+from src.db.repositories.price_coverage import missing_ranges, split_range
+from src.models import PriceCoverage
+
+NOW = datetime(2024, 3, 15, 18, 0)
+
+
+def _coverage(start: date, end: date, fetched_at: datetime = NOW) -> PriceCoverage:
+    return PriceCoverage(start_date=start, end_date=end, fetched_at=fetched_at)
+
+
+def test_missing_ranges_without_coverage():
+    assert missing_ranges([], date(2024, 1, 1), date(2024, 1, 31), NOW) == [
+        (date(2024, 1, 1), date(2024, 1, 31))
+    ]
+
+
+def test_missing_ranges_between_coverages():
+    coverages = [
+        _coverage(date(2023, 12, 1), date(2024, 1, 10)),
+        _coverage(date(2024, 1, 15), date(2024, 1, 20)),
+    ]
+
+    assert missing_ranges(coverages, date(2024, 1, 1), date(2024, 1, 31), NOW) == [
+        (date(2024, 1, 11), date(2024, 1, 14)),
+        (date(2024, 1, 21), date(2024, 1, 31)),
+    ]
+
+
+def test_fully_covered_range_has_no_gaps():
+    coverages = [_coverage(date(2024, 1, 1), date(2024, 1, 31))]
+
+    assert missing_ranges(coverages, date(2024, 1, 5), date(2024, 1, 20), NOW) == []
+
+
+def test_provisional_last_day_is_refetched_after_ttl():
+    ttl = timedelta(minutes=settings.PRICE_PROVISIONAL_TTL_MINUTES)
+    fetched_at = datetime(2024, 3, 15, 10, 0)
+    coverages = [_coverage(date(2024, 3, 1), date(2024, 3, 15), fetched_at)]
+    start, end = date(2024, 3, 1), date(2024, 3, 15)
+
+    fresh = fetched_at + ttl / 2
+    stale = fetched_at + ttl * 2
+
+    assert missing_ranges(coverages, start, end, fresh) == []
+    assert missing_ranges(coverages, start, end, stale) == [(end, end)]
+
+
+def test_closed_day_is_not_provisional():
+    # 수집 시각 이전 날짜로 끝나는 구간은 TTL이 지나도 확정입니다.
+    coverages = [_coverage(date(2024, 3, 1), date(2024, 3, 14))]
+    later = NOW + timedelta(days=30)
+
+    assert missing_ranges(coverages, date(2024, 3, 1), date(2024, 3, 14), later) == []
+
+
+def test_split_range_skips_excluded_dates():
+    excluded = [date(2024, 1, 1), date(2024, 1, 5), date(2024, 1, 6), date(2024, 2, 1)]
+
+    assert split_range(date(2024, 1, 1), date(2024, 1, 10), excluded) == [
+        (date(2024, 1, 2), date(2024, 1, 4)),
+        (date(2024, 1, 7), date(2024, 1, 10)),
+    ]
+
+
+def test_split_range_edges():
+    day = date(2024, 1, 1)
+
+    assert split_range(day, day, [day]) == []
+    assert split_range(day, day, []) == [(day, day)]
+    assert split_range(day, date(2024, 1, 3), [date(2024, 1, 3)]) == [
+        (day, date(2024, 1, 2))
+    ]
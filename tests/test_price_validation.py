@@ -0,0 +1,139 @@
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from src.services.price_validation import (
+    DUPLICATE_DATE,
+    NEGATIVE_VOLUME,
+    NON_FINITE,
+    NON_MONOTONIC_DATE,
+    NON_POSITIVE_PRICE,
+    OHLC_INCONSISTENT,
+    RETURN_SPIKE,
+    ZERO_VOLUME,
+    compute_reasons,
+    describe_reasons,
+    validate_ohlcv,
+)
+
+
+def _frame(closes: List[float], days: List[str] = None, **overrides) -> pd.DataFrame:
+    """종가만 주면 OHLC가 같은 정상 봉을 만들고, overrides로 컬럼을 바꿉니다."""
+    days = days or list(pd.bdate_range("2024-01-01", periods=len(closes)).date)
+    frame = pd.DataFrame(
+        {
+            "Open": closes,
+            "High": closes,
+            "Low": closes,
+            "Close": closes,
+            "Volume": [1000] * len(closes),
+        },
+        index=pd.DatetimeIndex(pd.to_datetime(days), name="Date"),
+    ).astype({"Open": float, "High": float, "Low": float, "Close": float})
+    for column, values in overrides.items():
+        frame[column] = values
+    return frame
+
+
+def test_clean_frame_passes():
+    result = validate_ohlcv(_frame([100.0, 101.0, 99.5, 100.5]))
+
+    assert len(result.clean) == 4
+    assert result.rejected.empty
+
+
+def test_reason_flags():
+    frame = _frame(
+        [100.0, 100.0, 100.0, 100.0, 100.0, 100.0],
+        Open=[100.0, np.nan, -1.0, 100.0, 100.0, 100.0],
+        High=[100.0, 100.0, 100.0, 99.0, 100.0, 100.0],
+        Volume=[1000, 1000, 1000, 1000, -5, 0],
+    )
+
+    reasons = compute_reasons(
+        frame["Open"].to_numpy(),
+        frame["High"].to_numpy(),
+        frame["Low"].to_numpy(),
+        frame["Close"].to_numpy(),
+        frame["Volume"].to_numpy(dtype=float),
+        frame.index.to_numpy(),
+    )
+
+    assert reasons[0] == 0
+    assert reasons[1] & NON_FINITE
+    assert reasons[2] & NON_POSITIVE_PRICE
+    assert reasons[3] & OHLC_INCONSISTENT
+    assert reasons[4] & NEGATIVE_VOLUME
+    assert reasons[5] & ZERO_VOLUME
+
+
+def test_describe_reasons_lists_every_flag():
+    assert (
+        describe_reasons(ZERO_VOLUME | DUPLICATE_DATE) == "zero_volume,duplicate_date"
+    )
+    assert describe_reasons(0) == ""
+
+
+def test_unsorted_input_is_sorted_not_quarantined():
+    frame = _frame([100.0, 101.0, 102.0, 103.0, 104.0]).iloc[::-1]
+
+    result = validate_ohlcv(frame)
+
+    assert result.rejected.empty
+    assert result.clean.index.is_monotonic_increasing
+    assert result.clean["Close"].tolist() == [100.0, 101.0, 102.0, 103.0, 104.0]
+
+
+def test_only_repeated_dates_are_duplicates():
+    frame = _frame(
+        [100.0, 101.0, 102.0],
+        days=["2024-01-03", "2024-01-02", "2024-01-03"],
+    )
+
+    result = validate_ohlcv(frame)
+
+    # 안정 정렬이므로 같은 날짜 중 처음 행이 남습니다.
+    assert result.clean["Close"].tolist() == [101.0, 100.0]
+    assert result.rejected["Close"].tolist() == [102.0]
+    assert result.rejected["reason"].tolist() == ["duplicate_date"]
+
+
+def test_non_monotonic_dates_without_sorting():
+    days = pd.to_datetime(["2024-01-03", "2024-01-02"]).to_numpy()
+    prices = np.array([100.0, 100.0])
+
+    reasons = compute_reasons(
+        prices, prices, prices, prices, np.array([1.0, 1.0]), days
+    )
+
+    assert reasons.tolist() == [0, NON_MONOTONIC_DATE]
+
+
+def test_spike_that_reverts_is_quarantined():
+    result = validate_ohlcv(_frame([100.0, 100.0, 300.0, 100.0, 100.0]))
+
+    assert result.rejected["Close"].tolist() == [300.0]
+    assert result.rejected["reasons"].tolist() == [RETURN_SPIKE]
+
+
+def test_level_shift_is_not_a_spike():
+    result = validate_ohlcv(_frame([100.0, 100.0, 300.0, 300.0, 300.0]))
+
+    assert result.rejected.empty
+
+
+def test_panel_checks_do_not_cross_stock_boundaries():
+    # 종목 1의 마지막 봉과 종목 2의 첫 봉은 날짜와 가격이 달라도 비교하지 않습니다.
+    frame = pd.concat(
+        [
+            _frame([100.0, 100.0], days=["2024-01-02", "2024-01-03"]),
+            _frame([5.0, 5.0], days=["2024-01-02", "2024-01-03"]),
+        ]
+    )
+    keys = np.array([1, 1, 2, 2])
+
+    result = validate_ohlcv(frame, keys=keys)
+
+    assert len(result.clean) == 4
+    assert result.rejected.empty
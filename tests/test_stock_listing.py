@@ -0,0 +1,64 @@
+import asyncio
+from typing import List
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.core.config import settings
+from src.db.repositories.stock import StockRepository
+
+
+async def _capture_statements(run) -> List[str]:
+    """run(repo)을 실행하는 동안 DB로 보낸 SQL 문을 모아 반환합니다.
+
+    migration이 적용된 PostgreSQL(SQLALCHEMY_DATABASE_URI)이 필요하며, 접속할 수
+    없으면 테스트를 건너뜁니다. 쓰기는 없지만 끝나면 트랜잭션을 롤백합니다.
+    """
+    engine = create_async_engine(settings.SQLALCHEMY_DATABASE_URI, poolclass=NullPool)
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        try:
+            conn = await engine.connect()
+        except OSError as e:
+            pytest.skip(f"database unavailable: {e}")
+        async with conn:
+            async with AsyncSession(bind=conn) as session:
+                await run(StockRepository(session))
+                await session.rollback()
+    finally:
+        await engine.dispose()
+    return statements
+
+
+def _assert_no_price_sql(statements: List[str]) -> None:
+    assert statements
+    for statement in statements:
+        assert "price" not in statement.lower(), statement
+
+
+def test_get_listing_does_not_touch_price():
+    async def run(repo: StockRepository):
+        await repo.get_listing()
+        await repo.get_listing(
+            keyword="삼성", ticker="005", sort_column="last_updated", descending=True
+        )
+        await repo.get_listing(keyword="ㅅㅅ")
+
+    _assert_no_price_sql(asyncio.run(_capture_statements(run)))
+
+
+def test_search_does_not_touch_price():
+    async def run(repo: StockRepository):
+        await repo.search("삼성")
+        await repo.search("ㅅㅅ")
+        await repo.search("005930")
+        await repo.search("삼성전자", ticker="005")
+
+    _assert_no_price_sql(asyncio.run(_capture_statements(run)))
@@ -0,0 +1,92 @@
+from datetime import date
+
+import pytest
+
+from src.services.trading_calendar import (
+    KR_BUDDHA,
+    KR_CHUSEOK,
+    KR_SEOLLAL,
+    calendar_for,
+    get_calendar,
+    krx_holidays,
+    nyse_holidays,
+    tsx_holidays,
+)
+
+
+@pytest.mark.parametrize(
+    "day",
+    [
+        date(2024, 2, 9),  # 설날 연휴
+        date(2024, 2, 12),  # 설날 대체공휴일 (일요일과 겹침)
+        date(2022, 9, 12),  # 추석 대체공휴일
+        date(2019, 5, 6),  # 어린이날 대체공휴일
+        date(2021, 8, 16),  # 광복절 대체공휴일 (2021년부터)
+        date(2027, 12, 27),  # 성탄절 대체공휴일 (2023년부터)
+        date(2013, 10, 9),  # 한글날 (2013년 공휴일 재지정)
+        date(2010, 2, 15),  # 설날 (표가 덮는 과거 연도)
+        date(2005, 4, 5),  # 식목일 (2005년까지)
+        date(2024, 12, 31),  # 연말 휴장일
+    ],
+)
+def test_krx_holidays(day):
+    assert day in krx_holidays(day.year)
+    assert not calendar_for("KR", "KOSPI").is_session(day)
+
+
+@pytest.mark.parametrize(
+    "day",
+    [
+        date(2012, 10, 9),  # 한글날 (1991~2012년은 공휴일 아님)
+        date(2010, 2, 16),  # 2014년 전에는 설날 대체공휴일이 없음
+        date(2006, 4, 5),  # 식목일 (2006년부터 공휴일 아님)
+        date(2020, 8, 17),  # 2020년 광복절(토)은 대체공휴일 대상 아님
+    ],
+)
+def test_krx_sessions(day):
+    assert day not in krx_holidays(day.year)
+    assert calendar_for("KR", "KOSPI").is_session(day)
+
+
+def test_lunar_tables_cover_the_calendar_index():
+    calendar = get_calendar("KRX")
+    years = set(range(calendar.start.year, calendar.end.year + 1))
+
+    for table in (KR_SEOLLAL, KR_BUDDHA, KR_CHUSEOK):
+        assert years <= set(table)
+        assert all(day.year == year for year, day in table.items())
+
+
+@pytest.mark.parametrize(
+    "day",
+    [
+        date(2020, 7, 3),  # Independence Day (토) → 금요일
+        date(2024, 3, 29),  # Good Friday
+        date(2022, 6, 20),  # Juneteenth (일) → 월요일
+        date(2024, 11, 28),  # Thanksgiving
+        date(2023, 1, 2),  # New Year's Day (일) → 월요일
+    ],
+)
+def test_nyse_holidays(day):
+    assert day in nyse_holidays(day.year)
+    assert not calendar_for("US").is_session(day)
+
+
+def test_nyse_keeps_new_years_eve_when_new_year_is_saturday():
+    # 2022-01-01은 토요일이지만 2021-12-31은 정상 거래일입니다.
+    assert calendar_for("US").is_session(date(2021, 12, 31))
+    assert calendar_for("US").is_session(date(2021, 6, 18))  # Juneteenth 이전
+
+
+def test_tsx_observed_holidays():
+    assert date(2023, 7, 3) in tsx_holidays(2023)  # Canada Day (토) → 월요일
+    assert {date(2021, 12, 27), date(2021, 12, 28)} <= set(tsx_holidays(2021))
+
+
+def test_sessions_in_range():
+    calendar = calendar_for("KR", "KOSPI")
+
+    assert calendar.sessions_in_range(date(2024, 2, 9), date(2024, 2, 12)) == 0
+    assert calendar.sessions_in_range(date(2024, 2, 5), date(2024, 2, 16)) == 8
+    assert calendar.sessions_in_range(date(2024, 2, 16), date(2024, 2, 5)) == 0
+    assert calendar.previous_session(date(2024, 2, 13)) == date(2024, 2, 8)